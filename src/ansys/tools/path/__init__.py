@@ -24,10 +24,19 @@
 Tools to find/cache installed Ansys products.
 
 WARNING: This is not concurrent-safe (multiple python processes might race on this data.)
+
+The public names are imported lazily, on first access, so that importing the
+package (for example to run ``python -m ansys.tools.path``) stays cheap. When
+``ANSYS_TOOLS_PATH_WARM_UP`` is set, the discovery starts in the background at
+import, see :mod:`ansys.tools.path.warmup`.
 """
 
+import importlib
+from typing import TYPE_CHECKING
 import warnings
 
+from ansys.tools.path.warmup import warm_up, warm_up_requested
+
 warnings.warn(
     "This library is deprecated and will no longer be maintained. "
     "Functionality from this library has been migrated to ``ansys-tools-common``. "
@@ -35,35 +44,93 @@ warnings.warn(
     "For more information check https://github.com/ansys/ansys-tools-path/issues/341",
     DeprecationWarning,
 )
-import importlib.metadata as importlib_metadata
-
-__version__ = importlib_metadata.version(__name__.replace(".", "-"))
-from ansys.tools.common.path.path import (
-    LOG,
-    SETTINGS_DIR,
-    SUPPORTED_ANSYS_VERSIONS,
-    change_default_dyna_path,
-    change_default_mapdl_path,
-    change_default_mechanical_path,
-    clear_configuration,
-    find_dyna,
-    find_mapdl,
-    find_mechanical,
-    get_available_ansys_installations,
-    get_dyna_path,
-    get_latest_ansys_installation,
-    get_mapdl_path,
-    get_mechanical_path,
-    get_saved_application_path,
-    save_dyna_path,
-    save_mapdl_path,
-    save_mechanical_path,
-    version_from_path,
-)
-from ansys.tools.common.path.path import change_default_ansys_path  # deprecated
-from ansys.tools.common.path.path import find_ansys  # deprecated
-from ansys.tools.common.path.path import get_ansys_path  # deprecated
-from ansys.tools.common.path.path import save_ansys_path  # deprecated
+
+_COMMON_PATH = "ansys.tools.common.path.path"
+_CONFIG = "ansys.tools.path.config"
+_PATH = "ansys.tools.path.path"
+
+_LAZY_ATTRIBUTES = {
+    "LOG": _COMMON_PATH,
+    "SETTINGS_DIR": _COMMON_PATH,
+    "SUPPORTED_ANSYS_VERSIONS": _COMMON_PATH,
+    "get_available_ansys_installations": _PATH,
+    "get_latest_ansys_installation": _PATH,
+    "version_from_path": _COMMON_PATH,
+    "ConfigConflictError": _CONFIG,
+    "config_transaction": _CONFIG,
+    "change_default_dyna_path": _PATH,
+    "change_default_mapdl_path": _PATH,
+    "change_default_mechanical_path": _PATH,
+    "clear_configuration": _PATH,
+    "find_dyna": _PATH,
+    "find_dyna_variant": _PATH,
+    "find_mapdl": _PATH,
+    "find_mechanical": _PATH,
+    "find_mpi_runtime": _PATH,
+    "get_dyna_path": _PATH,
+    "get_mapdl_path": _PATH,
+    "get_mechanical_path": _PATH,
+    "get_saved_application_path": _PATH,
+    "save_dyna_path": _PATH,
+    "save_mapdl_path": _PATH,
+    "save_mechanical_path": _PATH,
+    "change_default_ansys_path": _PATH,  # deprecated
+    "find_ansys": _PATH,  # deprecated
+    "get_ansys_path": _PATH,  # deprecated
+    "save_ansys_path": _PATH,  # deprecated
+}
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ansys.tools.common.path.path import (
+        LOG,
+        SETTINGS_DIR,
+        SUPPORTED_ANSYS_VERSIONS,
+        version_from_path,
+    )
+
+    from ansys.tools.path.config import ConfigConflictError, config_transaction
+    from ansys.tools.path.path import (
+        change_default_dyna_path,
+        change_default_mapdl_path,
+        change_default_mechanical_path,
+        clear_configuration,
+        find_dyna,
+        find_dyna_variant,
+        find_mapdl,
+        find_mechanical,
+        find_mpi_runtime,
+        get_available_ansys_installations,
+        get_dyna_path,
+        get_latest_ansys_installation,
+        get_mapdl_path,
+        get_mechanical_path,
+        get_saved_application_path,
+        save_dyna_path,
+        save_mapdl_path,
+        save_mechanical_path,
+    )
+    from ansys.tools.path.path import change_default_ansys_path  # deprecated
+    from ansys.tools.path.path import find_ansys  # deprecated
+    from ansys.tools.path.path import get_ansys_path  # deprecated
+    from ansys.tools.path.path import save_ansys_path  # deprecated
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        import importlib.metadata as importlib_metadata
+
+        value = importlib_metadata.version(__name__.replace(".", "-"))
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | {"__version__"})
+
 
 __all__ = [
     "LOG",
@@ -76,6 +143,8 @@ __all__ = [
     "find_mapdl",
     "find_mechanical",
     "find_dyna",
+    "find_dyna_variant",
+    "find_mpi_runtime",
     "get_available_ansys_installations",
     "get_latest_ansys_installation",
     "get_mapdl_path",
@@ -86,8 +155,14 @@ __all__ = [
     "save_mechanical_path",
     "save_dyna_path",
     "version_from_path",
+    "config_transaction",
+    "ConfigConflictError",
     "change_default_ansys_path",
     "find_ansys",
     "get_ansys_path",
     "save_ansys_path",
+    "warm_up",
 ]
+
+if warm_up_requested():
+    warm_up()
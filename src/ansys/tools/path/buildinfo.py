@@ -0,0 +1,250 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Version information read from the files of an installation.
+
+The digits in an executable name are only a naming convention. The functions in
+this module read the build information files shipped in the installation tree
+and the strings embedded in the executable (``.comment`` and ``.rodata`` for
+ELF files, the first bytes for wrapper scripts) without running anything. All
+reads are bounded and results are cached per file fingerprint.
+"""
+
+from dataclasses import dataclass
+import os
+import re
+import threading
+from typing import Dict, Optional, Tuple
+
+from ansys.tools.common.path.path import LOG
+
+from ansys.tools.path.elf import ElfError, ElfFile, is_elf
+
+METADATA_FILES = ["builddate.txt", "package.id"]
+"""Build information files probed, relative to the installation directory."""
+
+MAX_METADATA_FILE_BYTES = 64 * 1024
+MAX_SCRIPT_BYTES = 64 * 1024
+MAX_SECTION_BYTES = 1024 * 1024
+
+_RELEASE_REGEX = re.compile(r"\b20(\d\d) ?R([1-9])\b", re.IGNORECASE)
+_DOTTED_VERSION_REGEX = re.compile(r"\b(?:version|release)\s*[:=]?\s*v?(\d\d)\.([1-9])\b", re.I)
+_SERVICE_PACK_REGEX = re.compile(r"\b(?:service\s*pack|SP)\s*[:=]?\s*0*(\d{1,2})\b", re.I)
+_BUILD_DATE_REGEX = re.compile(r"\bbuild\s*date\s*[:=]?\s*([^\r\n]+)", re.IGNORECASE)
+_BUILD_REGEX = re.compile(r"\bbuild\s*(?:number|id)?\s*[:=]\s*([\w.-]+)", re.IGNORECASE)
+_VERSION_DIR_REGEX = re.compile(r"^v(\d\d\d)$")
+_PRINTABLE_REGEX = re.compile(rb"[\x20-\x7e\t]{4,}")
+
+
+@dataclass(frozen=True)
+class VersionInfo:
+    """Version information of an installation or executable."""
+
+    version: Optional[int] = None
+    """Version number, for example ``251``."""
+    release: Optional[str] = None
+    """Release name, for example ``"2025 R1"``."""
+    service_pack: Optional[int] = None
+    """Service pack number, if any."""
+    build_date: Optional[str] = None
+    """Build date, as written in the build information."""
+    build: Optional[str] = None
+    """Build identifier, as written in the build information."""
+    source: Optional[str] = None
+    """File the version was read from."""
+
+    @property
+    def version_float(self) -> Optional[float]:
+        """Version as a float, for example ``25.1``."""
+        return None if self.version is None else self.version / 10
+
+
+_FINGERPRINT_TYPE = Tuple[int, int, int]
+_CACHE_LOCK = threading.Lock()
+_FILE_CACHE: Dict[str, Tuple[_FINGERPRINT_TYPE, Dict[str, object]]] = {}
+
+
+def _fingerprint(path: str) -> Optional[_FINGERPRINT_TYPE]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def parse_build_text(text: str) -> Dict[str, object]:
+    """Extract version information from free text.
+
+    Parameters
+    ----------
+    text : str
+        Content of a build information file or strings of an executable.
+
+    Returns
+    -------
+    Dict[str, object]
+        The :class:`VersionInfo` fields that could be found.
+    """
+    fields: Dict[str, object] = {}
+    match = _RELEASE_REGEX.search(text)
+    if match:
+        fields["version"] = int(match.group(1)) * 10 + int(match.group(2))
+        fields["release"] = f"20{match.group(1)} R{match.group(2)}"
+    else:
+        match = _DOTTED_VERSION_REGEX.search(text)
+        if match:
+            fields["version"] = int(match.group(1)) * 10 + int(match.group(2))
+            fields["release"] = f"20{match.group(1)} R{match.group(2)}"
+    match = _SERVICE_PACK_REGEX.search(text)
+    if match:
+        fields["service_pack"] = int(match.group(1))
+    match = _BUILD_DATE_REGEX.search(text)
+    if match:
+        fields["build_date"] = match.group(1).strip()
+    match = _BUILD_REGEX.search(text)
+    if match:
+        fields["build"] = match.group(1)
+    return fields
+
+
+def _read_text_file(path: str, max_bytes: int) -> str:
+    with open(path, "rb") as f:
+        return f.read(max_bytes).decode(errors="replace")
+
+
+def _read_executable_strings(path: str) -> str:
+    """Return the printable strings of an executable, with bounded reads."""
+    if not is_elf(path):
+        return _read_text_file(path, MAX_SCRIPT_BYTES)
+    try:
+        elf = ElfFile(path)
+    except ElfError as e:
+        LOG.debug(f"Unable to read {path}: {e}")
+        return ""
+    chunks = []
+    for name in (".comment", ".rodata"):
+        section = elf.section(name)
+        if section is not None:
+            data = elf.read_section(section, MAX_SECTION_BYTES)
+            chunks.extend(match.decode() for match in _PRINTABLE_REGEX.findall(data))
+    return "\n".join(chunks)
+
+
+def _probe_file(path: str, executable: bool) -> Dict[str, object]:
+    """Parse a file, using the cached result while its fingerprint is unchanged."""
+    fingerprint = _fingerprint(path)
+    if fingerprint is None:
+        return {}
+    with _CACHE_LOCK:
+        cached = _FILE_CACHE.get(path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    try:
+        if executable:
+            text = _read_executable_strings(path)
+        else:
+            text = _read_text_file(path, MAX_METADATA_FILE_BYTES)
+    except OSError as e:
+        LOG.debug(f"Unable to read {path}: {e}")
+        return {}
+    fields = parse_build_text(text)
+    if fields:
+        fields["source"] = path
+    with _CACHE_LOCK:
+        _FILE_CACHE[path] = (fingerprint, fields)
+    return fields
+
+
+def installation_root(path: str) -> Optional[str]:
+    """Return the installation directory (``.../vXXX``) containing ``path``, if any."""
+    path = os.path.abspath(path)
+    while True:
+        if _VERSION_DIR_REGEX.match(os.path.basename(path)):
+            return path
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def get_version_info(installation_path: str, executable: Optional[str] = None) -> VersionInfo:
+    """Read the version information of an installation without running it.
+
+    The build information files listed in ``METADATA_FILES`` are read first.
+    Missing fields are then looked for in the strings of ``executable``.
+
+    Parameters
+    ----------
+    installation_path : str
+        Base path of the installation, for example ``/ansys_inc/v251``.
+    executable : str, optional
+        Executable of the installation to inspect as a fallback.
+
+    Returns
+    -------
+    VersionInfo
+        Version information. Fields that could not be found are ``None``.
+
+    Examples
+    --------
+    >>> from ansys.tools.path.buildinfo import get_version_info
+    >>> get_version_info("/ansys_inc/v251")
+    VersionInfo(version=251, release='2025 R1', service_pack=3,
+                build_date='2025-06-12', build=None, source='/ansys_inc/v251/builddate.txt')
+    """
+    fields: Dict[str, object] = {}
+    probes = [(os.path.join(installation_path, name), False) for name in METADATA_FILES]
+    if executable:
+        probes.append((executable, True))
+    for path, is_executable in probes:
+        for key, value in _probe_file(path, is_executable).items():
+            fields.setdefault(key, value)
+        if all(key in fields for key in ("version", "service_pack", "build_date")):
+            break
+    return VersionInfo(**fields)
+
+
+def get_executable_version_info(executable: str) -> VersionInfo:
+    """Read the version information of an executable without running it.
+
+    Parameters
+    ----------
+    executable : str
+        Path of the executable, for example ``/ansys_inc/v251/ansys/bin/ansys251``.
+
+    Returns
+    -------
+    VersionInfo
+        Version information of the executable and of the installation it belongs to.
+    """
+    root = installation_root(executable)
+    if root is None:
+        fields = dict(_probe_file(executable, True))
+        return VersionInfo(**fields)
+    return get_version_info(root, executable)
+
+
+def clear_version_info_cache() -> None:
+    """Drop the parsed build information kept in memory."""
+    with _CACHE_LOCK:
+        _FILE_CACHE.clear()
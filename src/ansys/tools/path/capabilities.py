@@ -0,0 +1,507 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Single-pass index of the products provided by each Ansys installation.
+
+Every installation is scanned once: one listing of ``ansys/bin`` gives the
+MAPDL and LS-DYNA executables and one listing of ``aisol`` gives Mechanical.
+The LS-DYNA solver variants found in the same listings are indexed too, see
+:mod:`ansys.tools.path.variants`. The resulting :class:`CapabilityMatrix`
+answers the queries of ``find_mapdl``, ``find_dyna`` and ``find_mechanical``,
+and is kept in process until the installation roots, the ``AWP_ROOTXXX``
+variables or the scanned directories of an installation change.
+"""
+
+from dataclasses import dataclass, field
+import os
+import sys
+import threading
+from typing import Any, Dict, Hashable, List, Literal, Optional, Tuple, Union
+
+from ansys.tools.common.path import path as _common_path
+from ansys.tools.common.path.path import (
+    LOG,
+    SUPPORTED_ANSYS_VERSIONS,
+    SUPPORTED_VERSIONS_TYPE,
+)
+
+from ansys.tools.path import lease, probes
+from ansys.tools.path.buildinfo import VersionInfo, get_version_info
+from ansys.tools.path.discovery import get_available_ansys_installations
+from ansys.tools.path.mpi import MPIRuntime, get_mpi_runtimes
+from ansys.tools.path.variants import (
+    PRECISION_TYPE,
+    DynaVariant,
+    parse_dyna_variant,
+    select_dyna_variant,
+)
+
+PRODUCTS = ("mapdl", "dyna", "mechanical")
+
+
+def _executable_locations(version: int) -> Dict[str, Tuple[Tuple[str, ...], str]]:
+    """Return, per product, the directory (relative to the installation) and executable name."""
+    if os.name == "nt":  # pragma: no cover
+        return {
+            "mapdl": (("ansys", "bin", "winx64"), f"ansys{version}.exe"),
+            "dyna": (("ansys", "bin", "winx64"), f"LSDYNA{version}.exe"),
+            "mechanical": (("aisol", "bin", "winx64"), "AnsysWBU.exe"),
+        }
+    return {
+        "mapdl": (("ansys", "bin"), f"ansys{version}"),
+        "dyna": (("ansys", "bin"), f"lsdyna{version}"),
+        "mechanical": (("aisol",), ".workbench"),
+    }
+
+
+def _variant_directories() -> Tuple[Tuple[str, ...], ...]:
+    """Return the directories (relative to the installation) holding LS-DYNA solvers."""
+    if os.name == "nt":  # pragma: no cover
+        return (("ansys", "bin", "winx64"),)
+    return (("ansys", "bin"), ("ansys", "bin", "linx64"))
+
+
+def _list_directory(path: str) -> Dict[str, str]:
+    """Return the files of a directory, keyed by their name as compared on this platform.
+
+    Dangling symbolic links are left out. Only symbolic links cost an extra ``stat``.
+    """
+    return {
+        os.path.normcase(entry.name): entry.name
+        for entry in probes.scandir(path) or []
+        if not entry.is_symlink or probes.stat(os.path.join(path, entry.name)) is not None
+    }
+
+
+@dataclass(frozen=True)
+class InstallationCapabilities:
+    """Products available in one Ansys installation."""
+
+    version: int
+    """Version of the installation, for example ``251``."""
+    path: str
+    """Base path of the installation."""
+    student: bool = False
+    """Whether this is a student installation."""
+    executables: Dict[str, str] = field(default_factory=dict)
+    """Mapping of product names to the full path of their executable."""
+    dyna_variants: Tuple[DynaVariant, ...] = ()
+    """LS-DYNA solver variants, sorted by path."""
+
+    def has(self, product: str) -> bool:
+        """Whether the installation provides ``product``."""
+        return product in self.executables
+
+    @property
+    def version_info(self) -> VersionInfo:
+        """Version information read from the installation files.
+
+        This is probed lazily on first access and cached per file fingerprint.
+        """
+        return get_version_info(self.path, self.executables.get("mapdl"))
+
+    @property
+    def mpi_runtimes(self) -> Tuple[MPIRuntime, ...]:
+        """MPI runtimes bundled with the installation.
+
+        They are scanned lazily on first access and cached, see
+        :mod:`ansys.tools.path.mpi`.
+        """
+        return get_mpi_runtimes(self.path)
+
+
+def scan_installation(version: int, path: str) -> InstallationCapabilities:
+    """Find the product executables of one installation.
+
+    Parameters
+    ----------
+    version : int
+        Version of the installation. Negative values denote student versions,
+        as in ``get_available_ansys_installations``.
+    path : str
+        Base path of the installation.
+
+    Returns
+    -------
+    InstallationCapabilities
+        Products found in the installation.
+    """
+    listings: Dict[Tuple[str, ...], Dict[str, str]] = {}
+    executables: Dict[str, str] = {}
+    for product, (directory, name) in _executable_locations(abs(version)).items():
+        if directory not in listings:
+            listings[directory] = _list_directory(os.path.join(path, *directory))
+        actual_name = listings[directory].get(os.path.normcase(name))
+        if actual_name is not None:
+            executables[product] = os.path.join(path, *directory, actual_name)
+
+    variants: List[DynaVariant] = []
+    for directory in _variant_directories():
+        if directory not in listings:
+            # Only list subdirectories that the parent listing shows.
+            parent = listings.get(directory[:-1])
+            if parent is not None and os.path.normcase(directory[-1]) not in parent:
+                continue
+            listings[directory] = _list_directory(os.path.join(path, *directory))
+        for name in listings[directory].values():
+            variant = parse_dyna_variant(os.path.join(path, *directory, name))
+            if variant is not None:
+                variants.append(variant)
+    return InstallationCapabilities(
+        abs(version),
+        path,
+        version < 0,
+        executables,
+        tuple(sorted(variants, key=lambda variant: variant.path)),
+    )
+
+
+@dataclass
+class CapabilityMatrix:
+    """Products and executables available in each installation.
+
+    ``installations`` is keyed like the result of
+    ``get_available_ansys_installations``: student versions have negative keys.
+    """
+
+    installations: Dict[int, InstallationCapabilities] = field(default_factory=dict)
+
+    def products(self) -> List[str]:
+        """Return the products available in at least one installation."""
+        return [
+            product
+            for product in PRODUCTS
+            if any(inst.has(product) for inst in self.installations.values())
+        ]
+
+    def installations_with(self, product: str) -> Dict[int, InstallationCapabilities]:
+        """Return the installations providing ``product``."""
+        return {ver: inst for ver, inst in self.installations.items() if inst.has(product)}
+
+    def find(
+        self, product: str, version: Optional[Union[int, float]] = None
+    ) -> Union[Tuple[str, float], Tuple[Literal[""], Literal[""]]]:
+        """Find the executable of a product.
+
+        Parameters
+        ----------
+        product : str
+            ``"mapdl"``, ``"dyna"`` or ``"mechanical"``.
+        version : int, float, optional
+            Version to look for, either as ``XXY`` or ``XX.Y``. Negative values
+            select student versions. If ``None``, the latest installation
+            providing the product is used.
+
+        Returns
+        -------
+        Tuple[str, float]
+            Path of the executable and version as a float, or ``("", "")`` if
+            the product is not available.
+
+        Raises
+        ------
+        ValueError
+            The requested version is not installed.
+        """
+        if product not in PRODUCTS:
+            raise Exception("unexpected product")
+        if not self.installations:
+            return "", ""
+
+        if not version:
+            candidates = self.installations_with(product)
+            if not candidates:
+                return "", ""
+            version = max(candidates)
+        elif isinstance(version, float):
+            version = int(round(version * 10))
+
+        try:
+            installation = self.installations[version]
+        except KeyError as e:
+            raise ValueError(
+                f"Version {version} not found. "
+                f"Available versions are {list(self.installations.keys())}"
+            ) from e
+
+        if not installation.has(product):
+            return "", ""
+        return installation.executables[product], installation.version / 10
+
+    def find_dyna_variant(
+        self,
+        version: Optional[Union[int, float]] = None,
+        cores: int = 1,
+        nodes: int = 1,
+        precision: Optional[PRECISION_TYPE] = None,
+        mpi: Optional[str] = None,
+    ) -> Optional[DynaVariant]:
+        """Find the fastest LS-DYNA solver suitable for a job.
+
+        Parameters
+        ----------
+        version : int, float, optional
+            Version to look for, either as ``XXY`` or ``XX.Y``. Negative values
+            select student versions. If ``None``, the latest installation with a
+            suitable solver is used.
+        cores, nodes, precision, mpi
+            Requirements of the job, see
+            :func:`ansys.tools.path.variants.select_dyna_variant`.
+
+        Returns
+        -------
+        Optional[DynaVariant]
+            The selected solver, or ``None`` if no suitable solver is installed.
+
+        Raises
+        ------
+        ValueError
+            The requested version is not installed.
+        """
+        if version:
+            if isinstance(version, float):
+                version = int(round(version * 10))
+            if version not in self.installations:
+                raise ValueError(
+                    f"Version {version} not found. "
+                    f"Available versions are {list(self.installations.keys())}"
+                )
+            installations = [self.installations[version]]
+        else:
+            installations = [self.installations[ver] for ver in sorted(self.installations)[::-1]]
+
+        for installation in installations:
+            variant = select_dyna_variant(installation.dyna_variants, cores, nodes, precision, mpi)
+            if variant is not None:
+                return variant
+        return None
+
+
+def build_capability_matrix(
+    supported_versions: SUPPORTED_VERSIONS_TYPE = SUPPORTED_ANSYS_VERSIONS,
+) -> CapabilityMatrix:
+    """Scan all available installations once and record their products.
+
+    Parameters
+    ----------
+    supported_versions : SUPPORTED_VERSIONS_TYPE, optional
+        Supported Ansys versions. Defaults to ``SUPPORTED_ANSYS_VERSIONS``.
+
+    Returns
+    -------
+    CapabilityMatrix
+        Products found in each installation.
+    """
+    installations = get_available_ansys_installations(supported_versions)
+    matrix = CapabilityMatrix(
+        {ver: scan_installation(ver, path) for ver, path in installations.items()}
+    )
+    LOG.debug(
+        "Built capability matrix: "
+        + str({ver: sorted(inst.executables) for ver, inst in matrix.installations.items()})
+    )
+    return matrix
+
+
+def _root_directories() -> List[str]:
+    if os.name == "nt":  # pragma: no cover
+        return [os.path.join(os.environ.get("PROGRAMFILES", ""), "ANSYS Inc")]
+    return list(_common_path.LINUX_DEFAULT_DIRS)
+
+
+def _discovery_fingerprint(supported_versions: SUPPORTED_VERSIONS_TYPE) -> Hashable:
+    """Cheap summary of the inputs of the discovery.
+
+    It changes when an ``AWP_ROOTXXX`` variable changes, when the directory it
+    points to appears or changes, or when an entry is added to or removed from
+    one of the installation roots or their ``ANSYS Student`` directory.
+    """
+    env = []
+    for ver in sorted(supported_versions):
+        value = os.environ.get(f"AWP_ROOT{ver}")
+        result = probes.stat(value) if value else None
+        env.append((ver, value, None if result is None else result.mtime_ns))
+    roots = []
+    for root in _root_directories():
+        for directory in (root, os.path.join(root, "ANSYS Student")):
+            result = probes.stat(directory)
+            roots.append((directory, None if result is None else result.mtime_ns))
+    return tuple(env), tuple(roots)
+
+
+def _installations_fingerprint(matrix: CapabilityMatrix) -> List[list]:
+    """Modification times of the directories scanned in each installation.
+
+    It changes when an executable is added to or removed from an installation.
+    """
+    fingerprint = []
+    for ver in sorted(matrix.installations):
+        installation = matrix.installations[ver]
+        directories = [directory for directory, _ in _executable_locations(abs(ver)).values()]
+        for directory in dict.fromkeys(directories + list(_variant_directories())):
+            path = os.path.join(installation.path, *directory)
+            result = probes.stat(path)
+            fingerprint.append([path, None if result is None else result.mtime_ns])
+    return fingerprint
+
+
+def _matrix_to_data(matrix: CapabilityMatrix) -> List[list]:
+    return [
+        [ver, inst.path, inst.executables, [variant.path for variant in inst.dyna_variants]]
+        for ver, inst in matrix.installations.items()
+    ]
+
+
+def _matrix_from_data(data: List[list]) -> CapabilityMatrix:
+    return CapabilityMatrix(
+        {
+            ver: InstallationCapabilities(
+                abs(ver),
+                path,
+                ver < 0,
+                dict(executables),
+                tuple(parse_dyna_variant(variant) for variant in variants),
+            )
+            for ver, path, executables, variants in data
+        }
+    )
+
+
+def _is_executable(path: Any) -> bool:
+    return isinstance(path, str) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def _is_valid_shared_data(data: Any) -> bool:
+    """Whether data published by another process only lists existing executables."""
+    if not isinstance(data, dict) or not isinstance(data.get("directories"), list):
+        return False
+    for ver, path, executables, variants in data["installations"]:
+        if not isinstance(ver, int) or not isinstance(path, str):
+            return False
+        paths = list(executables.values()) + list(variants)
+        if not all(_is_executable(executable) for executable in paths):
+            return False
+    return True
+
+
+def _build_shared_capability_matrix(
+    supported_versions: SUPPORTED_VERSIONS_TYPE, fingerprint: Hashable, refresh: bool
+) -> Tuple[CapabilityMatrix, List[list]]:
+    """Build the matrix, through the shared cache directory if there is one.
+
+    Returns the matrix and the fingerprint of its installations.
+    """
+
+    built = []
+
+    def build() -> dict:
+        matrix = build_capability_matrix(supported_versions)
+        built.append(matrix)
+        return {
+            "installations": _matrix_to_data(matrix),
+            "directories": _installations_fingerprint(matrix),
+        }
+
+    cache_dir = lease.get_shared_cache_dir()
+    if cache_dir is None or probes.get_backend().isolated:
+        matrix = build_capability_matrix(supported_versions)
+        return matrix, _installations_fingerprint(matrix)
+
+    # The suffix changes with the format of the published data.
+    key = lease.cache_key("capabilities-3", sys.platform, sorted(supported_versions), fingerprint)
+    data = (
+        None if refresh else lease.run_once(cache_dir, key, build, validate=_is_valid_shared_data)
+    )
+    if built:
+        return built[0], data["directories"]
+    if data is not None:
+        matrix = _matrix_from_data(data["installations"])
+        installations_fingerprint = _installations_fingerprint(matrix)
+        if installations_fingerprint == data["directories"]:
+            return matrix, installations_fingerprint
+        LOG.debug("An installation changed since the shared matrix was published")
+    data = build()
+    lease.publish_result(cache_dir, key, data)
+    return built[-1], data["directories"]
+
+
+_MATRIX_LOCK = threading.Lock()
+_MATRIX_CACHE: Dict[str, Tuple[Hashable, List[list], CapabilityMatrix]] = {}
+
+
+def get_capability_matrix(
+    supported_versions: SUPPORTED_VERSIONS_TYPE = SUPPORTED_ANSYS_VERSIONS,
+    refresh: bool = False,
+) -> CapabilityMatrix:
+    """Return the capability matrix, scanning the installations only when needed.
+
+    The matrix is kept in process and revalidated against the ``AWP_ROOTXXX``
+    variables, the modification time of the installation roots and the
+    modification time of the directories scanned in each installation. When a
+    shared cache directory is set with ``ANSYS_TOOLS_PATH_SHARED_CACHE``, a
+    single process scans and the others read its result, see
+    :mod:`ansys.tools.path.lease`.
+
+    Parameters
+    ----------
+    supported_versions : SUPPORTED_VERSIONS_TYPE, optional
+        Supported Ansys versions. Defaults to ``SUPPORTED_ANSYS_VERSIONS``.
+    refresh : bool, optional
+        Scan the installations even if the cached matrix is still valid.
+
+    Returns
+    -------
+    CapabilityMatrix
+        Products found in each installation.
+
+    Examples
+    --------
+    >>> from ansys.tools.path.capabilities import get_capability_matrix
+    >>> matrix = get_capability_matrix()
+    >>> matrix.find("mapdl"), matrix.find("dyna"), matrix.find("mechanical")
+    (('/usr/ansys_inc/v251/ansys/bin/ansys251', 25.1),
+     ('/usr/ansys_inc/v251/ansys/bin/lsdyna251', 25.1),
+     ('/usr/ansys_inc/v251/aisol/.workbench', 25.1))
+    """
+    key = repr(sorted(supported_versions))
+    fingerprint = _discovery_fingerprint(supported_versions)
+    with _MATRIX_LOCK:
+        cached = _MATRIX_CACHE.get(key)
+        if (
+            not refresh
+            and cached is not None
+            and cached[0] == fingerprint
+            and cached[1] == _installations_fingerprint(cached[2])
+        ):
+            return cached[2]
+        matrix, installations_fingerprint = _build_shared_capability_matrix(
+            supported_versions, fingerprint, refresh
+        )
+        _MATRIX_CACHE[key] = (fingerprint, installations_fingerprint, matrix)
+        return matrix
+
+
+def clear_capability_matrix() -> None:
+    """Drop the capability matrices kept in memory."""
+    with _MATRIX_LOCK:
+        _MATRIX_CACHE.clear()
@@ -0,0 +1,367 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""In-process cache of the ansys-tools-path configuration file.
+
+The parsed content of ``config.txt`` is kept in memory and revalidated with a
+single ``stat`` call, so repeated lookups do not read the file again unless it
+changed on disk.
+
+Several changes can be grouped with :func:`config_transaction` so that they are
+written with a single atomic replacement of the file.
+"""
+
+from contextlib import contextmanager
+import json
+import os
+from pathlib import Path
+import tempfile
+import threading
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+from ansys.tools.common.path import path as _common_path
+
+LOG = _common_path.LOG
+
+CONFIG_FINGERPRINT_TYPE = Tuple[int, int, int]
+
+
+class _ConfigCache:
+    """Parsed configuration together with the fingerprint of the file it came from."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.path: Optional[str] = None
+        self.fingerprint: Optional[CONFIG_FINGERPRINT_TYPE] = None
+        self.data: Dict[str, str] = {}
+
+    def get(self, path: str, fingerprint: CONFIG_FINGERPRINT_TYPE) -> Optional[Dict[str, str]]:
+        if self.path == path and self.fingerprint == fingerprint:
+            return dict(self.data)
+        return None
+
+    def set(self, path: str, fingerprint: CONFIG_FINGERPRINT_TYPE, data: Dict[str, str]):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.data = dict(data)
+
+    def clear(self):
+        self.path = None
+        self.fingerprint = None
+        self.data = {}
+
+
+_CACHE = _ConfigCache()
+
+
+def get_config_file() -> Path:
+    """Return the location of the configuration file.
+
+    Returns
+    -------
+    Path
+        Full path to ``config.txt`` in ``SETTINGS_DIR``.
+    """
+    return Path(_common_path.CONFIG_FILE)
+
+
+def _config_fingerprint(path: str) -> Optional[CONFIG_FINGERPRINT_TYPE]:
+    """Return the ``(mtime_ns, size, inode)`` fingerprint of a file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file to fingerprint.
+
+    Returns
+    -------
+    Optional[Tuple[int, int, int]]
+        The fingerprint, or ``None`` if the file does not exist.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _parse_config(content: str) -> Dict[str, str]:
+    if content:
+        return json.loads(content)
+    return {}
+
+
+def _load_config_file() -> Tuple[Dict[str, str], Optional[CONFIG_FINGERPRINT_TYPE]]:
+    """Return the configuration and the fingerprint of the file it was read from."""
+    config_path = str(get_config_file())
+    with _CACHE.lock:
+        fingerprint = _config_fingerprint(config_path)
+        if fingerprint is None:
+            # Let ansys-tools-common migrate older configuration files if there are any.
+            _common_path._read_config_file()
+            fingerprint = _config_fingerprint(config_path)
+            if fingerprint is None:
+                _CACHE.clear()
+                return {}, None
+
+        data = _CACHE.get(config_path, fingerprint)
+        if data is not None:
+            return data, fingerprint
+
+        LOG.debug(f"Reading configuration file {config_path}")
+        data = _parse_config(Path(config_path).read_text())
+        _CACHE.set(config_path, fingerprint, data)
+        return dict(data), fingerprint
+
+
+@contextmanager
+def _config_file_lock() -> Iterator[None]:
+    """Hold an exclusive advisory lock next to the configuration file.
+
+    The lock only serializes writers using this module. On platforms without
+    ``fcntl`` no lock is taken.
+    """
+    if fcntl is None:  # pragma: no cover
+        yield
+        return
+    lock_path = str(get_config_file()) + ".lock"
+    with open(lock_path, "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _write_config_file_atomic(config_data: Dict[str, str]) -> None:
+    """Replace the configuration file in one step and update the cache."""
+    config_path = str(get_config_file())
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=".config.", suffix=".tmp", dir=os.path.dirname(config_path)
+    )
+    try:
+        with os.fdopen(fd, "w") as tmp_file:
+            tmp_file.write(json.dumps(config_data))
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, config_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    fingerprint = _config_fingerprint(config_path)
+    if fingerprint is None:  # pragma: no cover
+        _CACHE.clear()
+    else:
+        _CACHE.set(config_path, fingerprint, config_data)
+
+
+class ConfigConflictError(RuntimeError):
+    """Raised when the configuration file changed while a transaction was open."""
+
+
+class ConfigTransaction:
+    """Pending changes to the configuration file, written in one atomic step.
+
+    Use :func:`config_transaction` rather than creating this class directly.
+    While the transaction is open, the configuration functions of
+    ``ansys.tools.path`` called from the same thread read and write the pending
+    state instead of the file.
+    """
+
+    def __init__(self):
+        self._data, self._fingerprint = _load_config_file()
+        self._dirty = False
+
+    def read(self) -> Dict[str, str]:
+        """Return a copy of the configuration including the pending changes."""
+        return dict(self._data)
+
+    def write(self, config_data: Dict[str, str]) -> None:
+        """Replace the pending configuration."""
+        self._data = dict(config_data)
+        self._dirty = True
+
+    @property
+    def pending(self) -> bool:
+        """Whether the transaction holds changes that are not written yet."""
+        return self._dirty
+
+    def commit(self) -> None:
+        """Write the pending changes.
+
+        Raises
+        ------
+        ConfigConflictError
+            The configuration file was modified since the transaction started.
+        """
+        with _CACHE.lock, _config_file_lock():
+            current = _config_fingerprint(str(get_config_file()))
+            if current != self._fingerprint:
+                raise ConfigConflictError(
+                    f"The configuration file {get_config_file()} was modified by another "
+                    "process during the transaction. No change was written."
+                )
+            if self._dirty:
+                _write_config_file_atomic(self._data)
+                self._fingerprint = _config_fingerprint(str(get_config_file()))
+                self._dirty = False
+
+
+_LOCAL = threading.local()
+_OPEN_TRANSACTIONS = 0
+
+
+def _active_transaction() -> Optional[ConfigTransaction]:
+    return getattr(_LOCAL, "transaction", None)
+
+
+def transaction_in_progress() -> bool:
+    """Return whether a :func:`config_transaction` is open in any thread of the process.
+
+    Checked inside :func:`update_config_file`, a ``False`` answer guarantees
+    that no transaction opened meanwhile is based on the previous content of
+    the file.
+    """
+    with _CACHE.lock:
+        return _OPEN_TRANSACTIONS > 0
+
+
+@contextmanager
+def config_transaction() -> Iterator[ConfigTransaction]:
+    """Group several configuration changes into a single atomic write.
+
+    Calls to ``save_*_path``, ``change_default_*_path`` and ``clear_configuration``
+    made inside the ``with`` block are collected and written when the block exits.
+    Reads inside the block see the pending changes. If the block raises, nothing
+    is written. Nested transactions join the outermost one.
+
+    Raises
+    ------
+    ConfigConflictError
+        The configuration file was modified by another process since the
+        transaction started.
+
+    Examples
+    --------
+    >>> from ansys.tools.path import config_transaction, save_dyna_path, save_mapdl_path
+    >>> with config_transaction():
+    ...     save_mapdl_path("/ansys_inc/v251/ansys/bin/ansys251")
+    ...     save_dyna_path("/ansys_inc/v251/ansys/bin/lsdyna251")
+    """
+    outer = _active_transaction()
+    if outer is not None:
+        yield outer
+        return
+
+    global _OPEN_TRANSACTIONS
+    with _CACHE.lock:
+        _OPEN_TRANSACTIONS += 1
+    try:
+        transaction = ConfigTransaction()
+        _LOCAL.transaction = transaction
+        try:
+            yield transaction
+        finally:
+            _LOCAL.transaction = None
+        transaction.commit()
+    finally:
+        with _CACHE.lock:
+            _OPEN_TRANSACTIONS -= 1
+
+
+def read_config_file() -> Dict[str, str]:
+    """Read the configuration file, using the in-process cache when it is still valid.
+
+    The cache is revalidated with a single ``stat`` of the configuration file.
+    When the file does not exist yet, the migration of older configuration
+    files is attempted, as in ``ansys-tools-common``. Inside
+    :func:`config_transaction`, the pending configuration is returned instead.
+
+    Returns
+    -------
+    Dict[str, str]
+        Mapping of product names to executable paths. The returned dictionary is
+        a copy and can be modified freely.
+    """
+    transaction = _active_transaction()
+    if transaction is not None:
+        return transaction.read()
+    data, _ = _load_config_file()
+    return data
+
+
+def write_config_file(config_data: Dict[str, str]) -> None:
+    """Write the configuration file and update the in-process cache in place.
+
+    The file is replaced atomically. Inside :func:`config_transaction`, the
+    change is only recorded and written when the transaction commits.
+
+    Parameters
+    ----------
+    config_data : Dict[str, str]
+        Mapping of product names to executable paths.
+    """
+    transaction = _active_transaction()
+    if transaction is not None:
+        transaction.write(config_data)
+        return
+    with _CACHE.lock, _config_file_lock():
+        _write_config_file_atomic(config_data)
+
+
+def update_config_file(update: Callable[[Dict[str, str]], Optional[Dict[str, str]]]) -> None:
+    """Read, modify and write the configuration file as one step.
+
+    The file is read and written while holding the file lock, so concurrent
+    updates of different entries from several threads or processes are not
+    lost. Inside :func:`config_transaction`, the update applies to the pending
+    configuration.
+
+    Parameters
+    ----------
+    update : Callable[[Dict[str, str]], Optional[Dict[str, str]]]
+        Function receiving a copy of the current configuration and returning
+        the new one, or ``None`` to leave the file untouched.
+    """
+    transaction = _active_transaction()
+    if transaction is not None:
+        config_data = update(transaction.read())
+        if config_data is not None:
+            transaction.write(config_data)
+        return
+    with _CACHE.lock, _config_file_lock():
+        config_data = update(_load_config_file()[0])
+        if config_data is not None:
+            _write_config_file_atomic(config_data)
+
+
+def clear_config_cache() -> None:
+    """Drop the in-process copy of the configuration file."""
+    with _CACHE.lock:
+        _CACHE.clear()
@@ -0,0 +1,542 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Discovery of the Ansys installations of the local machine.
+
+This follows the rules of ``ansys-tools-common``: on Linux, the first existing
+default root is expanded and the ``AWP_ROOTXXX`` variables supplement it. The
+roots are however probed in an adaptive order. Small per-root statistics (hits,
+misses and probe latency) are kept in ``SETTINGS_DIR`` and the historically
+most productive and fastest roots are probed first. A root is only skipped
+when it cannot change the result, so the answer is the same as with the fixed
+order.
+
+Directories are identified by their ``(device, inode)``, so an installation
+reachable through several paths (symbolic links, ``AWP_ROOTXXX`` variables) is
+reported and scanned once. :func:`discover_installations` also reports the
+aliases of each installation.
+"""
+
+from dataclasses import dataclass
+import fnmatch
+import json
+import os
+from pathlib import Path
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from ansys.tools.common.path import path as _common_path
+from ansys.tools.common.path.path import (
+    LOG,
+    SUPPORTED_ANSYS_VERSIONS,
+    SUPPORTED_VERSIONS_TYPE,
+    _is_float,
+    _version_from_release_string,
+)
+
+from ansys.tools.path import probes
+
+ROOT_STATS_FILE_NAME = "root_stats.json"
+
+_LATENCY_SMOOTHING = 0.3
+
+ROOT_STATS_SAVE_INTERVAL = 60.0
+"""Minimum number of seconds between two writes of the root statistics."""
+
+
+def _stat_dir(path: str) -> Optional[probes.StatInfo]:
+    """Probe a directory. All the directory probes of the discovery go through this function.
+
+    Returns
+    -------
+    Optional[StatInfo]
+        Status of the directory, following symbolic links, or ``None`` if it is
+        not a directory.
+    """
+    result = probes.stat(path)
+    return result if result is not None and result.is_dir else None
+
+
+def _expand_base_path(base_path: Optional[str]) -> Dict[int, str]:
+    """Find the installations in a root, as ``ansys-tools-common`` does.
+
+    The root is listed once through :mod:`ansys.tools.path.probes` and the
+    ``vXXX``, ``YYYYRN`` and ``ANSYS*/vXXX`` entries are taken from that
+    listing, in listing order.
+    """
+    if base_path is None:
+        return {}
+    entries = probes.scandir(base_path) or []
+    ansys_paths: Dict[int, str] = {}
+
+    # Versions like /base_path/vXXX
+    for entry in entries:
+        if fnmatch.fnmatchcase(entry.name, "v*") and _is_float(entry.name[-3:]):
+            ansys_paths[int(entry.name[-3:])] = os.path.join(base_path, entry.name)
+
+    # Versions like /base_path/YYYYRN
+    for entry in entries:
+        if entry.is_dir:
+            ver = _version_from_release_string(entry.name)
+            if ver is not None:
+                ansys_paths[ver] = os.path.join(base_path, entry.name)
+
+    # Student versions like /base_path/ANSYS*/vXXX
+    for entry in entries:
+        if not fnmatch.fnmatchcase(entry.name, "ANSYS*"):
+            continue
+        student_dir = os.path.join(base_path, entry.name)
+        for student_entry in probes.scandir(student_dir) or []:
+            name = student_entry.name
+            if fnmatch.fnmatchcase(name, "v*") and _is_float(name[-3:]):
+                ansys_paths[-int(name[-3:])] = os.path.join(student_dir, name)
+    return ansys_paths
+
+
+class RootStatistics:
+    """Persistent hit and latency statistics of the probed roots.
+
+    Parameters
+    ----------
+    path : str, optional
+        JSON file holding the statistics. Without it, the statistics are only
+        kept in memory.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._lock = threading.Lock()
+        self._stats: Optional[Dict[str, Dict[str, float]]] = None
+        self._saved_ranking: List[str] = []
+        self._last_save: Optional[float] = None
+
+    def _load(self) -> Dict[str, Dict[str, float]]:
+        if self._stats is None and self.path is None:
+            self._stats = {}
+        if self._stats is None:
+            try:
+                with open(self.path) as f:
+                    stats = json.load(f)
+                self._stats = stats if isinstance(stats, dict) else {}
+            except (OSError, ValueError):
+                self._stats = {}
+            self._saved_ranking = self._ranking()
+        return self._stats
+
+    def _ranking(self) -> List[str]:
+        return self._order(list(self._stats))
+
+    def _order(self, roots: List[str]) -> List[str]:
+        stats = self._stats
+
+        def score(root: str) -> Tuple[float, float]:
+            entry = stats.get(root)
+            if not entry:
+                return (0.0, 0.0)
+            probes = entry["hits"] + entry["misses"]
+            return (-entry["hits"] / probes if probes else 0.0, entry["latency"])
+
+        return sorted(roots, key=score)
+
+    def record(self, root: str, hit: bool, latency: float) -> None:
+        """Record the outcome and duration of a probe of ``root``."""
+        with self._lock:
+            entry = self._load().setdefault(root, {"hits": 0, "misses": 0, "latency": latency})
+            entry["hits" if hit else "misses"] += 1
+            entry["latency"] += _LATENCY_SMOOTHING * (latency - entry["latency"])
+
+    def get(self, root: str) -> Dict[str, float]:
+        """Return the statistics of ``root``."""
+        with self._lock:
+            return dict(self._load().get(root, {}))
+
+    def order(self, roots: List[str]) -> List[str]:
+        """Return ``roots`` sorted by decreasing hit rate, then increasing latency.
+
+        Roots without statistics keep their relative order, after the roots that
+        were already hit.
+        """
+        with self._lock:
+            self._load()
+            return self._order(roots)
+
+    def save(self) -> None:
+        """Write the statistics if the ranking of the roots changed.
+
+        Writes are at most one every ``ROOT_STATS_SAVE_INTERVAL`` seconds; a
+        pending change is written by the next call after the interval. Failures
+        are only logged.
+        """
+        with self._lock:
+            if self._stats is None or self.path is None:
+                return
+            ranking = self._ranking()
+            if ranking == self._saved_ranking:
+                return
+            now = time.monotonic()
+            if self._last_save is not None and now - self._last_save < ROOT_STATS_SAVE_INTERVAL:
+                return
+            self._last_save = now
+            try:
+                directory = os.path.dirname(self.path)
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(prefix=".root_stats.", dir=directory)
+                with os.fdopen(fd, "w") as f:
+                    json.dump(self._stats, f)
+                os.replace(tmp_path, self.path)
+                self._saved_ranking = ranking
+            except OSError as e:
+                LOG.debug(f"Unable to save the root statistics to {self.path}: {e}")
+
+    def reset(self) -> None:
+        """Forget all statistics, in memory and on disk."""
+        with self._lock:
+            self._stats = {}
+            self._saved_ranking = []
+            self._last_save = None
+            try:
+                if self.path is not None:
+                    os.remove(self.path)
+            except OSError:
+                pass
+
+
+_ROOT_STATISTICS: Dict[str, RootStatistics] = {}
+_ROOT_STATISTICS_LOCK = threading.Lock()
+
+
+def get_root_statistics() -> RootStatistics:
+    """Return the root statistics stored in ``SETTINGS_DIR``.
+
+    While the probes are replayed from a trace, in-memory statistics are
+    returned instead.
+    """
+    backend = probes.get_backend()
+    if backend.isolated:
+        if backend.root_statistics is None:
+            backend.root_statistics = RootStatistics(None)
+        return backend.root_statistics
+    path = os.path.join(str(_common_path.SETTINGS_DIR), ROOT_STATS_FILE_NAME)
+    with _ROOT_STATISTICS_LOCK:
+        if path not in _ROOT_STATISTICS:
+            _ROOT_STATISTICS[path] = RootStatistics(path)
+        return _ROOT_STATISTICS[path]
+
+
+DIRECTORY_IDENTITY_TYPE = Tuple[int, int]
+
+
+class _Prober:
+    """Probes of one discovery pass.
+
+    Each path is probed at most once per pass. The ``(device, inode)`` identity
+    of the probed directories and their real paths are cached.
+    """
+
+    def __init__(self, stats: RootStatistics):
+        self.stats = stats
+        self._identities: Dict[str, Optional[DIRECTORY_IDENTITY_TYPE]] = {}
+        self._realpaths: Dict[str, str] = {}
+
+    def identity(self, path: str, record: bool = True) -> Optional[DIRECTORY_IDENTITY_TYPE]:
+        """Return the identity of a directory, or ``None`` if it does not exist.
+
+        With ``record``, the outcome and latency of the probe are added to the
+        root statistics.
+        """
+        if path in self._identities:
+            return self._identities[path]
+        start = time.perf_counter()
+        result = _stat_dir(path)
+        if record:
+            self.stats.record(path, result is not None, time.perf_counter() - start)
+        identity = None if result is None else (result.dev, result.ino)
+        self._identities[path] = identity
+        return identity
+
+    def exists(self, path: str) -> bool:
+        return self.identity(path) is not None
+
+    def realpath(self, path: str) -> str:
+        if path not in self._realpaths:
+            self._realpaths[path] = probes.realpath(path)
+        return self._realpaths[path]
+
+
+def _get_default_linux_base_path(prober: _Prober) -> Optional[str]:
+    """Return the first existing default root, in the order of ``LINUX_DEFAULT_DIRS``.
+
+    Roots are probed in the order given by the root statistics. Once a root
+    exists, only the roots placed before it in ``LINUX_DEFAULT_DIRS`` still
+    need a probe.
+    """
+    roots = list(_common_path.LINUX_DEFAULT_DIRS)
+    rank = {root: index for index, root in enumerate(roots)}
+    best: Optional[int] = None
+    for root in prober.stats.order(roots):
+        if best is not None and rank[root] > best:
+            continue
+        LOG.debug(f"Checking {root} as a potential ansys directory")
+        if prober.exists(root):
+            best = rank[root]
+    return None if best is None else roots[best]
+
+
+def _get_installed_awp_root_versions(
+    supported_versions: SUPPORTED_VERSIONS_TYPE,
+    known_versions: Dict[int, str],
+    prober: _Prober,
+    probe_known: bool = False,
+) -> List[Tuple[int, str]]:
+    """Return the existing ``AWP_ROOTXXX`` installations.
+
+    This follows ``ansys-tools-common``, including the precedence of
+    non-student installations. The directories of versions in
+    ``known_versions`` are only probed with ``probe_known``, since the default
+    scan takes precedence over them.
+    """
+    awp_roots: List[Tuple[int, str]] = []
+    awp_roots_student: List[Tuple[int, str]] = []
+    for ver in supported_versions:
+        path_str = os.environ.get(f"AWP_ROOT{ver}", "")
+        if not path_str:
+            continue
+        path = Path(path_str)
+        if "student" in path_str.lower():
+            awp_roots_student.insert(0, (-1 * ver, path_str))
+            if path.parent.name == "ANSYS Student":
+                path_non_student = str(path.parent.parent / path.name)
+                if (probe_known or ver not in known_versions) and prober.exists(path_non_student):
+                    awp_roots.append((ver, path_non_student))
+        else:
+            awp_roots.append((ver, path_str))
+    awp_roots.extend(awp_roots_student)
+
+    return [
+        (ver, path_str)
+        for ver, path_str in awp_roots
+        if path_str and (probe_known or ver not in known_versions) and prober.exists(path_str)
+    ]
+
+
+@dataclass(frozen=True)
+class Installation:
+    """One physical Ansys installation found by :func:`discover_installations`."""
+
+    version: int
+    """Version of the installation, negative for student versions."""
+
+    path: str
+    """Path of the installation, as reported by ``get_available_ansys_installations``."""
+
+    aliases: Tuple[str, ...] = ()
+    """Other paths through which the same installation is reachable."""
+
+    identity: Optional[DIRECTORY_IDENTITY_TYPE] = None
+    """``(device, inode)`` of the installation directory."""
+
+    @property
+    def realpath(self) -> str:
+        """Path of the installation with all symbolic links resolved."""
+        return os.path.realpath(self.path)
+
+
+def _discover(
+    supported_versions: SUPPORTED_VERSIONS_TYPE, include_aliases: bool
+) -> Dict[int, Installation]:
+    stats = get_root_statistics()
+    prober = _Prober(stats)
+    try:
+        base_path = _get_default_linux_base_path(prober)
+        ansys_paths = _expand_base_path(base_path)
+        non_student_paths = {ver: path for ver, path in ansys_paths.items() if ver > 0}
+        student_paths = {ver: path for ver, path in ansys_paths.items() if ver < 0}
+        # AWP_ROOT entries supplement the default scan but do not override it.
+        known_versions = {**non_student_paths, **student_paths}
+        awp_entries = _get_installed_awp_root_versions(
+            supported_versions, known_versions, prober, probe_known=include_aliases
+        )
+        for ver, path in awp_entries:
+            if ver in known_versions:
+                continue
+            if ver > 0:
+                non_student_paths[ver] = path
+            else:
+                student_paths[ver] = path
+
+        # The same physical directory is reported once, under its first path.
+        installations: Dict[int, Installation] = {}
+        first_by_identity: Dict[DIRECTORY_IDENTITY_TYPE, int] = {}
+        aliases: Dict[int, List[str]] = {}
+
+        def add_alias(ver: int, path: str) -> None:
+            if path != installations[ver].path and path not in aliases[ver]:
+                aliases[ver].append(path)
+
+        for ver, path in {**non_student_paths, **student_paths}.items():
+            identity = prober.identity(path, record=False)
+            if identity is not None and identity in first_by_identity:
+                LOG.debug(
+                    f"{path} is the same installation as "
+                    f"{installations[first_by_identity[identity]].path}"
+                )
+                add_alias(first_by_identity[identity], path)
+                continue
+            if identity is not None:
+                first_by_identity[identity] = ver
+            installations[ver] = Installation(ver, path, identity=identity)
+            aliases[ver] = []
+
+        if include_aliases:
+            for _, path in awp_entries:
+                identity = prober.identity(path)
+                if identity in first_by_identity:
+                    add_alias(first_by_identity[identity], path)
+            base_identity = prober.identity(base_path) if base_path else None
+            for root in _common_path.LINUX_DEFAULT_DIRS:
+                if base_identity is None or root == base_path:
+                    continue
+                if prober.identity(root) != base_identity:
+                    continue
+                for ver, installation in installations.items():
+                    if installation.path.startswith(base_path + os.sep):
+                        add_alias(ver, root + installation.path[len(base_path) :])
+            for ver, installation in installations.items():
+                add_alias(ver, prober.realpath(installation.path))
+    finally:
+        stats.save()
+
+    return {
+        ver: Installation(ver, inst.path, tuple(aliases[ver]), inst.identity)
+        for ver, inst in installations.items()
+    }
+
+
+def discover_installations(
+    supported_versions: SUPPORTED_VERSIONS_TYPE = SUPPORTED_ANSYS_VERSIONS,
+    include_aliases: bool = True,
+) -> Dict[int, Installation]:
+    """Find the physical Ansys installations and the paths they are reachable through.
+
+    Installations reachable through several paths, for example through a
+    symbolic link to the installation root or an ``AWP_ROOTXXX`` variable, are
+    identified by the ``(device, inode)`` of their directory and reported once.
+
+    Parameters
+    ----------
+    supported_versions : SUPPORTED_VERSIONS_TYPE, optional
+        Supported Ansys versions. Defaults to ``SUPPORTED_ANSYS_VERSIONS``.
+    include_aliases : bool, optional
+        Probe all default roots and ``AWP_ROOTXXX`` variables to collect the
+        aliases of each installation. Without it, only the duplicates found
+        while listing the installations are reported. Defaults to ``True``.
+
+    Returns
+    -------
+    Dict[int, Installation]
+        Installations keyed by version, in the order of
+        ``get_available_ansys_installations``.
+
+    Examples
+    --------
+    >>> from ansys.tools.path.discovery import discover_installations
+    >>> discover_installations()[251].aliases
+    ('/apps/ansys_inc/v251', '/ansys_inc/v251')
+    """
+    if os.name != "posix":  # pragma: no cover
+        installations = _common_path.get_available_ansys_installations(supported_versions)
+        return {ver: Installation(ver, path) for ver, path in installations.items()}
+    return _discover(supported_versions, include_aliases)
+
+
+def get_available_ansys_installations(
+    supported_versions: SUPPORTED_VERSIONS_TYPE = SUPPORTED_ANSYS_VERSIONS,
+) -> Dict[int, str]:
+    r"""Get a dictionary of available Ansys unified installation versions with their base paths.
+
+    The result follows the rules of ``ansys-tools-common``, except that an
+    installation reachable through several paths is only reported once. On
+    Linux, the default roots are probed in the order given by the root
+    statistics and the outcome and latency of every probe is recorded in
+    ``SETTINGS_DIR``.
+
+    Parameters
+    ----------
+    supported_versions : SUPPORTED_VERSIONS_TYPE, optional
+        Supported Ansys versions. Defaults to ``SUPPORTED_ANSYS_VERSIONS``.
+
+    Returns
+    -------
+    dict[int: str]
+        Installation paths keyed by version. The student versions are returned
+        at the end, with negative keys.
+
+    Examples
+    --------
+    >>> from ansys.tools.path import get_available_ansys_installations
+    >>> get_available_ansys_installations()
+    {251: '/usr/ansys_inc/v251',
+     242: '/usr/ansys_inc/v242',
+     241: '/usr/ansys_inc/v241'}
+    """
+    if os.name != "posix":  # pragma: no cover
+        return _common_path.get_available_ansys_installations(supported_versions)
+    installations = _discover(supported_versions, include_aliases=False)
+    return {ver: installation.path for ver, installation in installations.items()}
+
+
+def get_latest_ansys_installation() -> Tuple[int, str]:
+    """Return a tuple with the latest Ansys installation version and its path.
+
+    If there is a student version and a regular installation for the latest
+    release, the regular one is returned.
+
+    Returns
+    -------
+    Tuple[int, str]
+        Tuple with the latest version and path of the installation.
+
+    Raises
+    ------
+    ValueError
+        No Ansys installation found.
+    """
+    installations = get_available_ansys_installations()
+    if not installations:
+        raise ValueError("No Ansys installation found")
+
+    def sort_key(version: int) -> float:
+        if version < 0:
+            return abs(version) - 0.5
+        return float(version)
+
+    max_version = max(installations, key=sort_key)
+    return (max_version, installations[max_version])
+
+
+def clear_root_statistics_cache() -> None:
+    """Drop the root statistics kept in memory. They are read again from disk when needed."""
+    with _ROOT_STATISTICS_LOCK:
+        _ROOT_STATISTICS.clear()
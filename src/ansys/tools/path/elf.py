@@ -0,0 +1,251 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Minimal reader for ELF executables and shared libraries.
+
+Only the headers and the requested sections are read, with bounded reads, so
+that large solver executables can be inspected cheaply.
+"""
+
+from dataclasses import dataclass, field
+import struct
+from typing import BinaryIO, Dict, List, Optional
+
+ELF_MAGIC = b"\x7fELF"
+
+_ELFCLASS32 = 1
+_ELFCLASS64 = 2
+_ELFDATA2LSB = 1
+
+SHT_DYNAMIC = 6
+SHT_NOBITS = 8
+
+DT_NULL = 0
+DT_NEEDED = 1
+DT_RPATH = 15
+DT_RUNPATH = 29
+
+MAX_DYNAMIC_BYTES = 1024 * 1024
+
+
+class ElfError(ValueError):
+    """Raised when a file is not a valid ELF file."""
+
+
+@dataclass(frozen=True)
+class ElfSection:
+    """Section header of an ELF file."""
+
+    name: str
+    type: int
+    addr: int
+    offset: int
+    size: int
+    link: int
+    entsize: int
+
+
+@dataclass(frozen=True)
+class DynamicInfo:
+    """Entries of the dynamic section relevant to the dynamic loader."""
+
+    needed: List[str] = field(default_factory=list)
+    """Shared libraries required by the file (``DT_NEEDED``)."""
+    rpath: List[str] = field(default_factory=list)
+    """Library search path embedded with ``DT_RPATH``."""
+    runpath: List[str] = field(default_factory=list)
+    """Library search path embedded with ``DT_RUNPATH``."""
+
+
+def is_elf(path: str) -> bool:
+    """Check whether a file starts with the ELF magic number.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+
+    Returns
+    -------
+    bool
+        ``True`` if the file is an ELF file, ``False`` otherwise.
+    """
+    try:
+        with open(path, "rb") as f:
+            return f.read(4) == ELF_MAGIC
+    except OSError:
+        return False
+
+
+class ElfFile:
+    """Read-only view on the sections of an ELF file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the ELF file.
+
+    Raises
+    ------
+    ElfError
+        The file is not a valid ELF file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._read_header(f)
+            self._sections = self._read_section_headers(f)
+        self._by_name: Dict[str, ElfSection] = {}
+        for section in self._sections:
+            self._by_name.setdefault(section.name, section)
+
+    def _read_header(self, f: BinaryIO) -> None:
+        ident = f.read(16)
+        if len(ident) < 16 or ident[:4] != ELF_MAGIC:
+            raise ElfError(f"{self.path} is not an ELF file.")
+        elf_class, elf_data = ident[4], ident[5]
+        if elf_class not in (_ELFCLASS32, _ELFCLASS64):
+            raise ElfError(f"{self.path} has an unknown ELF class {elf_class}.")
+        self.is_64bit = elf_class == _ELFCLASS64
+        self.endian = "<" if elf_data == _ELFDATA2LSB else ">"
+
+        header_format = "HHIQQQIHHHHHH" if self.is_64bit else "HHIIIIIHHHHHH"
+        header_size = struct.calcsize(self.endian + header_format)
+        header = f.read(header_size)
+        if len(header) < header_size:
+            raise ElfError(f"{self.path} has a truncated ELF header.")
+        (
+            self.type,
+            self.machine,
+            _version,
+            _entry,
+            _phoff,
+            self._shoff,
+            _flags,
+            _ehsize,
+            _phentsize,
+            _phnum,
+            self._shentsize,
+            self._shnum,
+            self._shstrndx,
+        ) = struct.unpack(self.endian + header_format, header)
+
+    def _read_section_headers(self, f: BinaryIO) -> List[ElfSection]:
+        if not self._shoff or not self._shnum:
+            return []
+        section_format = "IIQQQQIIQQ" if self.is_64bit else "IIIIIIIIII"
+        entry_size = struct.calcsize(self.endian + section_format)
+        if self._shentsize < entry_size:
+            raise ElfError(f"{self.path} has invalid section headers.")
+        f.seek(self._shoff)
+        table = f.read(self._shentsize * self._shnum)
+        if len(table) < self._shentsize * self._shnum:
+            raise ElfError(f"{self.path} has truncated section headers.")
+
+        raw = []
+        for index in range(self._shnum):
+            start = index * self._shentsize
+            fields = struct.unpack(self.endian + section_format, table[start : start + entry_size])
+            name, sh_type, _flags, addr, offset, size, link, _info, _align, entsize = fields
+            raw.append((name, sh_type, addr, offset, size, link, entsize))
+
+        names = b""
+        if self._shstrndx < len(raw):
+            _, _, _, offset, size, _, _ = raw[self._shstrndx]
+            f.seek(offset)
+            names = f.read(size)
+
+        return [
+            ElfSection(_c_string(names, name), sh_type, addr, offset, size, link, entsize)
+            for name, sh_type, addr, offset, size, link, entsize in raw
+        ]
+
+    @property
+    def sections(self) -> List[ElfSection]:
+        """Section headers of the file."""
+        return list(self._sections)
+
+    def section(self, name: str) -> Optional[ElfSection]:
+        """Return the section called ``name``, or ``None`` if there is none."""
+        return self._by_name.get(name)
+
+    def read_section(self, section: ElfSection, max_bytes: Optional[int] = None) -> bytes:
+        """Read the content of a section.
+
+        Parameters
+        ----------
+        section : ElfSection
+            Section to read.
+        max_bytes : int, optional
+            Read at most this many bytes from the start of the section.
+
+        Returns
+        -------
+        bytes
+            Content of the section. Sections without data in the file return
+            ``b""``.
+        """
+        if section.type == SHT_NOBITS:
+            return b""
+        size = section.size if max_bytes is None else min(section.size, max_bytes)
+        with open(self.path, "rb") as f:
+            f.seek(section.offset)
+            return f.read(size)
+
+    def dynamic_info(self) -> DynamicInfo:
+        """Read the ``DT_NEEDED``, ``DT_RPATH`` and ``DT_RUNPATH`` entries.
+
+        Returns
+        -------
+        DynamicInfo
+            Entries of the dynamic section. Statically linked files have no
+            dynamic section and return empty lists.
+        """
+        dynamic = next((s for s in self._sections if s.type == SHT_DYNAMIC), None)
+        if dynamic is None or dynamic.link >= len(self._sections):
+            return DynamicInfo()
+        strings = self.read_section(self._sections[dynamic.link], MAX_DYNAMIC_BYTES)
+        data = self.read_section(dynamic, MAX_DYNAMIC_BYTES)
+
+        entry_format = self.endian + ("qQ" if self.is_64bit else "iI")
+        entry_size = struct.calcsize(entry_format)
+        info = DynamicInfo()
+        for start in range(0, len(data) - entry_size + 1, entry_size):
+            tag, value = struct.unpack(entry_format, data[start : start + entry_size])
+            if tag == DT_NULL:
+                break
+            if tag == DT_NEEDED:
+                info.needed.append(_c_string(strings, value))
+            elif tag == DT_RPATH:
+                info.rpath.extend(_c_string(strings, value).split(":"))
+            elif tag == DT_RUNPATH:
+                info.runpath.extend(_c_string(strings, value).split(":"))
+        return info
+
+
+def _c_string(data: bytes, offset: int) -> str:
+    end = data.find(b"\0", offset)
+    if end < 0:
+        end = len(data)
+    return data[offset:end].decode(errors="replace")
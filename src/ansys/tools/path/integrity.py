@@ -0,0 +1,406 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Integrity verification of Ansys installations.
+
+A partially synchronized installation on shared storage usually fails in
+obscure ways once a job runs. :func:`verify_installation` compares the files of
+an installation against a reference :class:`Manifest` of their digests.
+
+Files are hashed with chunked streaming reads on a thread pool, since
+``hashlib`` releases the GIL while hashing. The digests are stored per
+installation in ``SETTINGS_DIR``, keyed by the ``(inode, mtime, size)`` of each
+file, so later verifications only hash the files that changed.
+
+Examples
+--------
+>>> from ansys.tools.path.integrity import create_manifest, verify_installation
+>>> create_manifest(251).save("v251.manifest.json")
+>>> verify_installation(251, "v251.manifest.json").ok
+True
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from ansys.tools.common.path import path as _common_path
+from ansys.tools.common.path.path import LOG
+
+from ansys.tools.path.discovery import get_available_ansys_installations
+
+DEFAULT_ALGORITHM = "sha256"
+"""Hash algorithm of new manifests."""
+
+CHUNK_SIZE = 1024 * 1024
+"""Size of the reads when hashing a file."""
+
+DIGEST_CACHE_DIR_NAME = "integrity"
+"""Directory of the digest caches, in ``SETTINGS_DIR``."""
+
+FILE_KEY_TYPE = Tuple[int, int, int]
+
+
+def hash_file(path: str, algorithm: str = DEFAULT_ALGORITHM, chunk_size: int = CHUNK_SIZE) -> str:
+    """Return the hexadecimal digest of a file, read in chunks.
+
+    Parameters
+    ----------
+    path : str
+        File to hash.
+    algorithm : str, optional
+        Name of a ``hashlib`` algorithm. Defaults to ``"sha256"``.
+    chunk_size : int, optional
+        Size of each read. Defaults to 1 MiB.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of the content of the file.
+    """
+    digest = hashlib.new(algorithm)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            digest.update(view[:size])
+    return digest.hexdigest()
+
+
+def _file_key(stat: os.stat_result) -> FILE_KEY_TYPE:
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+@dataclass
+class Manifest:
+    """Reference digests of the files of an installation."""
+
+    files: Dict[str, str] = field(default_factory=dict)
+    """Digests keyed by the path of the file relative to the installation, with ``/`` separators."""
+    algorithm: str = DEFAULT_ALGORITHM
+    """Hash algorithm of the digests."""
+
+    def save(self, path: str) -> None:
+        """Write the manifest as JSON."""
+        with open(path, "w") as f:
+            json.dump(
+                {"algorithm": self.algorithm, "files": self.files}, f, indent=1, sort_keys=True
+            )
+
+
+def _is_safe_name(name: str) -> bool:
+    """Whether a manifest name is a relative path that stays inside the installation."""
+    if not isinstance(name, str) or "\\" in name or os.path.splitdrive(name)[0]:
+        return False
+    return all(part not in ("", ".", "..") for part in name.split("/"))
+
+
+def _check_names(names: Iterable[str], source: str) -> None:
+    """Raise a ``ValueError`` if a manifest name could leave the installation root."""
+    unsafe = [name for name in names if not _is_safe_name(name)]
+    if unsafe:
+        raise ValueError(f"{source} lists paths outside of the installation: {unsafe[:5]}")
+
+
+def load_manifest(path: str) -> Manifest:
+    """Read a manifest written by :meth:`Manifest.save`.
+
+    Raises
+    ------
+    ValueError
+        The file is not a manifest, or lists paths outside of the installation,
+        such as absolute paths or paths with ``..`` components.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or not isinstance(data.get("files"), dict):
+        raise ValueError(f"{path} is not an installation manifest.")
+    _check_names(data["files"], path)
+    return Manifest(dict(data["files"]), data.get("algorithm", DEFAULT_ALGORITHM))
+
+
+class DigestCache:
+    """Digests of the files of one installation, keyed by ``(inode, mtime, size)``.
+
+    The cache is loaded lazily and written only if it changed. ``path`` can be
+    ``None`` to keep the digests in memory only.
+    """
+
+    def __init__(self, path: Optional[str], algorithm: str = DEFAULT_ALGORITHM):
+        self.path = path
+        self.algorithm = algorithm
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, list]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, list]:
+        if self._entries is None and self.path is not None:
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+                if isinstance(data, dict) and data.get("algorithm") == self.algorithm:
+                    self._entries = data.get("files", {})
+            except (OSError, ValueError):
+                pass
+        if self._entries is None:
+            self._entries = {}
+        return self._entries
+
+    def get(self, name: str, key: FILE_KEY_TYPE) -> Optional[str]:
+        """Return the digest of ``name`` if it was computed for the same ``key``."""
+        with self._lock:
+            entry = self._load().get(name)
+        if entry is not None and tuple(entry[:3]) == key:
+            return entry[3]
+        return None
+
+    def set(self, name: str, key: FILE_KEY_TYPE, digest: str) -> None:
+        """Record the digest of ``name``."""
+        with self._lock:
+            self._load()[name] = [*key, digest]
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if it changed. Failures are only logged."""
+        with self._lock:
+            if not self._dirty or self.path is None:
+                return
+            try:
+                directory = os.path.dirname(self.path)
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(prefix=".digests.", dir=directory)
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"algorithm": self.algorithm, "files": self._entries}, f)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                LOG.debug(f"Unable to save the digest cache to {self.path}: {e}")
+
+
+def get_digest_cache(installation_path: str, algorithm: str = DEFAULT_ALGORITHM) -> DigestCache:
+    """Return the digest cache of an installation, stored in ``SETTINGS_DIR``."""
+    name = hashlib.sha1(os.path.realpath(installation_path).encode()).hexdigest()[:16]
+    path = os.path.join(
+        str(_common_path.SETTINGS_DIR), DIGEST_CACHE_DIR_NAME, f"{name}.{algorithm}.json"
+    )
+    return DigestCache(path, algorithm)
+
+
+@dataclass
+class IntegrityReport:
+    """Outcome of :func:`verify_installation`."""
+
+    path: str
+    """Base path of the installation."""
+    verified: List[str] = field(default_factory=list)
+    """Files matching the manifest."""
+    missing: List[str] = field(default_factory=list)
+    """Files of the manifest that do not exist."""
+    modified: List[str] = field(default_factory=list)
+    """Files whose digest differs from the manifest."""
+    unexpected: List[str] = field(default_factory=list)
+    """Files that are not in the manifest, if they were looked for."""
+    errors: Dict[str, str] = field(default_factory=dict)
+    """Files that could not be read, with the error."""
+    hashed: int = 0
+    """Number of files hashed during the verification."""
+    cached: int = 0
+    """Number of digests taken from the cache."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the installation matches the manifest."""
+        return not (self.missing or self.modified or self.unexpected or self.errors)
+
+
+def _installation_path(installation: Union[int, str]) -> str:
+    if isinstance(installation, str):
+        return installation
+    installations = get_available_ansys_installations()
+    if installation not in installations:
+        raise ValueError(
+            f"Version {installation} not found. "
+            f"Available versions are {list(installations.keys())}"
+        )
+    return installations[installation]
+
+
+def _list_files(root: str) -> List[str]:
+    """Return the files below ``root``, relative to it and with ``/`` separators."""
+    names = []
+    for directory, _, files in os.walk(root):
+        relative = os.path.relpath(directory, root)
+        for file in files:
+            name = file if relative == "." else os.path.join(relative, file)
+            names.append(name.replace(os.sep, "/"))
+    return sorted(names)
+
+
+def _compute_digests(
+    root: str,
+    names: List[str],
+    algorithm: str,
+    workers: Optional[int],
+    cache: DigestCache,
+    report: IntegrityReport,
+) -> Dict[str, str]:
+    """Return the digests of ``names``, hashing only the files missing from ``cache``."""
+    digests: Dict[str, str] = {}
+    pending: List[Tuple[str, str, FILE_KEY_TYPE]] = []
+    for name in names:
+        path = os.path.join(root, *name.split("/"))
+        try:
+            key = _file_key(os.stat(path))
+        except FileNotFoundError:
+            report.missing.append(name)
+            continue
+        except OSError as e:
+            report.errors[name] = str(e)
+            continue
+        digest = cache.get(name, key)
+        if digest is None:
+            pending.append((name, path, key))
+        else:
+            digests[name] = digest
+            report.cached += 1
+
+    def hash_pending(
+        item: Tuple[str, str, FILE_KEY_TYPE],
+    ) -> Tuple[str, FILE_KEY_TYPE, Union[str, OSError]]:
+        name, path, key = item
+        try:
+            return name, key, hash_file(path, algorithm)
+        except OSError as e:
+            return name, key, e
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for name, key, digest in executor.map(hash_pending, pending):
+                if isinstance(digest, OSError):
+                    report.errors[name] = str(digest)
+                    continue
+                digests[name] = digest
+                cache.set(name, key, digest)
+                report.hashed += 1
+        cache.save()
+    return digests
+
+
+def create_manifest(
+    installation: Union[int, str],
+    algorithm: str = DEFAULT_ALGORITHM,
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+) -> Manifest:
+    """Record the digests of all files of an installation.
+
+    Parameters
+    ----------
+    installation : Union[int, str]
+        Version of the installation, as returned by
+        ``get_available_ansys_installations``, or its base path.
+    algorithm : str, optional
+        Name of a ``hashlib`` algorithm. Defaults to ``"sha256"``.
+    workers : int, optional
+        Number of hashing threads. Defaults to the ``ThreadPoolExecutor`` default.
+    use_cache : bool, optional
+        Reuse and update the digests cached in ``SETTINGS_DIR``.
+
+    Returns
+    -------
+    Manifest
+        Digests of the readable files of the installation.
+    """
+    root = _installation_path(installation)
+    cache = get_digest_cache(root, algorithm) if use_cache else DigestCache(None, algorithm)
+    report = IntegrityReport(root)
+    digests = _compute_digests(root, _list_files(root), algorithm, workers, cache, report)
+    for name, error in report.errors.items():
+        LOG.debug(f"{name} left out of the manifest: {error}")
+    return Manifest(digests, algorithm)
+
+
+def verify_installation(
+    installation: Union[int, str],
+    manifest: Union[Manifest, str],
+    workers: Optional[int] = None,
+    check_unexpected: bool = False,
+    use_cache: bool = True,
+) -> IntegrityReport:
+    """Compare the files of an installation with a reference manifest.
+
+    Only the files whose ``(inode, mtime, size)`` changed since their digest
+    was cached are hashed again.
+
+    Parameters
+    ----------
+    installation : Union[int, str]
+        Version of the installation, as returned by
+        ``get_available_ansys_installations``, or its base path.
+    manifest : Union[Manifest, str]
+        Reference manifest, or the path of a manifest file.
+    workers : int, optional
+        Number of hashing threads. Defaults to the ``ThreadPoolExecutor`` default.
+    check_unexpected : bool, optional
+        Also walk the installation to report the files missing from the
+        manifest. This lists the whole tree.
+    use_cache : bool, optional
+        Reuse and update the digests cached in ``SETTINGS_DIR``.
+
+    Returns
+    -------
+    IntegrityReport
+        Differences between the installation and the manifest.
+
+    Raises
+    ------
+    ValueError
+        The version is not installed, or the manifest is invalid or lists
+        paths outside of the installation.
+    """
+    if isinstance(manifest, str):
+        manifest = load_manifest(manifest)
+    _check_names(manifest.files, "The manifest")
+    root = _installation_path(installation)
+    algorithm = manifest.algorithm
+    cache = get_digest_cache(root, algorithm) if use_cache else DigestCache(None, algorithm)
+    report = IntegrityReport(root)
+    names = sorted(manifest.files)
+    digests = _compute_digests(root, names, algorithm, workers, cache, report)
+    for name in names:
+        if name in digests:
+            if digests[name] == manifest.files[name]:
+                report.verified.append(name)
+            else:
+                report.modified.append(name)
+    if check_unexpected:
+        report.unexpected = [name for name in _list_files(root) if name not in manifest.files]
+    return report
@@ -0,0 +1,320 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Cross-process coordination of identical scans through a shared cache directory.
+
+When thousands of tasks of a job array start at once, they all scan the same
+installation roots on the same shared filesystem. With a shared cache directory
+(:data:`SHARED_CACHE_ENV`), the first process to create the lease file of a
+scan does it and publishes the result next to the lease. The other processes
+wait with jittered exponential backoff and read the published result.
+
+A lease records its owner and an expiry time. Expired leases, and leases of
+dead processes on the same host, are broken, so a crashed scanner only delays
+the others. After :data:`WAIT_TIMEOUT` seconds a waiting process gives up and
+scans by itself.
+
+The cache directory is created readable by its owner only. A directory owned
+by another user, or writable by other users, is not used.
+"""
+
+import hashlib
+import json
+import os
+import random
+import socket
+import stat
+import tempfile
+import time
+from typing import Any, Callable, Optional
+
+from ansys.tools.common.path.path import LOG
+
+SHARED_CACHE_ENV = "ANSYS_TOOLS_PATH_SHARED_CACHE"
+"""Environment variable giving the shared cache directory. Coordination is off when it is unset."""
+
+LEASE_TTL = 60.0
+"""Lifetime of a lease, in seconds. A scan taking longer lets another process start one."""
+
+RESULT_TTL = 600.0
+"""Lifetime of a published result, in seconds."""
+
+WAIT_TIMEOUT = 120.0
+"""Maximum time spent waiting for another process, in seconds."""
+
+INITIAL_BACKOFF = 0.02
+MAX_BACKOFF = 1.0
+
+
+def get_shared_cache_dir() -> Optional[str]:
+    """Return the shared cache directory, or ``None`` if coordination is off."""
+    return os.environ.get(SHARED_CACHE_ENV) or None
+
+
+def prepare_cache_dir(cache_dir: str) -> bool:
+    """Create the cache directory if needed and return whether it can be trusted.
+
+    The directory is created with mode ``0o700``. An existing directory must be
+    owned by the current user and must not be writable by other users.
+    """
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        info = os.stat(cache_dir)
+    except OSError as e:
+        LOG.debug(f"Shared cache directory {cache_dir} is not usable: {e}")
+        return False
+    if hasattr(os, "getuid") and info.st_uid != os.getuid():
+        LOG.debug(f"Shared cache directory {cache_dir} belongs to another user")
+        return False
+    if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        LOG.debug(f"Shared cache directory {cache_dir} is writable by other users")
+        return False
+    return True
+
+
+def cache_key(*parts: Any) -> str:
+    """Return a file name safe key for the given parts."""
+    return hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+class Lease:
+    """Exclusive right to run one scan, materialized by a file created with ``O_EXCL``.
+
+    Parameters
+    ----------
+    path : str
+        Path of the lease file.
+    ttl : float, optional
+        Lifetime of the lease, in seconds. Defaults to :data:`LEASE_TTL`.
+    """
+
+    def __init__(self, path: str, ttl: float = LEASE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.held = False
+
+    def acquire(self) -> bool:
+        """Try to take the lease, without waiting."""
+        try:
+            fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {
+                    "host": socket.gethostname(),
+                    "pid": os.getpid(),
+                    "expires": time.time() + self.ttl,
+                },
+                f,
+            )
+        self.held = True
+        return True
+
+    def release(self) -> None:
+        """Give the lease back."""
+        if self.held:
+            self.held = False
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def _stale_content(self) -> Optional[bytes]:
+        """Return the content of the current lease if it is stale, else ``None``."""
+        try:
+            with open(self.path, "rb") as f:
+                content = f.read()
+        except OSError:
+            return None
+        try:
+            owner = json.loads(content)
+        except ValueError:
+            # Being written right now, or corrupt: rely on the file age.
+            try:
+                expired = time.time() - os.stat(self.path).st_mtime > self.ttl
+            except OSError:
+                return None
+            return content if expired else None
+        if not isinstance(owner, dict) or time.time() > owner.get("expires", 0):
+            return content
+        if owner.get("host") == socket.gethostname() and not _pid_alive(owner.get("pid", 0)):
+            return content
+        return None
+
+    def is_stale(self) -> bool:
+        """Whether the current lease expired or belongs to a dead process of this host."""
+        return self._stale_content() is not None
+
+    def break_stale(self) -> bool:
+        """Remove the lease if it is stale. Return whether it was removed.
+
+        The lease is renamed before being removed. If the renamed file is not
+        the stale lease that was checked, because another process replaced it
+        in between, it is put back.
+        """
+        content = self._stale_content()
+        if content is None:
+            return False
+        LOG.debug(f"Breaking stale lease {self.path}")
+        # Renaming is atomic: only one of the processes breaking the lease succeeds.
+        tombstone = f"{self.path}.{os.getpid()}.stale"
+        try:
+            os.rename(self.path, tombstone)
+        except OSError:
+            return False
+        try:
+            with open(tombstone, "rb") as f:
+                broken = f.read()
+        except OSError:
+            broken = None
+        if broken != content:
+            LOG.debug(f"Lease {self.path} was taken again meanwhile, restoring it")
+            try:
+                # Unlike a rename, a link never replaces a lease created since.
+                os.link(tombstone, self.path)
+            except OSError as e:
+                LOG.debug(f"Unable to restore the lease {self.path}: {e}")
+        try:
+            os.remove(tombstone)
+        except OSError:
+            pass
+        return broken == content
+
+
+def read_result(
+    cache_dir: str,
+    key: str,
+    ttl: float = RESULT_TTL,
+    validate: Optional[Callable[[Any], bool]] = None,
+) -> Optional[Any]:
+    """Return the result published for ``key`` if it is younger than ``ttl``, else ``None``.
+
+    With ``validate``, a result for which it returns ``False`` or raises is
+    ignored too.
+    """
+    try:
+        with open(os.path.join(cache_dir, f"{key}.json")) as f:
+            published = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(published, dict):
+        return None
+    if published.get("key") != key or time.time() - published.get("created", 0) > ttl:
+        return None
+    data = published.get("data")
+    if data is not None and validate is not None:
+        try:
+            valid = validate(data)
+        except Exception:
+            valid = False
+        if not valid:
+            LOG.debug(f"Ignoring the invalid result published for {key} in {cache_dir}")
+            return None
+    return data
+
+
+def publish_result(cache_dir: str, key: str, data: Any) -> None:
+    """Publish a result atomically. Failures are only logged."""
+    if not prepare_cache_dir(cache_dir):
+        return
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{key}.", dir=cache_dir)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"key": key, "created": time.time(), "data": data}, f)
+        os.replace(tmp_path, os.path.join(cache_dir, f"{key}.json"))
+    except OSError as e:
+        LOG.debug(f"Unable to publish {key} to {cache_dir}: {e}")
+
+
+def run_once(
+    cache_dir: str,
+    key: str,
+    compute: Callable[[], Any],
+    wait_timeout: float = WAIT_TIMEOUT,
+    lease_ttl: float = LEASE_TTL,
+    result_ttl: float = RESULT_TTL,
+    validate: Optional[Callable[[Any], bool]] = None,
+) -> Any:
+    """Return the result of ``compute`` for ``key``, computed by a single process.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Shared cache directory.
+    key : str
+        Key of the computation, see :func:`cache_key`.
+    compute : Callable[[], Any]
+        Function computing a JSON serializable result.
+    wait_timeout : float, optional
+        Maximum time spent waiting for another process before computing the
+        result locally.
+    lease_ttl : float, optional
+        Lifetime of the lease taken by this process.
+    result_ttl : float, optional
+        Maximum age of a published result.
+    validate : Callable[[Any], bool], optional
+        Check of a result published by another process, see :func:`read_result`.
+
+    Returns
+    -------
+    Any
+        The result, either published by another process or computed here.
+    """
+    if not prepare_cache_dir(cache_dir):
+        return compute()
+
+    lease = Lease(os.path.join(cache_dir, f"{key}.lease"), lease_ttl)
+    deadline = time.monotonic() + wait_timeout
+    backoff = INITIAL_BACKOFF
+    while True:
+        data = read_result(cache_dir, key, result_ttl, validate)
+        if data is not None:
+            return data
+        if lease.acquire():
+            try:
+                # Another process may have published just before the lease was released.
+                data = read_result(cache_dir, key, result_ttl, validate)
+                if data is None:
+                    data = compute()
+                    publish_result(cache_dir, key, data)
+                return data
+            finally:
+                lease.release()
+        if lease.break_stale():
+            continue
+        if time.monotonic() > deadline:
+            LOG.debug(f"Gave up waiting for {lease.path}, computing {key} locally")
+            return compute()
+        time.sleep(backoff * random.uniform(0.5, 1.5))
+        backoff = min(backoff * 2, MAX_BACKOFF)
@@ -0,0 +1,318 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Discovery of Ansys installations published as environment modules.
+
+On HPC systems Ansys releases are usually exposed as Tcl or Lua (Lmod)
+modulefiles. The modulefile trees listed in ``MODULEPATH`` are parsed for
+``AWP_ROOTXXX`` settings and for the ``ansys/bin`` and ``aisol`` paths of an
+installation prefix (``.../vXXX/ansys/bin``). Only the versions of
+``SUPPORTED_ANSYS_VERSIONS`` are kept. Parsed modulefiles are cached by
+modification time, so later lookups only ``stat`` the files.
+"""
+
+import os
+import re
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ansys.tools.common.path.path import LOG, SUPPORTED_ANSYS_VERSIONS
+
+MODULEFILE_FINGERPRINT_TYPE = Tuple[int, int]
+
+_AWP_ROOT_REGEX = re.compile(r"^AWP_ROOT(\d\d\d)$")
+_VERSION_DIR_REGEX = re.compile(r"^v(\d\d\d)$")
+
+_TCL_COMMAND_REGEX = re.compile(
+    r"^\s*(setenv|set|prepend-path|append-path)\s+(?:--?\S+\s+)*(\S+)\s+(.+?)\s*(?:;.*)?$"
+)
+_TCL_VARIABLE_REGEX = re.compile(r"\$(?:env\((\w+)\)|\{(\w+)\}|(\w+))")
+
+_LUA_LOCAL_REGEX = re.compile(r"^\s*local\s+(\w+)\s*=\s*(.+?)\s*$")
+_LUA_COMMAND_REGEX = re.compile(
+    r"^\s*(setenv|pushenv|prepend_path|append_path)\s*\(\s*([\"'])(\w+)\2\s*,\s*(.+?)\s*\)\s*$"
+)
+_LUA_PATH_JOIN_REGEX = re.compile(r"^pathJoin\s*\((.*)\)$")
+
+_CACHE_LOCK = threading.Lock()
+_MODULEFILE_CACHE: Dict[str, Tuple[MODULEFILE_FINGERPRINT_TYPE, Dict[int, str]]] = {}
+
+
+def _split_arguments(arguments: str) -> List[str]:
+    """Split comma separated Lua arguments, ignoring commas inside strings."""
+    parts, current, quote = [], "", None
+    for char in arguments:
+        if quote:
+            current += char
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+            current += char
+        elif char == ",":
+            parts.append(current.strip())
+            current = ""
+        else:
+            current += char
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+def _eval_lua(expression: str, variables: Dict[str, str]) -> Optional[str]:
+    """Evaluate the string expressions found in modulefiles.
+
+    Supports string literals, local variables, ``os.getenv``, ``pathJoin`` and
+    the ``..`` concatenation operator. Returns ``None`` for anything else.
+    """
+    expression = expression.strip()
+    match = _LUA_PATH_JOIN_REGEX.match(expression)
+    if match:
+        parts = [_eval_lua(part, variables) for part in _split_arguments(match.group(1))]
+        if None in parts:
+            return None
+        return "/".join(part.rstrip("/") for part in parts)
+    if ".." in expression:
+        parts = [_eval_lua(part, variables) for part in expression.split("..")]
+        if None in parts:
+            return None
+        return "".join(parts)
+    if len(expression) >= 2 and expression[0] == expression[-1] and expression[0] in "\"'":
+        return expression[1:-1]
+    match = re.match(r"^os\.getenv\s*\(\s*([\"'])(\w+)\1\s*\)$", expression)
+    if match:
+        return variables.get(match.group(2))
+    return variables.get(expression)
+
+
+def _eval_tcl(value: str, variables: Dict[str, str]) -> Optional[str]:
+    """Strip Tcl quoting from a value and substitute ``$var`` and ``$env(VAR)``."""
+    value = value.strip()
+    if len(value) >= 2 and (value[0], value[-1]) in (("{", "}"), ('"', '"')):
+        value = value[1:-1]
+    unresolved = False
+
+    def substitute(match: re.Match) -> str:
+        nonlocal unresolved
+        name = match.group(1) or match.group(2) or match.group(3)
+        if name not in variables:
+            unresolved = True
+            return ""
+        return variables[name]
+
+    value = _TCL_VARIABLE_REGEX.sub(substitute, value)
+    return None if unresolved else value
+
+
+def _parse_modulefile_lines(lines: List[str]) -> List[Tuple[str, str]]:
+    """Return the ``(variable, value)`` pairs a modulefile sets or extends."""
+    is_lua = not (lines and lines[0].startswith("#%Module"))
+    variables: Dict[str, str] = {}
+    settings: List[Tuple[str, str]] = []
+    for line in lines:
+        if is_lua:
+            match = _LUA_LOCAL_REGEX.match(line)
+            if match:
+                value = _eval_lua(match.group(2), variables)
+                if value is not None:
+                    variables[match.group(1)] = value
+                continue
+            match = _LUA_COMMAND_REGEX.match(line)
+            if match:
+                command, name, expression = match.group(1), match.group(3), match.group(4)
+                # prepend_path("PATH", value, ":") has an optional delimiter argument
+                value = _eval_lua(_split_arguments(expression)[0], variables)
+            else:
+                continue
+        else:
+            match = _TCL_COMMAND_REGEX.match(line)
+            if not match:
+                continue
+            command, name = match.group(1), match.group(2)
+            value = _eval_tcl(match.group(3), variables)
+            if command == "set":
+                if value is not None:
+                    variables[name] = value
+                continue
+        if value is None:
+            continue
+        if command in ("setenv", "pushenv"):
+            variables[name] = value
+        settings.append((name, value))
+    return settings
+
+
+def _is_product_path(parts: List[str]) -> bool:
+    """Whether the path components below an installation prefix are product directories."""
+    return parts[:2] == ["ansys", "bin"] or "aisol" in parts
+
+
+def _installation_from_setting(name: str, value: str) -> Optional[Tuple[int, str]]:
+    """Return the ``(version, installation path)`` a modulefile setting points to.
+
+    Only ``AWP_ROOTXXX`` settings and paths to the ``ansys/bin`` or ``aisol``
+    directories of a supported version are considered.
+    """
+    awp_match = _AWP_ROOT_REGEX.match(name)
+    for path in value.split(os.pathsep):
+        if not path:
+            continue
+        path = os.path.normpath(path)
+        if awp_match:
+            version = int(awp_match.group(1))
+            prefix = path
+        else:
+            parts = path.split(os.sep)
+            indices = [
+                i
+                for i, part in enumerate(parts)
+                if _VERSION_DIR_REGEX.match(part) and _is_product_path(parts[i + 1 :])
+            ]
+            if not indices:
+                continue
+            index = indices[-1]
+            version = int(parts[index][1:])
+            prefix = os.sep.join(parts[: index + 1]) or os.sep
+        if version not in SUPPORTED_ANSYS_VERSIONS:
+            continue
+        if "student" in prefix.lower():
+            version = -version
+        return version, prefix
+    return None
+
+
+def parse_modulefile(path: str) -> Dict[int, str]:
+    """Extract the Ansys installations referenced by one modulefile.
+
+    Parameters
+    ----------
+    path : str
+        Path of a Tcl or Lua modulefile.
+
+    Returns
+    -------
+    Dict[int, str]
+        Mapping of versions to installation paths. Student versions have a
+        negative key, as in ``get_available_ansys_installations``.
+    """
+    try:
+        with open(path, errors="replace") as modulefile:
+            lines = modulefile.read().splitlines()
+    except OSError as e:
+        LOG.debug(f"Unable to read modulefile {path}: {e}")
+        return {}
+
+    installations: Dict[int, str] = {}
+    for name, value in _parse_modulefile_lines(lines):
+        installation = _installation_from_setting(name, value)
+        if installation is None:
+            continue
+        version, prefix = installation
+        # AWP_ROOT is the authoritative setting, other paths only supplement it.
+        if _AWP_ROOT_REGEX.match(name) or version not in installations:
+            installations[version] = prefix
+    return installations
+
+
+def _iter_modulefiles(directory: str) -> Iterator[os.DirEntry]:
+    """Yield the modulefiles below ``directory``, skipping hidden files."""
+    try:
+        entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        if entry.is_dir():
+            yield from _iter_modulefiles(entry.path)
+        elif entry.is_file():
+            yield entry
+
+
+def _parse_modulefile_cached(entry: os.DirEntry) -> Dict[int, str]:
+    try:
+        stat = entry.stat()
+    except OSError:
+        return {}
+    fingerprint = (stat.st_mtime_ns, stat.st_size)
+    with _CACHE_LOCK:
+        cached = _MODULEFILE_CACHE.get(entry.path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    installations = parse_modulefile(entry.path)
+    with _CACHE_LOCK:
+        _MODULEFILE_CACHE[entry.path] = (fingerprint, installations)
+    return installations
+
+
+def get_modulefile_installations(
+    modulepath: Optional[str] = None, verify: bool = True
+) -> Dict[int, str]:
+    r"""Get the Ansys installations published as environment modules.
+
+    Parameters
+    ----------
+    modulepath : str, optional
+        Directories holding modulefile trees, separated by ``os.pathsep``.
+        Defaults to the ``MODULEPATH`` environment variable.
+    verify : bool, optional
+        Only keep the installations whose directory exists. The default is
+        ``True``.
+
+    Returns
+    -------
+    Dict[int, str]
+        Mapping of versions to installation paths, in the same shape as
+        ``get_available_ansys_installations``. When several modulefiles publish
+        the same version, the first one in ``MODULEPATH`` order is used.
+
+    Examples
+    --------
+    >>> from ansys.tools.path.modules import get_modulefile_installations
+    >>> get_modulefile_installations()
+    {251: '/apps/ansys_inc/v251', 242: '/apps/ansys_inc/v242'}
+    """
+    if modulepath is None:
+        modulepath = os.environ.get("MODULEPATH", "")
+
+    installations: Dict[int, str] = {}
+    for directory in modulepath.split(os.pathsep):
+        if not directory:
+            continue
+        for entry in _iter_modulefiles(directory):
+            for version, prefix in _parse_modulefile_cached(entry).items():
+                installations.setdefault(version, prefix)
+
+    if verify:
+        installations = {ver: path for ver, path in installations.items() if os.path.isdir(path)}
+
+    non_student = {ver: path for ver, path in installations.items() if ver > 0}
+    student = {ver: path for ver, path in installations.items() if ver < 0}
+    LOG.debug(f"Found the following Ansys installations in modulefiles: {installations}")
+    return {**non_student, **student}
+
+
+def clear_modulefile_cache() -> None:
+    """Drop the parsed modulefiles kept in memory."""
+    with _CACHE_LOCK:
+        _MODULEFILE_CACHE.clear()
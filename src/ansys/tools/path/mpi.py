@@ -0,0 +1,239 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""MPI runtimes shipped with an Ansys installation.
+
+Installations bundle one or more MPI libraries under ``commonfiles/MPI``, laid
+out as ``<vendor>/<version>/<platform>/bin``, for example
+``commonfiles/MPI/Intel/2021.11.0/linx64/bin/mpirun``. This module indexes
+them so that launchers do not have to guess which ``mpirun`` to use.
+
+The index of an installation is cached and revalidated with a ``stat`` of its
+``commonfiles/MPI`` directory and of the vendor directories it holds, so that
+a runtime version added to an existing vendor is seen. All probes go through
+:mod:`ansys.tools.path.probes`.
+"""
+
+from dataclasses import dataclass
+import os
+import re
+import threading
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from ansys.tools.common.path.path import LOG
+
+from ansys.tools.path import probes
+
+MPI_DIRECTORY = ("commonfiles", "MPI")
+"""Directory of the bundled MPI runtimes, relative to the installation."""
+
+MPI_VENDOR_DIRECTORIES = {
+    "intel": "intelmpi",
+    "intelmpi": "intelmpi",
+    "openmpi": "openmpi",
+    "msmpi": "msmpi",
+    "ibmmpi": "platformmpi",
+    "platform": "platformmpi",
+    "platformmpi": "platformmpi",
+}
+"""Vendor directory names, lowercased and without separators, and the vendor they hold."""
+
+RECOMMENDED_MPI_VENDORS = ("intelmpi", "msmpi", "openmpi", "platformmpi")
+"""Vendors in the order they are recommended for MAPDL.
+
+Intel MPI is the default of MAPDL on both platforms. MS-MPI only exists on
+Windows and Open MPI only on Linux.
+"""
+
+
+def _platform_directory() -> str:
+    return "winx64" if os.name == "nt" else "linx64"
+
+
+def _launcher_names() -> Tuple[str, ...]:
+    if os.name == "nt":  # pragma: no cover
+        return ("mpiexec.exe", "mpirun.exe")
+    return ("mpirun", "mpiexec.hydra", "mpiexec")
+
+
+@dataclass(frozen=True)
+class MPIRuntime:
+    """One MPI runtime bundled with an installation."""
+
+    vendor: str
+    """Vendor, for example ``"intelmpi"`` or ``"openmpi"``.
+
+    These are also the values of the ``-mpi`` option of MAPDL.
+    """
+    version: str
+    """Version, as the name of its directory, for example ``"2021.11.0"``."""
+    path: str
+    """Root directory of the runtime."""
+    launcher: str
+    """Full path of the launcher, for example ``.../bin/mpirun``."""
+
+    @property
+    def version_tuple(self) -> Tuple[int, ...]:
+        """Numeric parts of :attr:`version`, for comparisons."""
+        return tuple(int(part) for part in re.findall(r"\d+", self.version))
+
+
+def _normalize_vendor(name: str) -> Optional[str]:
+    """Return the vendor of a vendor directory or user-given name, or ``None`` if unknown."""
+    return MPI_VENDOR_DIRECTORIES.get(re.sub(r"[\s_-]", "", name.lower()))
+
+
+def _entries(path: str) -> Dict[str, probes.DirEntryInfo]:
+    return {entry.name: entry for entry in probes.scandir(path) or []}
+
+
+def _find_launcher(version_path: str) -> Optional[str]:
+    """Return the launcher of the runtime installed in ``version_path``, if any."""
+    for bin_path in (
+        os.path.join(version_path, _platform_directory(), "bin"),
+        os.path.join(version_path, "bin"),
+    ):
+        names = {os.path.normcase(name): name for name in _entries(bin_path)}
+        for launcher in _launcher_names():
+            name = names.get(os.path.normcase(launcher))
+            if name is not None:
+                result = probes.stat(os.path.join(bin_path, name))
+                if result is not None and result.is_file:
+                    return os.path.join(bin_path, name)
+    return None
+
+
+def scan_mpi_runtimes(installation_path: str) -> Tuple[MPIRuntime, ...]:
+    """List the MPI runtimes bundled with an installation.
+
+    Parameters
+    ----------
+    installation_path : str
+        Base path of the installation, for example ``/ansys_inc/v251``.
+
+    Returns
+    -------
+    Tuple[MPIRuntime, ...]
+        Runtimes that provide a launcher, sorted by vendor and version.
+    """
+    mpi_path = os.path.join(installation_path, *MPI_DIRECTORY)
+    runtimes: List[MPIRuntime] = []
+    for vendor_name, vendor_entry in _entries(mpi_path).items():
+        vendor = _normalize_vendor(vendor_name)
+        if vendor is None or not vendor_entry.is_dir:
+            continue
+        vendor_path = os.path.join(mpi_path, vendor_name)
+        for version, version_entry in _entries(vendor_path).items():
+            if not version_entry.is_dir:
+                continue
+            version_path = os.path.join(vendor_path, version)
+            launcher = _find_launcher(version_path)
+            if launcher is None:
+                LOG.debug(f"No MPI launcher found in {version_path}")
+                continue
+            runtimes.append(MPIRuntime(vendor, version, version_path, launcher))
+    return tuple(sorted(runtimes, key=lambda runtime: (runtime.vendor, runtime.version_tuple)))
+
+
+_CACHE_LOCK = threading.Lock()
+_RUNTIME_CACHE: Dict[str, Tuple[Hashable, Tuple[MPIRuntime, ...]]] = {}
+
+
+def _mpi_fingerprint(mpi_path: str) -> Optional[Hashable]:
+    """Return the identity and modification times of ``mpi_path`` and its vendor directories."""
+    result = probes.stat(mpi_path)
+    if result is None:
+        return None
+    vendors = []
+    for name, entry in sorted(_entries(mpi_path).items()):
+        if not entry.is_dir or _normalize_vendor(name) is None:
+            continue
+        vendor = probes.stat(os.path.join(mpi_path, name))
+        vendors.append((name, None if vendor is None else (vendor.ino, vendor.mtime_ns)))
+    return (result.ino, result.mtime_ns, tuple(vendors))
+
+
+def get_mpi_runtimes(installation_path: str) -> Tuple[MPIRuntime, ...]:
+    """Return the MPI runtimes of an installation, scanning it only when needed.
+
+    Parameters
+    ----------
+    installation_path : str
+        Base path of the installation, for example ``/ansys_inc/v251``.
+
+    Returns
+    -------
+    Tuple[MPIRuntime, ...]
+        Runtimes that provide a launcher, sorted by vendor and version.
+    """
+    fingerprint = _mpi_fingerprint(os.path.join(installation_path, *MPI_DIRECTORY))
+    with _CACHE_LOCK:
+        cached = _RUNTIME_CACHE.get(installation_path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    runtimes = () if fingerprint is None else scan_mpi_runtimes(installation_path)
+    with _CACHE_LOCK:
+        _RUNTIME_CACHE[installation_path] = (fingerprint, runtimes)
+    return runtimes
+
+
+def recommend_mpi_runtime(
+    runtimes: Tuple[MPIRuntime, ...], vendor: Optional[str] = None
+) -> Optional[MPIRuntime]:
+    """Pick the runtime to launch MAPDL with.
+
+    The vendor is chosen in the order of :data:`RECOMMENDED_MPI_VENDORS`, then
+    the latest version of that vendor is used.
+
+    Parameters
+    ----------
+    runtimes : Tuple[MPIRuntime, ...]
+        Runtimes to choose from, usually those of one installation.
+    vendor : str, optional
+        Vendor to use, for example ``"openmpi"`` on AMD processors. The names of
+        :data:`MPI_VENDOR_DIRECTORIES` are accepted, for example ``"intel"``.
+
+    Returns
+    -------
+    Optional[MPIRuntime]
+        The recommended runtime, or ``None`` if there is none of that vendor.
+    """
+    if vendor is not None:
+        vendor = _normalize_vendor(vendor)
+        runtimes = tuple(runtime for runtime in runtimes if runtime.vendor == vendor)
+    if not runtimes:
+        return None
+
+    return max(
+        runtimes,
+        key=lambda runtime: (
+            -RECOMMENDED_MPI_VENDORS.index(runtime.vendor),
+            runtime.version_tuple,
+        ),
+    )
+
+
+def clear_mpi_runtime_cache() -> None:
+    """Drop the MPI runtimes kept in memory."""
+    with _CACHE_LOCK:
+        _RUNTIME_CACHE.clear()
@@ -20,10 +20,45 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+"""Installation path retrieval, with cached access to the configuration file.
+
+The helpers come from ``ansys-tools-common``. The functions reading or writing
+the configuration file are redefined here so that they go through the
+in-process cache of :mod:`ansys.tools.path.config`, the installations are listed
+by :mod:`ansys.tools.path.discovery` and the ``find_*`` functions are answered
+from the single-pass :mod:`ansys.tools.path.capabilities` matrix. The
+``get_*_path`` functions go through the chain of
+:mod:`ansys.tools.path.strategies`. Saved paths are returned immediately and
+checked in the background by :mod:`ansys.tools.path.revalidation`.
+"""
+
+from pathlib import Path
+from typing import Literal, Optional, Tuple, Union
 import warnings
 
+from ansys.tools.common.path.path import (
+    LOG,
+    PRODUCT_TYPE,
+    SUPPORTED_ANSYS_VERSIONS,
+    SUPPORTED_VERSIONS_TYPE,
+    _check_uncommon_executable_path,
+    _has_plugin,
+    _prompt_path,
+    is_valid_executable_path,
+)
 from ansys.tools.common.path.path import *  # noqa
 
+from ansys.tools.path.capabilities import get_capability_matrix
+from ansys.tools.path.config import read_config_file, update_config_file
+from ansys.tools.path.discovery import (  # noqa: F401
+    get_available_ansys_installations,
+    get_latest_ansys_installation,
+)
+from ansys.tools.path.mpi import MPIRuntime, recommend_mpi_runtime
+from ansys.tools.path.revalidation import schedule_revalidation
+from ansys.tools.path.strategies import resolve_executable
+from ansys.tools.path.variants import PRECISION_TYPE, DynaVariant
+
 warnings.warn(
     "This library is deprecated and will no longer be maintained. "
     "Functionality from this library has been migrated to ``ansys-tools-common``. "
@@ -31,3 +66,471 @@ warnings.warn(
     "For more information check https://github.com/ansys/ansys-tools-path/issues/341",
     DeprecationWarning,
 )
+
+
+def find_mapdl(
+    version: Optional[Union[int, float]] = None,
+    supported_versions: SUPPORTED_VERSIONS_TYPE = SUPPORTED_ANSYS_VERSIONS,
+) -> Union[Tuple[str, float], Tuple[Literal[""], Literal[""]]]:
+    """Search for the Ansys MAPDL path within the standard install location.
+
+    Parameters
+    ----------
+    version : int, float, optional
+        Version of Ansys MAPDL to search for, either as ``XXY`` or ``XX.Y``.
+        If ``None``, use the latest version providing MAPDL.
+    supported_versions : SUPPORTED_VERSIONS_TYPE, optional
+        Supported Ansys versions. Defaults to ``SUPPORTED_ANSYS_VERSIONS``.
+
+    Returns
+    -------
+    ansys_path : str
+        Full path to the MAPDL executable, or ``""`` if not found.
+    version : float
+        Version float, for example ``25.1`` for 2025 R1, or ``""`` if not found.
+
+    Examples
+    --------
+    >>> from ansys.tools.path import find_mapdl
+    >>> find_mapdl()
+    ('/usr/ansys_inc/v251/ansys/bin/ansys251', 25.1)
+    """
+    return get_capability_matrix(supported_versions).find("mapdl", version)
+
+
+def find_mpi_runtime(
+    version: Optional[Union[int, float]] = None,
+    vendor: Optional[str] = None,
+    supported_versions: SUPPORTED_VERSIONS_TYPE = SUPPORTED_ANSYS_VERSIONS,
+) -> Optional[MPIRuntime]:
+    """Search for the MPI runtime to launch Ansys MAPDL with.
+
+    The runtime is taken from those bundled with the installation that
+    ``find_mapdl`` selects for ``version``. See
+    :func:`ansys.tools.path.mpi.recommend_mpi_runtime`.
+
+    Parameters
+    ----------
+    version : int, float, optional
+        Version of Ansys MAPDL, either as ``XXY`` or ``XX.Y``. If ``None``,
+        use the latest version providing MAPDL.
+    vendor : str, optional
+        MPI vendor to use, for example ``"intelmpi"`` or ``"openmpi"``. If
+        ``None``, the recommended vendor is used.
+    supported_versions : SUPPORTED_VERSIONS_TYPE, optional
+        Supported Ansys versions. Defaults to ``SUPPORTED_ANSYS_VERSIONS``.
+
+    Returns
+    -------
+    Optional[MPIRuntime]
+        The runtime, or ``None`` if MAPDL or a suitable runtime is not installed.
+
+    Examples
+    --------
+    >>> from ansys.tools.path import find_mpi_runtime
+    >>> runtime = find_mpi_runtime()
+    >>> runtime.vendor, runtime.launcher
+    ('intelmpi', '/usr/ansys_inc/v251/commonfiles/MPI/Intel/2021.11.0/linx64/bin/mpirun')
+    """
+    matrix = get_capability_matrix(supported_versions)
+    exe_loc, _ = matrix.find("mapdl", version)
+    if not exe_loc:
+        return None
+    installation = next(
+        inst for inst in matrix.installations.values() if inst.executables.get("mapdl") == exe_loc
+    )
+    return recommend_mpi_runtime(installation.mpi_runtimes, vendor)
+
+
+def find_dyna(
+    version: Optional[Union[int, float]] = None,
+    supported_versions: SUPPORTED_VERSIONS_TYPE = SUPPORTED_ANSYS_VERSIONS,
+) -> Union[Tuple[str, float], Tuple[Literal[""], Literal[""]]]:
+    """Search for the Ansys LS-DYNA path within the standard install location.
+
+    Parameters
+    ----------
+    version : int, float, optional
+        Version of Ansys LS-DYNA to search for, either as ``XXY`` or ``XX.Y``.
+        If ``None``, use the latest version providing LS-DYNA.
+    supported_versions : SUPPORTED_VERSIONS_TYPE, optional
+        Supported Ansys versions. Defaults to ``SUPPORTED_ANSYS_VERSIONS``.
+
+    Returns
+    -------
+    ansys_path : str
+        Full path to the LS-DYNA executable, or ``""`` if not found.
+    version : float
+        Version float, for example ``25.1`` for 2025 R1, or ``""`` if not found.
+
+    Examples
+    --------
+    >>> from ansys.tools.path import find_dyna
+    >>> find_dyna()
+    ('/usr/ansys_inc/v251/ansys/bin/lsdyna251', 25.1)
+    """
+    return get_capability_matrix(supported_versions).find("dyna", version)
+
+
+def find_dyna_variant(
+    version: Optional[Union[int, float]] = None,
+    cores: int = 1,
+    nodes: int = 1,
+    precision: Optional[PRECISION_TYPE] = None,
+    mpi: Optional[str] = None,
+    supported_versions: SUPPORTED_VERSIONS_TYPE = SUPPORTED_ANSYS_VERSIONS,
+) -> Optional[DynaVariant]:
+    """Search for the fastest LS-DYNA solver suitable for a job.
+
+    Installations ship SMP and MPP solvers in single and double precision.
+    Jobs on several nodes use an MPP solver, and large single-node jobs prefer
+    one. See :func:`ansys.tools.path.variants.select_dyna_variant`.
+
+    Parameters
+    ----------
+    version : int, float, optional
+        Version of Ansys LS-DYNA to search for, either as ``XXY`` or ``XX.Y``.
+        If ``None``, use the latest version with a suitable solver.
+    cores : int, optional
+        Total number of cores of the job. Defaults to ``1``.
+    nodes : int, optional
+        Number of nodes of the job. Defaults to ``1``.
+    precision : str, optional
+        ``"single"`` or ``"double"``. If ``None``, any precision is suitable.
+    mpi : str, optional
+        MPI library the solver must use, for example ``"intelmpi"``.
+    supported_versions : SUPPORTED_VERSIONS_TYPE, optional
+        Supported Ansys versions. Defaults to ``SUPPORTED_ANSYS_VERSIONS``.
+
+    Returns
+    -------
+    Optional[DynaVariant]
+        The selected solver, or ``None`` if no suitable solver is installed.
+
+    Examples
+    --------
+    >>> from ansys.tools.path import find_dyna_variant
+    >>> find_dyna_variant(cores=32, nodes=2, precision="double").path
+    '/usr/ansys_inc/v251/ansys/bin/linx64/lsdyna_dp_mpp.e'
+    """
+    return get_capability_matrix(supported_versions).find_dyna_variant(
+        version, cores, nodes, precision, mpi
+    )
+
+
+def find_mechanical(
+    version: Optional[float] = None,
+    supported_versions: SUPPORTED_VERSIONS_TYPE = SUPPORTED_ANSYS_VERSIONS,
+) -> Union[Tuple[str, float], Tuple[Literal[""], Literal[""]]]:
+    """Search for the Ansys Mechanical path in the standard installation location.
+
+    Parameters
+    ----------
+    version : float, optional
+        Version of Ansys Mechanical to search for, either as ``XXY`` or ``XX.Y``.
+        If ``None``, use the latest version providing Mechanical.
+    supported_versions : SUPPORTED_VERSIONS_TYPE, optional
+        Supported Ansys versions. Defaults to ``SUPPORTED_ANSYS_VERSIONS``.
+
+    Returns
+    -------
+    mechanical_path : str
+        Full path to the Mechanical executable file, or ``""`` if not found.
+    version : float
+        Version float, for example ``25.1`` for 2025 R1, or ``""`` if not found.
+
+    Examples
+    --------
+    >>> from ansys.tools.path import find_mechanical
+    >>> find_mechanical()
+    ('/usr/ansys_inc/v251/aisol/.workbench', 25.1)
+    """
+    return get_capability_matrix(supported_versions).find("mechanical", version)
+
+
+def _find_installation(
+    product: str,
+    version: Optional[float] = None,
+    supported_versions: SUPPORTED_VERSIONS_TYPE = SUPPORTED_ANSYS_VERSIONS,
+) -> Union[Tuple[str, float], Tuple[Literal[""], Literal[""]]]:
+    return get_capability_matrix(supported_versions).find(product, version)
+
+
+def find_ansys(
+    version: Optional[float] = None,
+    supported_versions: SUPPORTED_VERSIONS_TYPE = SUPPORTED_ANSYS_VERSIONS,
+) -> Union[Tuple[str, float], Tuple[Literal[""], Literal[""]]]:
+    """Obsolete method. Use ``find_mapdl`` instead."""
+    warnings.warn(
+        "This method is going to be deprecated in future versions. Please use 'find_mapdl'.",
+        category=DeprecationWarning,
+    )
+    return _find_installation("mapdl", version, supported_versions)
+
+
+def _change_default_path(application: str, exe_loc: str) -> None:
+    exe_path = Path(exe_loc)
+    if exe_path.is_file():
+        update_config_file(lambda config_data: {**config_data, application: str(exe_path)})
+    else:
+        raise FileNotFoundError(f"File {exe_loc} is invalid or does not exist")
+
+
+def change_default_mapdl_path(exe_loc: str) -> None:
+    """Change your default Ansys MAPDL path.
+
+    Parameters
+    ----------
+    exe_loc : str
+        Ansys MAPDL executable path.  Must be a full path.
+    """
+    _change_default_path("mapdl", exe_loc)
+
+
+def change_default_dyna_path(exe_loc: str) -> None:
+    """Change your default Ansys LS-DYNA path.
+
+    Parameters
+    ----------
+    exe_loc : str
+        Path to the LS-DYNA executable. Must be a full path.
+    """
+    _change_default_path("dyna", exe_loc)
+
+
+def change_default_mechanical_path(exe_loc: str) -> None:
+    """Change your default Mechanical path.
+
+    Parameters
+    ----------
+    exe_loc : str
+        Full path for the Mechanical executable file to use.
+    """
+    _change_default_path("mechanical", exe_loc)
+
+
+def change_default_ansys_path(exe_loc: str) -> None:
+    """Deprecated. Use ``change_default_mapdl_path`` instead."""  # noqa: D401
+    warnings.warn(
+        "This method is going to be deprecated in future versions. "
+        "Please use 'change_default_mapdl_path'.",
+        category=DeprecationWarning,
+    )
+    _change_default_path("mapdl", exe_loc)
+
+
+def _save_path(product: str, exe_loc: Optional[str] = None, allow_prompt: bool = True) -> str:
+    has_plugin = _has_plugin(product)
+    if exe_loc is None and has_plugin:
+        exe_loc, _ = _find_installation(product)
+    if exe_loc == "" and allow_prompt:
+        exe_loc = _prompt_path(product)  # pragma: no cover
+
+    if has_plugin:
+        if is_valid_executable_path(product, exe_loc):
+            _check_uncommon_executable_path(product, exe_loc)
+    _change_default_path(product, exe_loc)
+    return exe_loc
+
+
+def save_mechanical_path(exe_loc: Optional[str] = None, allow_prompt: bool = True) -> str:
+    """Find the Mechanical path or query the user, and save it in the configuration file.
+
+    Parameters
+    ----------
+    exe_loc : str, optional
+        Path for the Mechanical executable file. If ``None``, the latest
+        installation found in the default locations is used.
+    allow_prompt : bool, optional
+        Ask for the path if none can be found. The default is ``True``.
+
+    Returns
+    -------
+    str
+        Path for the Mechanical executable file.
+    """
+    return _save_path("mechanical", exe_loc, allow_prompt)
+
+
+def save_dyna_path(exe_loc: Optional[str] = None, allow_prompt: bool = True) -> str:
+    """Find the Ansys LS-DYNA path or query the user, and save it in the configuration file.
+
+    Parameters
+    ----------
+    exe_loc : str, optional
+        Path of the LS-DYNA executable (``lsdynaXXX``). If ``None``, the latest
+        installation found in the default locations is used.
+    allow_prompt : bool, optional
+        Ask for the path if none can be found. The default is ``True``.
+
+    Returns
+    -------
+    str
+        Path of the LS-DYNA executable.
+    """
+    return _save_path("dyna", exe_loc, allow_prompt)
+
+
+def save_mapdl_path(exe_loc: Optional[str] = None, allow_prompt: bool = True) -> str:
+    """Find the Ansys MAPDL path or query the user, and save it in the configuration file.
+
+    Parameters
+    ----------
+    exe_loc : str, optional
+        Path of the MAPDL executable (``ansysXXX``). If ``None``, the latest
+        installation found in the default locations is used.
+    allow_prompt : bool, optional
+        Ask for the path if none can be found. The default is ``True``.
+
+    Returns
+    -------
+    str
+        Path of the MAPDL executable.
+    """
+    return _save_path("mapdl", exe_loc, allow_prompt)
+
+
+def save_ansys_path(exe_loc: Optional[str] = None, allow_prompt: bool = True) -> str:
+    """Deprecated. Use ``save_mapdl_path`` instead."""  # noqa: D401
+    warnings.warn(
+        "This method is going to be deprecated in future versions. Please use 'save_mapdl_path'.",
+        category=DeprecationWarning,
+    )
+    return _save_path("mapdl", exe_loc, allow_prompt)
+
+
+def clear_configuration(product: Union[PRODUCT_TYPE, Literal["all"]]) -> None:
+    """Clear the entry of the specified product in the configuration file."""
+    # Reading the configuration also migrates older configuration files if necessary.
+    if product == "all":
+        update_config_file(lambda config: {})
+        return
+    update_config_file(
+        lambda config: (
+            {name: path for name, path in config.items() if name != product}
+            if product in config
+            else None
+        )
+    )
+
+
+def _read_executable_path_from_config_file(product_name: str) -> Optional[str]:
+    return read_config_file().get(product_name, None)
+
+
+def get_saved_application_path(application: str) -> Optional[str]:
+    """Get the saved path for a specific application from the configuration file.
+
+    Parameters
+    ----------
+    application : str
+        Name of the application to get the path for. For example, "mapdl", "dyna", or "mechanical".
+
+    Returns
+    -------
+    Optional[str]
+        The path to the executable if it exists in the configuration file, otherwise ``None``.
+    """
+    return _read_executable_path_from_config_file(application)
+
+
+def _get_application_path(
+    product: str,
+    allow_input: bool = True,
+    version: Optional[float] = None,
+    find: bool = True,
+) -> Optional[str]:
+    strategies = None if find else ["config"]
+    resolution = resolve_executable(product, version, strategies)
+    if resolution.strategy == "config":
+        # Return the saved path right away and check the saved paths in the background.
+        schedule_revalidation()
+    if resolution.path is not None:
+        return resolution.path
+
+    LOG.debug(f"{product} path not found with strategies {list(resolution.timings)}")
+    if not _has_plugin(product):
+        raise Exception(f"Application {product} not registered.")
+
+    if allow_input:
+        exe_loc = _prompt_path(product)
+        _change_default_path(product, exe_loc)
+        return exe_loc
+
+    warnings.warn(f"No path found for {product} in default locations.")
+    return None
+
+
+def get_mapdl_path(
+    allow_input: bool = True, version: Optional[float] = None, find: bool = True
+) -> Optional[str]:
+    """Acquire the Ansys MAPDL path.
+
+    First, it looks in the configuration file, used by ``save_mapdl_path``.
+    Then, it tries to find it based on conventions for where it usually is.
+    Lastly, it takes user input.
+
+    Parameters
+    ----------
+    allow_input : bool, optional
+        Allow user input to find Ansys MAPDL path.  The default is ``True``.
+    version : float, optional
+        Version of Ansys MAPDL to search for. For example ``version=25.1``.
+        If ``None``, use latest.
+    find : bool, optional
+        Allow ansys-tools-path to search for Ansys MAPDL in typical installation locations.
+    """
+    return _get_application_path("mapdl", allow_input, version, find)
+
+
+def get_dyna_path(
+    allow_input: bool = True, version: Optional[float] = None, find: bool = True
+) -> Optional[str]:
+    """Acquire the Ansys LS-DYNA path.
+
+    First, it looks in the configuration file, used by ``save_dyna_path``.
+    Then, it tries to find it based on conventions for where it usually is.
+    Lastly, it takes user input.
+
+    Parameters
+    ----------
+    allow_input : bool, optional
+        Allow user input to find Ansys LS-DYNA path.  The default is ``True``.
+    version : float, optional
+        Version of Ansys LS-DYNA to search for. For example ``version=25.1``.
+        If ``None``, use latest.
+    find : bool, optional
+        Allow ansys-tools-path to search for Ansys LS-DYNA in typical installation locations.
+    """
+    return _get_application_path("dyna", allow_input, version, find)
+
+
+def get_mechanical_path(
+    allow_input: bool = True, version: Optional[float] = None, find: bool = True
+) -> Optional[str]:
+    """Acquire the Ansys Mechanical path.
+
+    First, it looks in the configuration file, used by ``save_mechanical_path``.
+    Then, it tries to find it based on conventions for where it usually is.
+    Lastly, it takes user input.
+
+    Parameters
+    ----------
+    allow_input : bool, optional
+        Allow user input to find Ansys Mechanical path.  The default is ``True``.
+    version : float, optional
+        Version of Ansys Mechanical to search for. For example ``version=25.1``.
+        If ``None``, use latest.
+    find : bool, optional
+        Allow ansys-tools-path to search for Ansys Mechanical in typical installation locations.
+    """
+    return _get_application_path("mechanical", allow_input, version, find)
+
+
+def get_ansys_path(allow_input: bool = True, version: Optional[float] = None) -> Optional[str]:
+    """Deprecated. Use ``get_mapdl_path`` instead."""  # noqa: D401
+    warnings.warn(
+        "This method is going to be deprecated in future versions. Please use 'get_mapdl_path'.",
+        category=DeprecationWarning,
+    )
+    return _get_application_path("mapdl", allow_input, version, True)
@@ -0,0 +1,314 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Pre-launch check of the shared libraries required by an executable.
+
+The dynamic section of the executable returned by ``find_mapdl`` or
+``find_dyna`` is parsed in pure Python and every ``DT_NEEDED`` entry is
+resolved, transitively, against the installation library directories and the
+system loader paths. A missing library is reported in milliseconds, before any
+resources are allocated for the solver. Verdicts are cached per executable
+fingerprint.
+"""
+
+from dataclasses import dataclass, field
+import functools
+import glob
+import os
+import platform
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from ansys.tools.common.path.path import LOG
+
+from ansys.tools.path.buildinfo import installation_root
+from ansys.tools.path.elf import ElfError, ElfFile, is_elf
+
+INSTALLATION_LIBRARY_DIRS = [
+    "ansys/lib/linx64",
+    "ansys/bin/linx64",
+    "ansys/syslib/*",
+    "tp/*/*/linx64/lib",
+    "tp/*/*/linx64/lib/intel64",
+    "commonfiles/MPI/*/*/linx64/lib",
+]
+"""Library directories of an installation, relative to it. Glob patterns are allowed."""
+
+WRAPPED_BINARIES = {"ansys": "linx64/ansys.e"}
+"""Binary started by a wrapper script, relative to the script directory, by script prefix."""
+
+_DEFAULT_SYSTEM_DIRS = ["/lib64", "/usr/lib64", "/lib", "/usr/lib"]
+
+
+class MissingLibraryError(FileNotFoundError):
+    """Raised when an executable requires shared libraries that cannot be found."""
+
+
+@dataclass
+class DependencyReport:
+    """Outcome of the shared library check of an executable."""
+
+    executable: str
+    """Executable that was checked."""
+    binary: Optional[str] = None
+    """ELF file actually inspected. It differs from ``executable`` for wrapper scripts."""
+    resolved: Dict[str, str] = field(default_factory=dict)
+    """Mapping of required libraries to the file they resolve to."""
+    missing: Dict[str, str] = field(default_factory=dict)
+    """Mapping of the libraries not found to the file requiring them."""
+    checked: bool = True
+    """``False`` when the executable could not be inspected, for example on Windows."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether all required libraries were found."""
+        return not self.missing
+
+    def raise_for_missing(self) -> None:
+        """Raise :class:`MissingLibraryError` if a library is missing."""
+        if self.missing:
+            details = ", ".join(f"{lib} (needed by {by})" for lib, by in self.missing.items())
+            raise MissingLibraryError(f"Missing shared libraries for {self.executable}: {details}")
+
+
+@functools.lru_cache(maxsize=None)
+def _system_library_dirs() -> Tuple[str, ...]:
+    """Directories searched by the dynamic loader after ``LD_LIBRARY_PATH``."""
+    dirs: List[str] = []
+
+    def parse(conf: str, seen: Set[str]):
+        if conf in seen:
+            return
+        seen.add(conf)
+        try:
+            with open(conf) as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return
+        for line in lines:
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            if line.startswith("include"):
+                pattern = line.split(None, 1)[1] if " " in line else ""
+                if not os.path.isabs(pattern):
+                    pattern = os.path.join(os.path.dirname(conf), pattern)
+                for included in sorted(glob.glob(pattern)):
+                    parse(included, seen)
+            else:
+                dirs.append(line)
+
+    parse("/etc/ld.so.conf", set())
+    multiarch = f"{platform.machine()}-linux-gnu"
+    dirs.extend([f"/lib/{multiarch}", f"/usr/lib/{multiarch}"])
+    dirs.extend(_DEFAULT_SYSTEM_DIRS)
+    return tuple(dict.fromkeys(dirs))
+
+
+@functools.lru_cache(maxsize=128)
+def _installation_library_dirs(root: str) -> Tuple[str, ...]:
+    dirs: List[str] = []
+    for pattern in INSTALLATION_LIBRARY_DIRS:
+        dirs.extend(sorted(glob.glob(os.path.join(root, pattern))))
+    return tuple(d for d in dirs if os.path.isdir(d))
+
+
+def _expand_origin(paths: List[str], origin: str) -> List[str]:
+    return [path.replace("$ORIGIN", origin).replace("${ORIGIN}", origin) for path in paths if path]
+
+
+def _binary_for(executable: str) -> Optional[str]:
+    """Return the ELF file started by ``executable``, following wrapper scripts."""
+    if is_elf(executable):
+        return executable
+    name = os.path.basename(executable)
+    for prefix, relative in WRAPPED_BINARIES.items():
+        if name.startswith(prefix):
+            candidate = os.path.join(os.path.dirname(executable), relative)
+            if is_elf(candidate):
+                return candidate
+    return None
+
+
+class _Resolver:
+    """Resolve libraries in the loader order, with one listing per directory.
+
+    The order is ``DT_RPATH`` (only without ``DT_RUNPATH``), ``LD_LIBRARY_PATH``,
+    ``DT_RUNPATH`` and finally the other directories.
+    """
+
+    def __init__(self, ld_library_path: List[str], other_dirs: List[str]):
+        self.ld_library_path = ld_library_path
+        self.other_dirs = other_dirs
+        self._listings: Dict[str, Set[str]] = {}
+        self._headers: Dict[str, Optional[Tuple[bool, int]]] = {}
+
+    def _listing(self, directory: str) -> Set[str]:
+        if directory not in self._listings:
+            try:
+                with os.scandir(directory) as entries:
+                    self._listings[directory] = {entry.name for entry in entries}
+            except OSError:
+                self._listings[directory] = set()
+        return self._listings[directory]
+
+    def _compatible(self, path: str, elf: ElfFile) -> bool:
+        """Whether ``path`` is an ELF file the loader would accept for ``elf``."""
+        if path not in self._headers:
+            try:
+                candidate = ElfFile(path)
+                self._headers[path] = (candidate.is_64bit, candidate.machine)
+            except (ElfError, OSError):
+                self._headers[path] = None
+        return self._headers[path] == (elf.is_64bit, elf.machine)
+
+    def resolve(
+        self, library: str, elf: ElfFile, rpath: List[str], runpath: List[str]
+    ) -> Optional[str]:
+        if "/" in library:
+            return library if os.path.isfile(library) else None
+        dirs = ([] if runpath else rpath) + self.ld_library_path + runpath + self.other_dirs
+        for directory in dirs:
+            if library in self._listing(directory):
+                candidate = os.path.join(directory, library)
+                if self._compatible(candidate, elf):
+                    return candidate
+        return None
+
+
+def _fingerprint(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+_CACHE_LOCK = threading.Lock()
+_REPORT_CACHE: Dict[Tuple, DependencyReport] = {}
+
+
+def check_executable_dependencies(
+    executable: str,
+    library_dirs: Optional[List[str]] = None,
+    installation_path: Optional[str] = None,
+    refresh: bool = False,
+) -> DependencyReport:
+    """Check that the shared libraries required by an executable can be found.
+
+    Parameters
+    ----------
+    executable : str
+        Executable to check, for example the path returned by ``find_mapdl``.
+        For wrapper scripts, the binary they start is checked instead.
+    library_dirs : List[str], optional
+        Extra library directories, searched after ``LD_LIBRARY_PATH``.
+    installation_path : str, optional
+        Installation the executable belongs to. Its library directories
+        (``INSTALLATION_LIBRARY_DIRS``) are searched too. By default, it is the
+        ``vXXX`` directory containing the executable.
+    refresh : bool, optional
+        Ignore the cached verdict.
+
+    Returns
+    -------
+    DependencyReport
+        Libraries found and missing.
+
+    Examples
+    --------
+    >>> from ansys.tools.path import find_mapdl
+    >>> from ansys.tools.path.preflight import check_executable_dependencies
+    >>> report = check_executable_dependencies(find_mapdl()[0])
+    >>> report.ok
+    True
+    >>> report.raise_for_missing()
+    """
+    if os.name == "nt":  # pragma: no cover
+        return DependencyReport(executable, checked=False)
+
+    binary = _binary_for(executable)
+    if binary is None:
+        LOG.debug(f"No ELF binary found for {executable}, skipping dependency check.")
+        return DependencyReport(executable, checked=False)
+
+    if installation_path is None:
+        installation_path = installation_root(binary)
+    ld_library_path = [d for d in os.environ.get("LD_LIBRARY_PATH", "").split(":") if d]
+    other_dirs = list(library_dirs or [])
+    if installation_path:
+        other_dirs += list(_installation_library_dirs(installation_path))
+    other_dirs += list(_system_library_dirs())
+
+    key = (
+        os.path.abspath(binary),
+        _fingerprint(binary),
+        tuple(ld_library_path),
+        tuple(other_dirs),
+    )
+    with _CACHE_LOCK:
+        cached = _REPORT_CACHE.get(key)
+    if cached is not None and not refresh:
+        return cached
+
+    resolver = _Resolver(ld_library_path, other_dirs)
+    report = DependencyReport(executable, binary)
+    queue = [binary]
+    visited: Set[str] = set()
+    while queue:
+        current = queue.pop(0)
+        if current in visited:
+            continue
+        visited.add(current)
+        try:
+            elf = ElfFile(current)
+            info = elf.dynamic_info()
+        except (ElfError, OSError) as e:
+            LOG.debug(f"Unable to read the dynamic section of {current}: {e}")
+            continue
+        origin = os.path.dirname(current)
+        rpath = _expand_origin(info.rpath, origin)
+        runpath = _expand_origin(info.runpath, origin)
+        for library in info.needed:
+            if library in report.resolved or library in report.missing:
+                continue
+            resolved = resolver.resolve(library, elf, rpath, runpath)
+            if resolved is None:
+                report.missing[library] = current
+            else:
+                report.resolved[library] = resolved
+                queue.append(resolved)
+
+    if report.missing:
+        LOG.debug(f"Missing libraries for {executable}: {report.missing}")
+    with _CACHE_LOCK:
+        _REPORT_CACHE[key] = report
+    return report
+
+
+def clear_dependency_cache() -> None:
+    """Drop the cached verdicts and library directories."""
+    with _CACHE_LOCK:
+        _REPORT_CACHE.clear()
+    _installation_library_dirs.cache_clear()
+    _system_library_dirs.cache_clear()
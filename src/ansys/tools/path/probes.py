@@ -0,0 +1,396 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Filesystem probes of the discovery, with recording and replay.
+
+The discovery of installations (:mod:`ansys.tools.path.discovery` and
+:mod:`ansys.tools.path.capabilities`) touches the filesystem only through
+:func:`stat`, :func:`scandir` and :func:`realpath`. These calls go to the
+active :class:`ProbeBackend`, which is normally the real filesystem.
+
+Inside :func:`record_probes`, every probe is also written to a trace file with
+its path, operation, result and latency. Inside :func:`replay_probes`, the
+probes are answered from such a trace instead of the filesystem, waiting for the
+recorded latencies, so that a slow discovery on a user machine can be
+reproduced and benchmarked offline.
+
+Examples
+--------
+On the slow machine:
+
+>>> from ansys.tools.path import find_mapdl
+>>> from ansys.tools.path.probes import record_probes
+>>> with record_probes("find_mapdl.trace.gz"):
+...     find_mapdl()
+
+Offline:
+
+>>> from ansys.tools.path.probes import replay_probes
+>>> with replay_probes("find_mapdl.trace.gz") as replay:
+...     find_mapdl()
+>>> replay.simulated_latency
+8.02
+"""
+
+from collections import defaultdict, deque
+from contextlib import contextmanager
+import gzip
+import json
+import os
+import stat as _stat
+import sys
+import threading
+import time
+from typing import IO, Any, Deque, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+TRACE_FORMAT = "ansys-tools-path-probe-trace"
+TRACE_VERSION = 1
+
+
+class StatInfo(NamedTuple):
+    """Result of a :func:`stat` probe."""
+
+    mode: int
+    dev: int
+    ino: int
+    mtime_ns: int
+    size: int
+
+    @property
+    def is_dir(self) -> bool:
+        return _stat.S_ISDIR(self.mode)
+
+    @property
+    def is_file(self) -> bool:
+        return _stat.S_ISREG(self.mode)
+
+
+class DirEntryInfo(NamedTuple):
+    """One entry of a :func:`scandir` probe."""
+
+    name: str
+    is_dir: bool
+    is_symlink: bool
+
+
+class ProbeBackend:
+    """Provides the filesystem probes of the discovery."""
+
+    isolated = False
+    """Whether the discovery must keep its persistent state (root statistics) in memory only."""
+
+    root_statistics: Any = None
+    """Root statistics used while the backend is isolated."""
+
+    def stat(self, path: str) -> Optional[StatInfo]:
+        """Return the status of ``path``, following symbolic links, or ``None`` if it does not exist."""
+        raise Exception("This is just a base class.")
+
+    def scandir(self, path: str) -> Optional[List[DirEntryInfo]]:
+        """Return the entries of a directory, in listing order, or ``None`` if it cannot be listed."""
+        raise Exception("This is just a base class.")
+
+    def realpath(self, path: str) -> str:
+        """Return ``path`` with all symbolic links resolved."""
+        raise Exception("This is just a base class.")
+
+
+class OSBackend(ProbeBackend):
+    """Probes of the real filesystem."""
+
+    def stat(self, path: str) -> Optional[StatInfo]:
+        try:
+            result = os.stat(path)
+        except (OSError, ValueError):
+            return None
+        return StatInfo(
+            result.st_mode, result.st_dev, result.st_ino, result.st_mtime_ns, result.st_size
+        )
+
+    def scandir(self, path: str) -> Optional[List[DirEntryInfo]]:
+        try:
+            with os.scandir(path) as entries:
+                return [
+                    DirEntryInfo(entry.name, _entry_is_dir(entry), entry.is_symlink())
+                    for entry in entries
+                ]
+        except (OSError, ValueError):
+            return None
+
+    def realpath(self, path: str) -> str:
+        return os.path.realpath(path)
+
+
+def _entry_is_dir(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _open_trace(path: str, mode: str) -> IO[str]:
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _encode(operation: str, result: Any) -> Any:
+    if result is None or operation == "realpath":
+        return result
+    if operation == "stat":
+        return list(result)
+    return [[entry.name, int(entry.is_dir), int(entry.is_symlink)] for entry in result]
+
+
+def _decode(operation: str, result: Any) -> Any:
+    if result is None or operation == "realpath":
+        return result
+    if operation == "stat":
+        return StatInfo(*result)
+    return [DirEntryInfo(name, bool(is_dir), bool(is_link)) for name, is_dir, is_link in result]
+
+
+class RecordingBackend(ProbeBackend):
+    """Forwards the probes to another backend and records them.
+
+    Parameters
+    ----------
+    backend : ProbeBackend
+        Backend doing the actual probes.
+    """
+
+    def __init__(self, backend: ProbeBackend):
+        self._backend = backend
+        self._lock = threading.Lock()
+        self.events: List[Tuple[str, str, Any, float]] = []
+        """Recorded ``(operation, path, result, latency)`` tuples."""
+
+    def _record(self, operation: str, path: str) -> Any:
+        start = time.perf_counter()
+        result = getattr(self._backend, operation)(path)
+        latency = time.perf_counter() - start
+        with self._lock:
+            self.events.append((operation, path, result, latency))
+        return result
+
+    def stat(self, path: str) -> Optional[StatInfo]:
+        return self._record("stat", path)
+
+    def scandir(self, path: str) -> Optional[List[DirEntryInfo]]:
+        return self._record("scandir", path)
+
+    def realpath(self, path: str) -> str:
+        return self._record("realpath", path)
+
+    def save(self, trace_file: str) -> None:
+        """Write the recorded probes. Files ending with ``.gz`` are compressed."""
+        with self._lock:
+            events = list(self.events)
+        with _open_trace(trace_file, "w") as f:
+            header = {"format": TRACE_FORMAT, "version": TRACE_VERSION, "platform": sys.platform}
+            f.write(json.dumps(header) + "\n")
+            for operation, path, result, latency in events:
+                line = [operation, path, _encode(operation, result), round(latency, 7)]
+                f.write(json.dumps(line, separators=(",", ":")) + "\n")
+
+
+class TraceMismatchError(LookupError):
+    """Raised in strict replay when a probe is not in the trace."""
+
+
+def load_trace(trace_file: str) -> List[Tuple[str, str, Any, float]]:
+    """Read a trace written by :func:`record_probes`.
+
+    Parameters
+    ----------
+    trace_file : str
+        Path of the trace.
+
+    Returns
+    -------
+    List[Tuple[str, str, Any, float]]
+        ``(operation, path, result, latency)`` of each probe, in recording order.
+    """
+    with _open_trace(trace_file, "r") as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get("format") != TRACE_FORMAT:
+            raise ValueError(f"{trace_file} is not a probe trace.")
+        if header.get("version") != TRACE_VERSION:
+            raise ValueError(f"Unsupported probe trace version {header.get('version')}.")
+        events = []
+        for line in f:
+            if line.strip():
+                operation, path, result, latency = json.loads(line)
+                events.append((operation, path, _decode(operation, result), latency))
+    return events
+
+
+class ReplayBackend(ProbeBackend):
+    """Answers the probes from a recorded trace.
+
+    A probe repeated several times in the trace is answered with its recorded
+    results in order, the last one being reused once they are exhausted.
+
+    Parameters
+    ----------
+    events : List[Tuple[str, str, Any, float]]
+        Probes as returned by :func:`load_trace`.
+    latency : bool, optional
+        Wait for the recorded latency of each probe. Defaults to ``True``.
+    strict : bool, optional
+        Raise :class:`TraceMismatchError` for probes that are not in the trace.
+        Otherwise they are answered as missing paths. Defaults to ``False``.
+    """
+
+    isolated = True
+
+    def __init__(
+        self,
+        events: List[Tuple[str, str, Any, float]],
+        latency: bool = True,
+        strict: bool = False,
+    ):
+        self._lock = threading.Lock()
+        self._answers: Dict[Tuple[str, str], Deque[Tuple[Any, float]]] = defaultdict(deque)
+        for operation, path, result, event_latency in events:
+            self._answers[(operation, path)].append((result, event_latency))
+        self._latency = latency
+        self._strict = strict
+        self.replayed = 0
+        """Number of probes answered from the trace."""
+        self.unknown: List[Tuple[str, str]] = []
+        """Probes that were not in the trace."""
+        self.simulated_latency = 0.0
+        """Sum of the recorded latencies of the replayed probes, in seconds."""
+
+    def _replay(self, operation: str, path: str, missing: Any) -> Any:
+        with self._lock:
+            answers = self._answers.get((operation, path))
+            if not answers:
+                self.unknown.append((operation, path))
+                if self._strict:
+                    raise TraceMismatchError(f"No {operation} of {path} in the trace.")
+                return missing
+            result, latency = answers.popleft() if len(answers) > 1 else answers[0]
+            self.replayed += 1
+            self.simulated_latency += latency
+        if self._latency and latency > 0:
+            time.sleep(latency)
+        return result
+
+    def stat(self, path: str) -> Optional[StatInfo]:
+        return self._replay("stat", path, None)
+
+    def scandir(self, path: str) -> Optional[List[DirEntryInfo]]:
+        return self._replay("scandir", path, None)
+
+    def realpath(self, path: str) -> str:
+        return self._replay("realpath", path, path)
+
+
+_BACKEND_LOCK = threading.Lock()
+_BACKEND: ProbeBackend = OSBackend()
+
+
+def get_backend() -> ProbeBackend:
+    """Return the active probe backend."""
+    return _BACKEND
+
+
+@contextmanager
+def use_backend(backend: ProbeBackend) -> Iterator[ProbeBackend]:
+    """Send the probes of all threads to ``backend`` inside the ``with`` block.
+
+    The in-process capability matrices are dropped on entry and on exit, so the
+    discovery runs against the backend and its results do not outlive it.
+    """
+    from ansys.tools.path.capabilities import clear_capability_matrix
+
+    global _BACKEND
+    with _BACKEND_LOCK:
+        previous = _BACKEND
+        _BACKEND = backend
+    clear_capability_matrix()
+    try:
+        yield backend
+    finally:
+        with _BACKEND_LOCK:
+            _BACKEND = previous
+        clear_capability_matrix()
+
+
+@contextmanager
+def record_probes(trace_file: str) -> Iterator[RecordingBackend]:
+    """Record the filesystem probes made inside the ``with`` block.
+
+    Parameters
+    ----------
+    trace_file : str
+        Path of the trace to write when the block exits. Files ending with
+        ``.gz`` are compressed.
+    """
+    recorder = RecordingBackend(get_backend())
+    try:
+        with use_backend(recorder):
+            yield recorder
+    finally:
+        recorder.save(trace_file)
+
+
+@contextmanager
+def replay_probes(
+    trace_file: str, latency: bool = True, strict: bool = False
+) -> Iterator[ReplayBackend]:
+    """Answer the filesystem probes made inside the ``with`` block from a trace.
+
+    The root statistics of :mod:`ansys.tools.path.discovery` are kept in memory
+    during the replay, so the replay always starts from the same state and does
+    not change the statistics of the machine.
+
+    Parameters
+    ----------
+    trace_file : str
+        Trace written by :func:`record_probes`.
+    latency : bool, optional
+        Wait for the recorded latency of each probe. Defaults to ``True``.
+    strict : bool, optional
+        Raise :class:`TraceMismatchError` for probes that are not in the trace.
+        Otherwise they are answered as missing paths. Defaults to ``False``.
+    """
+    with use_backend(ReplayBackend(load_trace(trace_file), latency, strict)) as backend:
+        yield backend
+
+
+def stat(path: str) -> Optional[StatInfo]:
+    """Return the status of ``path``, following symbolic links, or ``None`` if it does not exist."""
+    return _BACKEND.stat(path)
+
+
+def scandir(path: str) -> Optional[List[DirEntryInfo]]:
+    """Return the entries of a directory, in listing order, or ``None`` if it cannot be listed."""
+    return _BACKEND.scandir(path)
+
+
+def realpath(path: str) -> str:
+    """Return ``path`` with all symbolic links resolved."""
+    return _BACKEND.realpath(path)
@@ -0,0 +1,293 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Discovery of Ansys installations on many hosts at once.
+
+The discovery logic of ``ansys.tools.path`` runs on each host through a
+:class:`CommandTransport`. :class:`SSHTransport` reaches remote hosts and
+:class:`LocalTransport` runs the same command in a local subprocess, which is
+useful for testing.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from ansys.tools.common.path.path import LOG
+
+_DISCOVERY_SCRIPT = (
+    "import json;"
+    "from ansys.tools.path import get_available_ansys_installations;"
+    "print(json.dumps(get_available_ansys_installations()))"
+)
+
+
+@dataclass
+class CommandResult:
+    """Outcome of a command run through a transport."""
+
+    returncode: int
+    stdout: str
+    stderr: str = ""
+
+
+@dataclass
+class HostDiscoveryResult:
+    """Ansys installations found on one host.
+
+    ``installations`` has the same shape as the result of
+    ``get_available_ansys_installations``. When the discovery failed,
+    ``error`` describes the failure and ``installations`` is empty.
+    """
+
+    host: str
+    installations: Dict[int, str] = field(default_factory=dict)
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the discovery succeeded on this host."""
+        return self.error is None
+
+
+class CommandTransport:
+    """Provides a way to run a command on a host.
+
+    Subclasses implement :meth:`run`. ``python`` is the interpreter used to run
+    the discovery on the target host.
+    """
+
+    python: str = "python3"
+
+    def run(self, host: str, command: List[str], timeout: float) -> CommandResult:
+        """Run ``command`` on ``host``.
+
+        Parameters
+        ----------
+        host : str
+            Host to run the command on.
+        command : List[str]
+            Command and its arguments.
+        timeout : float
+            Time in seconds after which the command is abandoned.
+
+        Returns
+        -------
+        CommandResult
+            Exit code and output of the command.
+
+        Raises
+        ------
+        subprocess.TimeoutExpired
+            The command did not finish within ``timeout`` seconds.
+        """
+        raise Exception("This is just a base class.")
+
+
+def _run_subprocess(
+    command: List[str], timeout: float, env: Optional[Dict[str, str]] = None
+) -> CommandResult:
+    completed = subprocess.run(
+        command,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        env=env,
+        stdin=subprocess.DEVNULL,
+    )
+    return CommandResult(completed.returncode, completed.stdout, completed.stderr)
+
+
+class LocalTransport(CommandTransport):
+    """Run the command in a local subprocess, whatever the host.
+
+    Parameters
+    ----------
+    host_env : Dict[str, Dict[str, str]], optional
+        Extra environment variables per host. This can point each simulated
+        host to its own fake installation roots, for example through ``HOME``
+        or ``AWP_ROOTXXX``.
+    python : str, optional
+        Interpreter used for the discovery. Defaults to the current interpreter.
+    """
+
+    def __init__(
+        self,
+        host_env: Optional[Dict[str, Dict[str, str]]] = None,
+        python: Optional[str] = None,
+    ):
+        self.host_env = host_env or {}
+        self.python = python or sys.executable
+
+    def run(self, host: str, command: List[str], timeout: float) -> CommandResult:
+        """Run ``command`` locally with the environment configured for ``host``."""
+        env = {**os.environ, **self.host_env.get(host, {})}
+        return _run_subprocess(command, timeout, env)
+
+
+class SSHTransport(CommandTransport):
+    """Run the command on a remote host with the ``ssh`` client.
+
+    Parameters
+    ----------
+    user : str, optional
+        Remote user name. Defaults to the ``ssh`` configuration.
+    ssh_options : List[str], optional
+        Extra options passed to ``ssh``. ``BatchMode=yes`` is always set so that
+        a host asking for a password fails instead of blocking.
+    python : str, optional
+        Interpreter used for the discovery on the remote hosts.
+    ssh : str, optional
+        ``ssh`` executable.
+    """
+
+    def __init__(
+        self,
+        user: Optional[str] = None,
+        ssh_options: Optional[List[str]] = None,
+        python: str = "python3",
+        ssh: str = "ssh",
+    ):
+        self.user = user
+        self.ssh_options = ssh_options or []
+        self.python = python
+        self.ssh = ssh
+
+    def run(self, host: str, command: List[str], timeout: float) -> CommandResult:
+        """Run ``command`` on ``host`` through ``ssh``."""
+        target = f"{self.user}@{host}" if self.user else host
+        ssh_command = [
+            self.ssh,
+            "-o",
+            "BatchMode=yes",
+            *self.ssh_options,
+            target,
+            shlex.join(command),
+        ]
+        return _run_subprocess(ssh_command, timeout)
+
+
+def _discovery_command(transport: CommandTransport) -> List[str]:
+    return [transport.python, "-W", "ignore", "-c", _DISCOVERY_SCRIPT]
+
+
+def _parse_installations(output: str) -> Dict[int, str]:
+    """Parse the JSON output of the discovery script.
+
+    Raises
+    ------
+    ValueError
+        The output is not a JSON object mapping versions to paths.
+    """
+    payload = json.loads(output)
+    if not isinstance(payload, dict):
+        raise ValueError(f"expected a JSON object, got {type(payload).__name__}")
+    installations = {}
+    for ver, path in payload.items():
+        if not isinstance(path, str):
+            raise ValueError(f"expected a path for version {ver}, got {path!r}")
+        installations[int(ver)] = path
+    return installations
+
+
+def _discover_host(host: str, transport: CommandTransport, timeout: float) -> HostDiscoveryResult:
+    start = time.perf_counter()
+    try:
+        result = transport.run(host, _discovery_command(transport), timeout)
+    except subprocess.TimeoutExpired:
+        error = f"Discovery timed out after {timeout} s"
+    except OSError as e:
+        error = f"Unable to run the discovery: {e}"
+    except Exception as e:
+        # A failing transport must not end the discovery of the other hosts.
+        error = f"Discovery failed: {type(e).__name__}: {e}"
+    else:
+        if result.returncode == 0:
+            try:
+                installations = _parse_installations(result.stdout)
+            except ValueError as e:
+                error = f"Unexpected discovery output: {e}"
+            else:
+                return HostDiscoveryResult(host, installations, elapsed=time.perf_counter() - start)
+        else:
+            error = f"Discovery exited with code {result.returncode}: {result.stderr.strip()}"
+    LOG.debug(f"Discovery failed on {host}: {error}")
+    return HostDiscoveryResult(host, error=error, elapsed=time.perf_counter() - start)
+
+
+def discover_hosts(
+    hosts: Iterable[str],
+    transport: Optional[CommandTransport] = None,
+    max_workers: int = 32,
+    timeout: float = 30.0,
+) -> Iterator[HostDiscoveryResult]:
+    """Find the Ansys installations of several hosts concurrently.
+
+    Results are yielded as soon as each host answers, so their order is not the
+    order of ``hosts``. A host that fails or times out yields a result with
+    ``error`` set rather than raising.
+
+    Parameters
+    ----------
+    hosts : Iterable[str]
+        Host names.
+    transport : CommandTransport, optional
+        Transport used to run the discovery. Defaults to :class:`SSHTransport`.
+    max_workers : int, optional
+        Maximum number of hosts queried at the same time.
+    timeout : float, optional
+        Time in seconds allowed for each host.
+
+    Yields
+    ------
+    HostDiscoveryResult
+        Installations found on each host.
+
+    Examples
+    --------
+    >>> from ansys.tools.path.remote import discover_hosts
+    >>> for result in discover_hosts(["node001", "node002"], max_workers=64):
+    ...     print(result.host, result.installations or result.error)
+    node002 {251: '/ansys_inc/v251'}
+    node001 {251: '/ansys_inc/v251', 242: '/ansys_inc/v242'}
+    """
+    if transport is None:
+        transport = SSHTransport()
+    if max_workers < 1:
+        raise ValueError("'max_workers' must be at least 1.")
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [executor.submit(_discover_host, host, transport, timeout) for host in hosts]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # Do not start the remaining hosts if the caller stops iterating early.
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,211 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Lightweight resolver of Ansys executable paths for shell scripts.
+
+This is the implementation of ``python -m ansys.tools.path`` and of the
+``resolve-ansys-path`` console script. It only imports the standard library
+modules it needs and answers from the saved configuration file. The full
+discovery of :mod:`ansys.tools.path.path` is only imported when no usable path
+was saved.
+
+Examples
+--------
+Print the saved or latest MAPDL executable:
+
+.. code:: console
+
+   $ python -m ansys.tools.path
+   /ansys_inc/v251/ansys/bin/ansys251
+
+Set ``AWP_ROOTXXX`` and ``PATH`` in the current shell:
+
+.. code:: console
+
+   $ eval "$(python -m ansys.tools.path --product mapdl --export)"
+"""
+
+import argparse
+import json
+import os
+import re
+import shlex
+import sys
+from typing import List, Optional, Tuple
+
+PRODUCTS = ("mapdl", "dyna", "mechanical")
+
+STARTUP_BUDGET = 0.025
+"""Budget, in seconds, for importing the resolver and its dependencies.
+
+It is checked by the test suite through ``python -X importtime``.
+"""
+
+_VERSION_REGEX = re.compile(r"v(\d\d\d)")
+_VERSION_DIR_REGEX = re.compile(r"^v(\d\d\d)$")
+
+
+def _settings_dir() -> str:
+    """Return ``SETTINGS_DIR`` without importing ``platformdirs`` on Linux."""
+    if sys.platform.startswith("linux"):
+        # Mirrors ``platformdirs.unix.Unix.user_data_dir``, which ``SETTINGS_DIR``
+        # of ``ansys.tools.common.path`` uses: ``$XDG_DATA_HOME/<appname>``, or
+        # ``~/.local/share/<appname>`` when the variable is unset or blank.
+        data_home = os.environ.get("XDG_DATA_HOME", "")
+        if not data_home.strip():
+            data_home = os.path.expanduser("~/.local/share")
+        return os.path.join(data_home, "ansys_tools_path")
+    import platformdirs  # pragma: no cover
+
+    return platformdirs.user_data_dir(appname="ansys_tools_path", appauthor="Ansys")
+
+
+def _read_saved_path(product: str) -> Optional[str]:
+    config_file = os.path.join(_settings_dir(), "config.txt")
+    try:
+        with open(config_file) as f:
+            content = f.read()
+        return json.loads(content).get(product) if content else None
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _version_from_path(path: str) -> Optional[int]:
+    matches = _VERSION_REGEX.findall(path.replace("\\", "/"))
+    return int(matches[-1]) if matches else None
+
+
+def _installation_root(path: str) -> Optional[str]:
+    path = os.path.abspath(path)
+    while True:
+        if _VERSION_DIR_REGEX.match(os.path.basename(path)):
+            return path
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def resolve(
+    product: str = "mapdl", version: Optional[float] = None, find: bool = True
+) -> Tuple[Optional[str], str]:
+    """Return the executable of a product and where it was found.
+
+    Parameters
+    ----------
+    product : str, optional
+        ``"mapdl"``, ``"dyna"`` or ``"mechanical"``. The default is ``"mapdl"``.
+    version : float, optional
+        Version to look for, for example ``25.1``. If ``None``, the saved
+        path is used, or the latest installation.
+    find : bool, optional
+        Search the installations when the saved path cannot be used.
+
+    Returns
+    -------
+    Tuple[Optional[str], str]
+        The path (``None`` if not found) and its source, ``"config"`` or ``"find"``.
+    """
+    wanted = None if version is None else int(round(version * 10))
+    saved = _read_saved_path(product)
+    if saved and os.path.isfile(saved):
+        if wanted is None or _version_from_path(saved) == wanted:
+            return saved, "config"
+
+    if not find:
+        return None, ""
+    from ansys.tools.path.path import _find_installation
+
+    try:
+        exe_loc, _ = _find_installation(product, version)
+    except ValueError:
+        return None, ""
+    return (exe_loc or None), "find"
+
+
+def export_lines(exe_loc: str) -> List[str]:
+    """Return the shell lines exporting ``AWP_ROOTXXX`` and ``PATH`` for an executable.
+
+    Parameters
+    ----------
+    exe_loc : str
+        Path of the executable.
+
+    Returns
+    -------
+    List[str]
+        Lines to evaluate in a POSIX shell.
+    """
+    lines = []
+    root = _installation_root(exe_loc)
+    version = _version_from_path(exe_loc)
+    if root is not None and version is not None:
+        lines.append(f"export AWP_ROOT{version}={shlex.quote(root)}")
+    lines.append(f'export PATH={shlex.quote(os.path.dirname(exe_loc))}:"$PATH"')
+    return lines
+
+
+def _version_argument(value: str) -> float:
+    """Parse ``--version``, given as ``XX.Y`` (``25.1``) or ``XXY`` (``251``)."""
+    try:
+        version = float(value)
+    except ValueError:
+        version = None
+    if version is None or (version >= 100 and not version.is_integer()):
+        raise argparse.ArgumentTypeError(
+            f"invalid version {value!r}, expected for example 25.1 or 251"
+        )
+    return version / 10 if version >= 100 else version
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of ``python -m ansys.tools.path``."""
+    parser = argparse.ArgumentParser(
+        prog="python -m ansys.tools.path",
+        description="Print the path of an Ansys executable.",
+    )
+    parser.add_argument("--product", "-p", choices=PRODUCTS, default="mapdl")
+    parser.add_argument(
+        "--version", "-v", type=_version_argument, default=None, help="for example 25.1 or 251"
+    )
+    parser.add_argument(
+        "--export",
+        action="store_true",
+        help="print 'export' lines for AWP_ROOTXXX and PATH instead of the bare path",
+    )
+    parser.add_argument(
+        "--no-find",
+        action="store_true",
+        help="only use the saved configuration, never search the installations",
+    )
+    args = parser.parse_args(argv)
+
+    exe_loc, _ = resolve(args.product, args.version, find=not args.no_find)
+    if exe_loc is None:
+        print(f"No {args.product} executable found.", file=sys.stderr)
+        return 1
+    if args.export:
+        print("\n".join(export_lines(exe_loc)))
+    else:
+        print(exe_loc)
+    return 0
@@ -0,0 +1,301 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Background revalidation of the paths saved in the configuration file.
+
+``get_mapdl_path`` and the other ``get_*_path`` functions return the saved path
+immediately. A background thread then checks that the saved executables still
+exist. By default, entries pointing at removed installations are only
+reported. With :func:`set_revalidation_repair`, they are repaired with the
+latest installation providing the product, or pruned when there is none.
+Hooks registered with :func:`add_revalidation_hook` receive the changes.
+"""
+
+from dataclasses import dataclass
+import os
+import stat
+import threading
+import time
+from typing import Callable, Dict, List, Literal, Optional
+
+from ansys.tools.common.path.path import LOG
+
+from ansys.tools.path.capabilities import PRODUCTS, get_capability_matrix
+from ansys.tools.path.config import (
+    _active_transaction,
+    read_config_file,
+    transaction_in_progress,
+    update_config_file,
+)
+
+REVALIDATION_INTERVAL = 60.0
+"""Minimum time in seconds between two background revalidations of a process."""
+
+
+@dataclass(frozen=True)
+class ConfigChange:
+    """Change made to the configuration file by a revalidation."""
+
+    product: str
+    """Product of the entry, for example ``"mapdl"``."""
+
+    old_path: str
+    """Saved path that no longer exists."""
+
+    new_path: Optional[str]
+    """Replacement path, or ``None`` if the entry was removed."""
+
+    applied: bool = True
+    """Whether the change was written to the configuration file."""
+
+    @property
+    def action(self) -> Literal["repaired", "pruned"]:
+        """``"repaired"`` if the entry was replaced, ``"pruned"`` if it was removed."""
+        return "pruned" if self.new_path is None else "repaired"
+
+
+REVALIDATION_HOOK_TYPE = Callable[[List[ConfigChange]], None]
+
+_HOOKS: List[REVALIDATION_HOOK_TYPE] = []
+_STATE_LOCK = threading.Lock()
+_THREAD: Optional[threading.Thread] = None
+_LAST_RUN: Optional[float] = None
+_ENABLED = True
+_REPAIR = False
+
+
+def add_revalidation_hook(hook: REVALIDATION_HOOK_TYPE) -> None:
+    """Register a function called with the changes of each revalidation.
+
+    The hook is only called when stale entries are found. It runs in the thread doing
+    the revalidation, which is a background thread for the revalidations
+    triggered by the ``get_*_path`` functions.
+
+    Parameters
+    ----------
+    hook : Callable[[List[ConfigChange]], None]
+        Function receiving the list of changes.
+    """
+    with _STATE_LOCK:
+        _HOOKS.append(hook)
+
+
+def remove_revalidation_hook(hook: REVALIDATION_HOOK_TYPE) -> None:
+    """Unregister a function registered with :func:`add_revalidation_hook`."""
+    with _STATE_LOCK:
+        _HOOKS.remove(hook)
+
+
+def _check_saved_path(path: str) -> Optional[bool]:
+    """Return whether ``path`` is still a file, or ``None`` if this cannot be told.
+
+    A missing file is only stale when its parent directory is missing too or
+    can be listed. Any other error, for example from an unreachable network
+    mount, leaves the entry unknown.
+    """
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    except OSError:
+        return None
+    try:
+        os.stat(os.path.dirname(path))
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    except OSError:
+        return None
+    return False
+
+
+def revalidate_saved_paths(repair: Optional[bool] = None) -> List[ConfigChange]:
+    """Check the saved paths now and report, repair or prune the stale ones.
+
+    Only the ``mapdl``, ``dyna`` and ``mechanical`` entries are checked. Entries
+    whose state cannot be checked are left alone. Repairs are written in one
+    locked update of the configuration file. They are skipped while a
+    :func:`~ansys.tools.path.config_transaction` is open in another thread, so
+    that its commit does not fail.
+
+    Parameters
+    ----------
+    repair : bool, optional
+        Whether to write the changes. The default is the value set with
+        :func:`set_revalidation_repair`, which is ``False``.
+
+    Returns
+    -------
+    List[ConfigChange]
+        Changes found. Their ``applied`` attribute tells whether they were
+        written to the configuration file.
+    """
+    if repair is None:
+        repair = _REPAIR
+    config = read_config_file()
+    stale: Dict[str, str] = {}
+    for product in PRODUCTS:
+        old_path = config.get(product)
+        if old_path and _check_saved_path(old_path) is False:
+            stale[product] = old_path
+    if not stale:
+        return []
+
+    matrix = get_capability_matrix(refresh=True)
+    replacements = {product: matrix.find(product)[0] or None for product in stale}
+
+    applied: List[str] = []
+    if repair:
+        in_own_transaction = _active_transaction() is not None
+
+        def update(config: Dict[str, str]) -> Optional[Dict[str, str]]:
+            applied.clear()
+            if not in_own_transaction and transaction_in_progress():
+                LOG.debug("Repair of the saved paths skipped: a transaction is open.")
+                return None
+            for product, old_path in stale.items():
+                if config.get(product) != old_path:
+                    continue
+                if replacements[product]:
+                    config[product] = replacements[product]
+                else:
+                    del config[product]
+                applied.append(product)
+            return config if applied else None
+
+        update_config_file(update)
+
+    changes = [
+        ConfigChange(product, old_path, replacements[product], product in applied)
+        for product, old_path in stale.items()
+    ]
+    for change in changes:
+        if change.applied:
+            LOG.info(
+                f"Saved {change.product} path {change.old_path} no longer exists, "
+                + (f"replaced by {change.new_path}." if change.new_path else "removed.")
+            )
+        else:
+            LOG.warning(
+                f"Saved {change.product} path {change.old_path} no longer exists"
+                + (f", the latest installation is {change.new_path}." if change.new_path else ".")
+            )
+    with _STATE_LOCK:
+        hooks = list(_HOOKS)
+    for hook in hooks:
+        try:
+            hook(changes)
+        except Exception:
+            LOG.exception("Revalidation hook failed")
+    return changes
+
+
+def _run_revalidation() -> None:
+    try:
+        revalidate_saved_paths()
+    except Exception:
+        LOG.exception("Revalidation of the saved paths failed")
+
+
+def schedule_revalidation(force: bool = False) -> Optional[threading.Thread]:
+    """Start a background revalidation of the saved paths.
+
+    Nothing is started if a revalidation is already running, if background
+    revalidation is disabled or, unless ``force`` is set, if the last one
+    started less than :data:`REVALIDATION_INTERVAL` seconds ago.
+
+    Parameters
+    ----------
+    force : bool, optional
+        Ignore :data:`REVALIDATION_INTERVAL`.
+
+    Returns
+    -------
+    Optional[threading.Thread]
+        The started thread, if any.
+    """
+    global _THREAD, _LAST_RUN
+    with _STATE_LOCK:
+        if not _ENABLED:
+            return None
+        if _THREAD is not None and _THREAD.is_alive():
+            return None
+        now = time.monotonic()
+        if not force and _LAST_RUN is not None and now - _LAST_RUN < REVALIDATION_INTERVAL:
+            return None
+        _LAST_RUN = now
+        _THREAD = threading.Thread(
+            target=_run_revalidation, name="ansys-tools-path-revalidation", daemon=True
+        )
+        _THREAD.start()
+        return _THREAD
+
+
+def wait_for_revalidation(timeout: Optional[float] = None) -> bool:
+    """Wait for the running background revalidation, if any.
+
+    Parameters
+    ----------
+    timeout : float, optional
+        Maximum time to wait, in seconds.
+
+    Returns
+    -------
+    bool
+        ``True`` if no revalidation is running anymore.
+    """
+    with _STATE_LOCK:
+        thread = _THREAD
+    if thread is None:
+        return True
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+def set_background_revalidation(enabled: bool) -> None:
+    """Enable or disable the background revalidation triggered by the ``get_*_path`` functions.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether :func:`schedule_revalidation` starts revalidations.
+    """
+    global _ENABLED, _LAST_RUN
+    with _STATE_LOCK:
+        _ENABLED = enabled
+        _LAST_RUN = None
+
+
+def set_revalidation_repair(enabled: bool) -> None:
+    """Enable or disable the repair of stale saved paths.
+
+    When disabled, which is the default, revalidations only report the stale
+    entries and never write the configuration file.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether :func:`revalidate_saved_paths` writes its changes by default.
+    """
+    global _REPAIR
+    with _STATE_LOCK:
+        _REPAIR = enabled
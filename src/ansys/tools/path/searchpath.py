@@ -0,0 +1,182 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Discovery of Ansys executables published on ``PATH``.
+
+Some sites install wrappers such as ``ansys251`` or ``lsdyna251`` in a
+directory on ``PATH`` rather than using the standard installation roots. This
+opt-in source scans the ``PATH`` entries for the executable names of each
+product. Every directory is listed with a single ``os.scandir`` call and the
+listing is cached by the modification time of the directory, so later lookups
+cost one ``stat`` per directory.
+"""
+
+import os
+import re
+import threading
+from typing import Dict, Optional, Tuple, Union
+
+from ansys.tools.common.path.path import LOG, PRODUCT_TYPE, version_from_path
+
+PATH_EXECUTABLE_PATTERNS: Dict[str, "re.Pattern[str]"] = {
+    "mapdl": re.compile(r"^ansys(\d\d\d)(?:\.exe)?$", re.IGNORECASE),
+    "dyna": re.compile(r"^lsdyna(\d\d\d)(?:\.exe)?$", re.IGNORECASE),
+    "mechanical": re.compile(r"^(?:mechanical|ansyswbu)(\d\d\d)?(?:\.exe)?$", re.IGNORECASE),
+}
+"""Executable names looked for on ``PATH``, per product.
+
+The group captures the version when the name carries it. Otherwise the version
+is read from the real path of the executable with ``version_from_path``.
+"""
+
+DIRECTORY_FINGERPRINT_TYPE = Tuple[int, int]
+
+_CACHE_LOCK = threading.Lock()
+_LISTING_CACHE: Dict[str, Tuple[DIRECTORY_FINGERPRINT_TYPE, Tuple[str, ...]]] = {}
+
+
+def _list_path_directory(directory: str) -> Tuple[str, ...]:
+    """Return the names in ``directory``, listing it again only if it changed."""
+    try:
+        stat = os.stat(directory)
+    except OSError:
+        return ()
+    fingerprint = (stat.st_mtime_ns, stat.st_ino)
+    with _CACHE_LOCK:
+        cached = _LISTING_CACHE.get(directory)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    try:
+        with os.scandir(directory) as entries:
+            names = tuple(sorted(entry.name for entry in entries))
+    except OSError:
+        names = ()
+    with _CACHE_LOCK:
+        _LISTING_CACHE[directory] = (fingerprint, names)
+    return names
+
+
+def _version_of(product: str, name: str, path: str) -> Optional[int]:
+    match = PATH_EXECUTABLE_PATTERNS[product].match(name)
+    if match is None:
+        return None
+    if match.group(1):
+        return int(match.group(1))
+    try:
+        return version_from_path(product, os.path.realpath(path))
+    except Exception:
+        LOG.debug(f"Unable to find the version of {path} on PATH")
+        return None
+
+
+def get_path_executables(
+    product: PRODUCT_TYPE, search_path: Optional[str] = None
+) -> Dict[int, str]:
+    """Get the executables of a product found on ``PATH``.
+
+    Parameters
+    ----------
+    product : PRODUCT_TYPE
+        ``"mapdl"``, ``"dyna"`` or ``"mechanical"``.
+    search_path : str, optional
+        Directories to scan, separated by ``os.pathsep``. Defaults to the
+        ``PATH`` environment variable.
+
+    Returns
+    -------
+    Dict[int, str]
+        Executables keyed by version, newest first. When several directories
+        hold the same version, the first one in ``PATH`` order is used, as the
+        shell would.
+
+    Examples
+    --------
+    >>> from ansys.tools.path.searchpath import get_path_executables
+    >>> get_path_executables("mapdl")
+    {251: '/opt/wrappers/ansys251', 242: '/opt/wrappers/ansys242'}
+    """
+    if product not in PATH_EXECUTABLE_PATTERNS:
+        raise Exception("unexpected product")
+    if search_path is None:
+        search_path = os.environ.get("PATH", "")
+
+    executables: Dict[int, str] = {}
+    seen = set()
+    for directory in search_path.split(os.pathsep):
+        if not directory or directory in seen:
+            continue
+        seen.add(directory)
+        for name in _list_path_directory(directory):
+            if not PATH_EXECUTABLE_PATTERNS[product].match(name):
+                continue
+            path = os.path.join(directory, name)
+            if not (os.path.isfile(path) and os.access(path, os.X_OK)):
+                continue
+            version = _version_of(product, name, path)
+            if version is not None:
+                executables.setdefault(version, path)
+
+    LOG.debug(f"Found the following {product} executables on PATH: {executables}")
+    return dict(sorted(executables.items(), reverse=True))
+
+
+def find_on_path(
+    product: PRODUCT_TYPE,
+    version: Optional[Union[int, float]] = None,
+    search_path: Optional[str] = None,
+) -> Union[Tuple[str, float], Tuple[str, str]]:
+    """Find the executable of a product on ``PATH``.
+
+    Parameters
+    ----------
+    product : PRODUCT_TYPE
+        ``"mapdl"``, ``"dyna"`` or ``"mechanical"``.
+    version : Union[int, float], optional
+        Version to find, for example ``251`` or ``25.1``. Defaults to the
+        latest version found.
+    search_path : str, optional
+        Directories to scan, separated by ``os.pathsep``. Defaults to the
+        ``PATH`` environment variable.
+
+    Returns
+    -------
+    Union[Tuple[str, float], Tuple[str, str]]
+        The executable and its version as a float, or ``("", "")`` if there is
+        none, as for ``find_mapdl``.
+    """
+    executables = get_path_executables(product, search_path)
+    if not executables:
+        return "", ""
+    if not version:
+        version = next(iter(executables))
+    elif isinstance(version, float):
+        version = int(round(version * 10))
+    if version not in executables:
+        return "", ""
+    return executables[version], version / 10
+
+
+def clear_path_listing_cache() -> None:
+    """Drop the directory listings kept in memory."""
+    with _CACHE_LOCK:
+        _LISTING_CACHE.clear()
@@ -0,0 +1,332 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Node-local staging of executables kept on slow shared storage.
+
+Starting a solver from NFS on many nodes at once makes every node read the
+same files from the server. :func:`stage_executable` copies an executable and
+the files it needs to a node-local directory, for example on a local SSD, given
+as argument or with ``ANSYS_TOOLS_PATH_STAGING_DIR``. It returns the staged
+paths next to the original ones, and ``find_mapdl`` and ``find_dyna`` are not
+affected.
+
+Each entry of the staging directory holds the executable, the binary it starts
+if it is a wrapper script, and the shared libraries of the installation it
+needs, see :mod:`ansys.tools.path.preflight`. Files loaded at run time, such as
+libraries opened with ``dlopen`` or data files, cannot be detected: they must be
+declared with ``extra_files``. The files keep their location relative to the
+installation, so relative references between them still work.
+The name of an entry is derived from the fingerprints of its source files: a
+changed source gives a new entry and the old one is eventually evicted.
+
+An entry is populated once per node: the first process takes a lease, see
+:mod:`ansys.tools.path.lease`, and the others wait for it. The least recently
+used entries are evicted to keep the directory within
+``ANSYS_TOOLS_PATH_STAGING_BUDGET`` bytes.
+"""
+
+from dataclasses import dataclass
+import glob
+import json
+import os
+import random
+import shutil
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ansys.tools.common.path.path import LOG
+
+from ansys.tools.path import lease
+from ansys.tools.path.buildinfo import installation_root
+from ansys.tools.path.preflight import check_executable_dependencies
+
+STAGING_DIR_ENV = "ANSYS_TOOLS_PATH_STAGING_DIR"
+"""Environment variable giving the staging directory. Staging is off when it is unset."""
+
+STAGING_BUDGET_ENV = "ANSYS_TOOLS_PATH_STAGING_BUDGET"
+"""Environment variable giving the size budget of the staging directory, in bytes."""
+
+DEFAULT_STAGING_BUDGET = 20 * 1024**3
+"""Size budget of the staging directory when ``ANSYS_TOOLS_PATH_STAGING_BUDGET`` is unset."""
+
+ENTRY_FILE_NAME = "entry.json"
+"""File describing a complete entry. Its modification time is the last use of the entry."""
+
+SOURCE_FINGERPRINT_TYPE = Tuple[int, int]
+
+
+def get_staging_dir() -> Optional[str]:
+    """Return the staging directory, or ``None`` if staging is off."""
+    return os.environ.get(STAGING_DIR_ENV) or None
+
+
+def get_staging_budget() -> int:
+    """Return the size budget of the staging directory, in bytes."""
+    value = os.environ.get(STAGING_BUDGET_ENV)
+    if not value:
+        return DEFAULT_STAGING_BUDGET
+    try:
+        return int(value)
+    except ValueError:
+        LOG.warning(f"Invalid {STAGING_BUDGET_ENV}={value!r}, using {DEFAULT_STAGING_BUDGET}.")
+        return DEFAULT_STAGING_BUDGET
+
+
+def _source_fingerprint(path: str) -> SOURCE_FINGERPRINT_TYPE:
+    stat = os.stat(path)
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def required_files(executable: str, extra_files: Iterable[str] = ()) -> Tuple[str, List[str]]:
+    """Return the files needed to start an executable from another location.
+
+    Parameters
+    ----------
+    executable : str
+        Executable, for example the path returned by ``find_mapdl``.
+    extra_files : Iterable[str], optional
+        Other files to include, as glob patterns relative to the installation.
+        Matching directories are included with all their files.
+
+    Returns
+    -------
+    Tuple[str, List[str]]
+        Base directory of the installation, and the required files below it:
+        the executable, the binary it starts, the shared libraries of the
+        installation it needs and the ``extra_files``. System libraries are
+        left out.
+    """
+    executable = os.path.abspath(executable)
+    root = installation_root(executable) or os.path.dirname(executable)
+    report = check_executable_dependencies(executable, installation_path=root)
+    files = [executable]
+    if report.binary is not None:
+        files.append(report.binary)
+    files.extend(report.resolved.values())
+    for pattern in extra_files:
+        for match in sorted(glob.glob(os.path.join(root, pattern))):
+            if os.path.isdir(match):
+                for directory, _, names in os.walk(match):
+                    files.extend(os.path.join(directory, name) for name in sorted(names))
+            else:
+                files.append(match)
+    inside = [
+        os.path.abspath(path)
+        for path in files
+        if os.path.commonpath([root, os.path.abspath(path)]) == root
+    ]
+    return root, list(dict.fromkeys(inside))
+
+
+@dataclass(frozen=True)
+class StagedExecutable:
+    """Executable copied to the staging directory by :func:`stage_executable`."""
+
+    source: str
+    """Original executable."""
+    source_root: str
+    """Base directory of the original installation."""
+    path: str
+    """Staged copy of the executable."""
+    root: str
+    """Base directory of the staged installation. It only holds the staged files."""
+    files: Tuple[str, ...]
+    """Staged files, relative to :attr:`root`."""
+
+
+def _read_entry(entry_dir: str) -> Optional[Dict]:
+    try:
+        with open(os.path.join(entry_dir, ENTRY_FILE_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _remove_tree(path: str) -> None:
+    """Remove a directory, renaming it first so that it disappears atomically."""
+    tombstone = f"{path}.{os.getpid()}.stale"
+    try:
+        os.rename(path, tombstone)
+    except OSError:
+        return
+    shutil.rmtree(tombstone, ignore_errors=True)
+
+
+def evict(staging_dir: str, budget: int, keep: Tuple[str, ...] = ()) -> List[str]:
+    """Remove the least recently used entries until the directory fits the budget.
+
+    Parameters
+    ----------
+    staging_dir : str
+        Staging directory.
+    budget : int
+        Size budget, in bytes.
+    keep : Tuple[str, ...], optional
+        Keys of the entries that must not be removed.
+
+    Returns
+    -------
+    List[str]
+        Keys of the removed entries.
+    """
+    entries = []
+    for name in os.listdir(staging_dir):
+        entry_dir = os.path.join(staging_dir, name)
+        entry = _read_entry(entry_dir)
+        if entry is None:
+            continue
+        try:
+            last_used = os.stat(os.path.join(entry_dir, ENTRY_FILE_NAME)).st_mtime
+        except OSError:
+            continue
+        entries.append((last_used, name, entry.get("size", 0)))
+
+    total = sum(size for _, _, size in entries)
+    removed = []
+    for _, name, size in sorted(entries):
+        if total <= budget:
+            break
+        if name in keep:
+            continue
+        LOG.debug(f"Evicting staged entry {name} ({size} bytes)")
+        _remove_tree(os.path.join(staging_dir, name))
+        removed.append(name)
+        total -= size
+    return removed
+
+
+def _populate(staging_dir: str, key: str, root: str, files: List[str], size: int) -> None:
+    """Copy ``files`` into a new entry, made visible in one rename."""
+    tmp_dir = os.path.join(staging_dir, f".{key}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    base = os.path.dirname(root)
+    try:
+        for path in files:
+            target = os.path.join(tmp_dir, os.path.relpath(path, base))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copy2(path, target)
+        with open(os.path.join(tmp_dir, ENTRY_FILE_NAME), "w") as f:
+            json.dump({"root": root, "files": files, "size": size}, f)
+        os.rename(tmp_dir, os.path.join(staging_dir, key))
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+
+def stage_executable(
+    executable: str,
+    extra_files: Iterable[str] = (),
+    staging_dir: Optional[str] = None,
+    budget: Optional[int] = None,
+    wait_timeout: float = lease.WAIT_TIMEOUT,
+) -> Optional[StagedExecutable]:
+    """Copy an executable and the files it needs to the staging directory.
+
+    The staged entry only holds the files of :func:`required_files`. Wrapper
+    scripts such as ``ansysXYZ`` or ``lsdynaXYZ`` may look for other files next
+    to them: declare those with ``extra_files``, and keep the original path at
+    hand to fall back to.
+
+    Parameters
+    ----------
+    executable : str
+        Executable to stage, for example the path returned by ``find_mapdl``.
+    extra_files : Iterable[str], optional
+        Other files to stage, as glob patterns relative to the installation.
+    staging_dir : str, optional
+        Staging directory. Defaults to ``ANSYS_TOOLS_PATH_STAGING_DIR``.
+    budget : int, optional
+        Size budget of the staging directory, in bytes. Defaults to
+        ``ANSYS_TOOLS_PATH_STAGING_BUDGET``.
+    wait_timeout : float, optional
+        Maximum time spent waiting for another process staging the same files.
+
+    Returns
+    -------
+    Optional[StagedExecutable]
+        The staged executable, or ``None`` if staging is off or failed.
+
+    Examples
+    --------
+    >>> from ansys.tools.path import find_mapdl
+    >>> from ansys.tools.path.staging import stage_executable
+    >>> exe_loc, _ = find_mapdl()
+    >>> staged = stage_executable(exe_loc, extra_files=["ansys/apdl"], staging_dir="/tmp/ansys")
+    >>> staged.path if staged else exe_loc
+    '/tmp/ansys/3f2a.../v251/ansys/bin/ansys251'
+    """
+    staging_dir = staging_dir or get_staging_dir()
+    if staging_dir is None or not executable:
+        return None
+    if budget is None:
+        budget = get_staging_budget()
+
+    try:
+        root, files = required_files(executable, extra_files)
+        fingerprints = [_source_fingerprint(path) for path in files]
+    except OSError as e:
+        LOG.debug(f"Not staging {executable}: {e}")
+        return None
+    size = sum(file_size for file_size, _ in fingerprints)
+    if size > budget:
+        LOG.debug(f"Not staging {executable}: {size} bytes exceed the budget of {budget}")
+        return None
+
+    key = lease.cache_key("staging", root, files, fingerprints)
+    entry_dir = os.path.join(staging_dir, key)
+    base = os.path.dirname(root)
+    staged = StagedExecutable(
+        source=os.path.abspath(executable),
+        source_root=root,
+        path=os.path.join(entry_dir, os.path.relpath(os.path.abspath(executable), base)),
+        root=os.path.join(entry_dir, os.path.relpath(root, base)),
+        files=tuple(os.path.relpath(path, root) for path in files),
+    )
+    entry_lease = lease.Lease(os.path.join(staging_dir, f"{key}.lease"))
+    deadline = time.monotonic() + wait_timeout
+    backoff = lease.INITIAL_BACKOFF
+    try:
+        os.makedirs(staging_dir, exist_ok=True)
+        while True:
+            if _read_entry(entry_dir) is not None:
+                os.utime(os.path.join(entry_dir, ENTRY_FILE_NAME))
+                return staged
+            if entry_lease.acquire():
+                try:
+                    if _read_entry(entry_dir) is None:
+                        LOG.debug(f"Staging {len(files)} files of {executable} in {entry_dir}")
+                        _populate(staging_dir, key, root, files, size)
+                        evict(staging_dir, budget, keep=(key,))
+                    return staged
+                finally:
+                    entry_lease.release()
+            if entry_lease.break_stale():
+                continue
+            if time.monotonic() > deadline:
+                LOG.debug(f"Gave up waiting for {entry_lease.path}")
+                return None
+            time.sleep(backoff * random.uniform(0.5, 1.5))
+            backoff = min(backoff * 2, lease.MAX_BACKOFF)
+    except OSError as e:
+        LOG.debug(f"Unable to stage {executable} in {staging_dir}: {e}")
+        return None
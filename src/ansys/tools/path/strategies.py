@@ -0,0 +1,393 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Ordered chain of the strategies used to resolve an executable.
+
+Each source of executable paths (the configuration file, the ``AWP_ROOTXXX``
+variables, the modulefiles, ``PATH``, the installation roots, or a custom
+function) is a named :class:`ResolutionStrategy` with a relative cost. A
+:class:`StrategyChain` tries its strategies from the cheapest to the most
+expensive and stops at the first answer. The chain used by the ``get_*_path``
+functions can be changed globally with :func:`set_default_strategies` or per
+call with :func:`resolve_executable`.
+
+The default chain is ``("config", "filesystem")``, which is the historical
+behavior: the filesystem strategy already merges the ``AWP_ROOTXXX`` variables
+with the installation roots. The other strategies are opt-in.
+"""
+
+from dataclasses import dataclass, field
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+from ansys.tools.common.path.path import LOG, SUPPORTED_ANSYS_VERSIONS, version_from_path
+
+from ansys.tools.path import probes
+from ansys.tools.path.capabilities import PRODUCTS, get_capability_matrix, scan_installation
+from ansys.tools.path.config import read_config_file
+from ansys.tools.path.modules import get_modulefile_installations
+from ansys.tools.path.searchpath import find_on_path
+
+VERSION_TYPE = Optional[Union[int, float]]
+
+
+def _version_key(version: VERSION_TYPE) -> Optional[int]:
+    """Return ``version`` as an integer such as ``251``, or ``None``."""
+    if not version:
+        return None
+    if isinstance(version, float):
+        return int(round(version * 10))
+    return int(version)
+
+
+class ResolutionStrategy:
+    """Provides a source of executable paths for a :class:`StrategyChain`."""
+
+    name: str = ""
+    """Name of the strategy, used to select it in a chain."""
+
+    cost: float = 0.0
+    """Relative cost. Cheaper strategies are tried first."""
+
+    def resolve(self, product: str, version: Optional[int]) -> Optional[str]:
+        """Return the executable of ``product``, or ``None`` if this source has none.
+
+        Parameters
+        ----------
+        product : str
+            Product name, for example ``"mapdl"``.
+        version : int, optional
+            Requested version, for example ``251``, or ``None`` for the latest.
+        """
+        raise Exception("This is just a base class.")
+
+
+class ConfigStrategy(ResolutionStrategy):
+    """Path saved in the configuration file with ``save_*_path``."""
+
+    name = "config"
+    cost = 1.0
+
+    def resolve(self, product: str, version: Optional[int]) -> Optional[str]:
+        exe_loc = read_config_file().get(product)
+        if exe_loc is None or version is None:
+            return exe_loc
+        try:
+            saved_version = version_from_path(product, exe_loc)
+        except Exception:
+            saved_version = None
+        if saved_version == version:
+            return exe_loc
+        LOG.debug(
+            f"Application {product} requested version {version} does not match with "
+            f"{saved_version} in config file."
+        )
+        return None
+
+
+def _installation_executable(product: str, installations: Dict[int, str], version: Optional[int]):
+    """Return the executable of the requested, or latest, installation providing ``product``."""
+    if product not in PRODUCTS:
+        return None
+    versions = [version] if version is not None else sorted(installations, reverse=True)
+    for ver in versions:
+        if ver not in installations:
+            continue
+        exe_loc = scan_installation(ver, installations[ver]).executables.get(product)
+        if exe_loc is not None:
+            return exe_loc
+    return None
+
+
+class EnvStrategy(ResolutionStrategy):
+    """Installations given by the ``AWP_ROOTXXX`` environment variables."""
+
+    name = "env"
+    cost = 2.0
+
+    def resolve(self, product: str, version: Optional[int]) -> Optional[str]:
+        installations = {}
+        for ver in SUPPORTED_ANSYS_VERSIONS:
+            root = os.environ.get(f"AWP_ROOT{ver}")
+            info = probes.stat(root) if root else None
+            if info is not None and info.is_dir:
+                installations[ver] = root
+        return _installation_executable(product, installations, version)
+
+
+class ModulefileStrategy(ResolutionStrategy):
+    """Installations published as environment modules in ``MODULEPATH``."""
+
+    name = "modulefile"
+    cost = 3.0
+
+    def resolve(self, product: str, version: Optional[int]) -> Optional[str]:
+        return _installation_executable(product, get_modulefile_installations(), version)
+
+
+class SearchPathStrategy(ResolutionStrategy):
+    """Executables found in the ``PATH`` directories."""
+
+    name = "path"
+    cost = 5.0
+
+    def resolve(self, product: str, version: Optional[int]) -> Optional[str]:
+        if product not in PRODUCTS:
+            return None
+        exe_loc, _ = find_on_path(product, version)
+        return exe_loc or None
+
+
+class FilesystemStrategy(ResolutionStrategy):
+    """Installations found in the default roots and ``AWP_ROOTXXX`` variables."""
+
+    name = "filesystem"
+    cost = 10.0
+
+    def resolve(self, product: str, version: Optional[int]) -> Optional[str]:
+        if product not in PRODUCTS:
+            return None
+        try:
+            exe_loc, _ = get_capability_matrix().find(product, version)
+        except ValueError:
+            return None
+        info = probes.stat(exe_loc) if exe_loc else None
+        if info is not None and info.is_file:
+            return exe_loc
+        return None
+
+
+class CallableStrategy(ResolutionStrategy):
+    """Custom strategy calling a function.
+
+    Parameters
+    ----------
+    name : str
+        Name of the strategy.
+    function : Callable[[str, Optional[int]], Optional[str]]
+        Function receiving the product and the requested version and returning
+        the executable, or ``None``.
+    cost : float, optional
+        Relative cost. Defaults to ``5.0``.
+    """
+
+    def __init__(
+        self, name: str, function: Callable[[str, Optional[int]], Optional[str]], cost: float = 5.0
+    ):
+        self.name = name
+        self.cost = cost
+        self._function = function
+
+    def resolve(self, product: str, version: Optional[int]) -> Optional[str]:
+        return self._function(product, version)
+
+
+@dataclass
+class Resolution:
+    """Outcome of :meth:`StrategyChain.resolve`."""
+
+    product: str
+    """Resolved product."""
+
+    path: Optional[str] = None
+    """Executable found, or ``None``."""
+
+    strategy: Optional[str] = None
+    """Name of the strategy that answered, or ``None``."""
+
+    timings: Dict[str, float] = field(default_factory=dict)
+    """Time spent in each strategy that was tried, in seconds, in the order they were tried."""
+
+
+STRATEGY_TYPE = Union[str, ResolutionStrategy]
+
+_REGISTRY_LOCK = threading.Lock()
+_REGISTRY: Dict[str, ResolutionStrategy] = {
+    strategy.name: strategy
+    for strategy in (
+        ConfigStrategy(),
+        EnvStrategy(),
+        ModulefileStrategy(),
+        SearchPathStrategy(),
+        FilesystemStrategy(),
+    )
+}
+_DEFAULT_STRATEGIES: List[str] = ["config", "filesystem"]
+
+
+def register_strategy(strategy: ResolutionStrategy) -> None:
+    """Make a strategy selectable by name, replacing any strategy with the same name.
+
+    Parameters
+    ----------
+    strategy : ResolutionStrategy
+        Strategy to register.
+    """
+    with _REGISTRY_LOCK:
+        _REGISTRY[strategy.name] = strategy
+
+
+def get_strategy(name: str) -> ResolutionStrategy:
+    """Return the registered strategy called ``name``."""
+    with _REGISTRY_LOCK:
+        try:
+            return _REGISTRY[name]
+        except KeyError:
+            raise ValueError(
+                f"Unknown resolution strategy {name!r}. "
+                f"Available strategies are {sorted(_REGISTRY)}."
+            ) from None
+
+
+class StrategyChain:
+    """Strategies tried from the cheapest to the most expensive, stopping at the first answer.
+
+    Parameters
+    ----------
+    strategies : Iterable[Union[str, ResolutionStrategy]]
+        Strategies or names of registered strategies. Strategies of equal cost
+        keep their order.
+    max_cost : float, optional
+        Skip the strategies more expensive than this.
+    """
+
+    def __init__(self, strategies: Iterable[STRATEGY_TYPE], max_cost: Optional[float] = None):
+        resolved = [get_strategy(s) if isinstance(s, str) else s for s in strategies]
+        if max_cost is not None:
+            resolved = [strategy for strategy in resolved if strategy.cost <= max_cost]
+        self.strategies: List[ResolutionStrategy] = sorted(resolved, key=lambda s: s.cost)
+
+    @property
+    def names(self) -> List[str]:
+        """Names of the strategies, in the order they are tried."""
+        return [strategy.name for strategy in self.strategies]
+
+    def resolve(self, product: str, version: VERSION_TYPE = None) -> Resolution:
+        """Try the strategies in order and return the first answer.
+
+        Parameters
+        ----------
+        product : str
+            Product name, for example ``"mapdl"``.
+        version : Union[int, float], optional
+            Requested version, for example ``251`` or ``25.1``. Defaults to the
+            latest version.
+
+        Returns
+        -------
+        Resolution
+            Executable found, strategy that found it and time spent in each
+            strategy.
+        """
+        resolution = Resolution(product)
+        key = _version_key(version)
+        for strategy in self.strategies:
+            start = time.perf_counter()
+            try:
+                exe_loc = strategy.resolve(product, key)
+            finally:
+                resolution.timings[strategy.name] = time.perf_counter() - start
+            if exe_loc:
+                resolution.path = exe_loc
+                resolution.strategy = strategy.name
+                break
+        LOG.debug(
+            f"Resolved {product} to {resolution.path} with strategy {resolution.strategy}, "
+            f"timings: {resolution.timings}"
+        )
+        return resolution
+
+
+def set_default_strategies(strategies: Sequence[STRATEGY_TYPE]) -> None:
+    """Change the strategies used by the ``get_*_path`` functions.
+
+    Parameters
+    ----------
+    strategies : Sequence[Union[str, ResolutionStrategy]]
+        Strategies or names of strategies. Strategy objects are registered.
+
+    Examples
+    --------
+    Also look for executables on ``PATH``, and never scan the filesystem:
+
+    >>> from ansys.tools.path.strategies import set_default_strategies
+    >>> set_default_strategies(["config", "env", "path"])
+    """
+    names = []
+    for strategy in strategies:
+        if not isinstance(strategy, str):
+            register_strategy(strategy)
+            strategy = strategy.name
+        get_strategy(strategy)
+        names.append(strategy)
+    with _REGISTRY_LOCK:
+        _DEFAULT_STRATEGIES[:] = names
+
+
+def get_default_strategies() -> List[str]:
+    """Return the names of the strategies used by the ``get_*_path`` functions."""
+    with _REGISTRY_LOCK:
+        return list(_DEFAULT_STRATEGIES)
+
+
+def resolve_executable(
+    product: str,
+    version: VERSION_TYPE = None,
+    strategies: Optional[Sequence[STRATEGY_TYPE]] = None,
+    max_cost: Optional[float] = None,
+) -> Resolution:
+    """Resolve the executable of a product with a chain of strategies.
+
+    Parameters
+    ----------
+    product : str
+        Product name, for example ``"mapdl"``.
+    version : Union[int, float], optional
+        Requested version, for example ``251`` or ``25.1``. Defaults to the
+        latest version.
+    strategies : Sequence[Union[str, ResolutionStrategy]], optional
+        Strategies to use for this call. Defaults to the strategies set with
+        :func:`set_default_strategies`.
+    max_cost : float, optional
+        Skip the strategies more expensive than this.
+
+    Returns
+    -------
+    Resolution
+        Executable found, strategy that found it and time spent in each
+        strategy.
+
+    Examples
+    --------
+    >>> from ansys.tools.path.strategies import resolve_executable
+    >>> resolution = resolve_executable("mapdl", 25.1, strategies=["env", "filesystem"])
+    >>> resolution.path, resolution.strategy
+    ('/usr/ansys_inc/v251/ansys/bin/ansys251', 'env')
+    >>> resolution.timings
+    {'env': 0.00012}
+    """
+    if strategies is None:
+        strategies = get_default_strategies()
+    return StrategyChain(strategies, max_cost).resolve(product, version)
@@ -0,0 +1,220 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Matrix of executable targets for regression runs, and its sharding.
+
+:func:`get_executable_targets` lists every ``(product, version)`` pair that is
+installed, as :class:`ExecutableTarget` records. It is derived from the
+capability matrix, which is computed once per process and shared between
+processes through the cache directory of :mod:`ansys.tools.path.lease`. Each
+executable is confirmed by the application plugin of its product.
+
+:func:`shard` splits the targets deterministically across parallel workers.
+
+Examples
+--------
+Parametrize a test with all targets. With pytest-xdist, the parametrized tests
+are distributed across the nodes as usual.
+
+>>> import pytest
+>>> from ansys.tools.path.targets import get_executable_targets
+>>> TARGETS = get_executable_targets(["mapdl", "dyna"])
+>>> @pytest.mark.parametrize("target", TARGETS, ids=[t.id for t in TARGETS])
+... def test_model(target):
+...     run_model(target.path)
+
+Run the share of a worker started with ``ANSYS_TOOLS_PATH_SHARD=2/4``.
+
+>>> from ansys.tools.path.targets import get_shard_spec, shard
+>>> for target in shard(get_executable_targets(), *get_shard_spec()):
+...     run_model(target.path)
+"""
+
+from dataclasses import dataclass
+import hashlib
+import os
+import re
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from ansys.tools.common.path.path import (
+    PLUGINS,
+    SUPPORTED_ANSYS_VERSIONS,
+    SUPPORTED_VERSIONS_TYPE,
+    is_valid_executable_path,
+)
+
+from ansys.tools.path.capabilities import PRODUCTS, get_capability_matrix
+
+SHARD_ENV = "ANSYS_TOOLS_PATH_SHARD"
+"""Environment variable giving the shard of the current worker as ``INDEX/COUNT``, from ``1``."""
+
+
+@dataclass(frozen=True)
+class ExecutableTarget:
+    """One installed ``(product, version)`` pair."""
+
+    product: str
+    """``"mapdl"``, ``"dyna"`` or ``"mechanical"``."""
+    version: int
+    """Version of the installation, for example ``251``."""
+    student: bool
+    """Whether the installation is a student version."""
+    path: str
+    """Full path of the executable."""
+    installation: str
+    """Base path of the installation."""
+
+    @property
+    def version_float(self) -> float:
+        """Version as a float, for example ``25.1``."""
+        return self.version / 10
+
+    @property
+    def id(self) -> str:
+        """Stable identifier, for example ``"mapdl-251"`` or ``"mapdl-251-student"``."""
+        return f"{self.product}-{self.version}" + ("-student" if self.student else "")
+
+
+def get_executable_targets(
+    products: Optional[Iterable[str]] = None,
+    supported_versions: SUPPORTED_VERSIONS_TYPE = SUPPORTED_ANSYS_VERSIONS,
+    include_student: bool = True,
+) -> Tuple[ExecutableTarget, ...]:
+    """Return every installed executable target.
+
+    Parameters
+    ----------
+    products : Iterable[str], optional
+        Products to include. Defaults to all products with an application plugin.
+    supported_versions : SUPPORTED_VERSIONS_TYPE, optional
+        Supported Ansys versions. Defaults to ``SUPPORTED_ANSYS_VERSIONS``.
+    include_student : bool, optional
+        Include the student installations.
+
+    Returns
+    -------
+    Tuple[ExecutableTarget, ...]
+        Targets sorted by product, then by version from the latest, regular
+        installations before student ones. The order is the same on every
+        machine with the same installations.
+
+    Raises
+    ------
+    ValueError
+        A product is unknown.
+    """
+    if products is None:
+        products = [product for product in PRODUCTS if product in PLUGINS]
+    products = list(products)
+    for product in products:
+        if product not in PRODUCTS or product not in PLUGINS:
+            raise ValueError(f"Unknown product {product!r}. Use one of {list(PRODUCTS)}.")
+
+    installations = get_capability_matrix(supported_versions).installations
+    targets: List[ExecutableTarget] = []
+    for product in sorted(products, key=PRODUCTS.index):
+        for key in sorted(installations, key=lambda ver: (ver < 0, -abs(ver))):
+            installation = installations[key]
+            if installation.student and not include_student:
+                continue
+            path = installation.executables.get(product)
+            if path is None or not is_valid_executable_path(product, path):
+                continue
+            targets.append(
+                ExecutableTarget(
+                    product, installation.version, installation.student, path, installation.path
+                )
+            )
+    return tuple(targets)
+
+
+def _stable_hash(target: ExecutableTarget) -> int:
+    return int.from_bytes(hashlib.sha256(target.id.encode()).digest()[:8], "big")
+
+
+def shard(
+    targets: Sequence[ExecutableTarget], index: int, count: int, stable: bool = False
+) -> List[ExecutableTarget]:
+    """Return the targets assigned to one of ``count`` workers.
+
+    Every target is assigned to exactly one worker, and all workers compute the
+    same assignment from the same targets.
+
+    Parameters
+    ----------
+    targets : Sequence[ExecutableTarget]
+        Targets to split, usually the result of :func:`get_executable_targets`.
+    index : int
+        Index of the worker, from ``0`` to ``count - 1``.
+    count : int
+        Number of workers.
+    stable : bool, optional
+        Assign each target by a hash of its :attr:`~ExecutableTarget.id`
+        instead of round-robin. Shards are then less balanced, but a target
+        stays on the same worker when installations are added or removed.
+
+    Returns
+    -------
+    List[ExecutableTarget]
+        Targets of the worker, in the order of ``targets``.
+
+    Raises
+    ------
+    ValueError
+        ``index`` is not a valid worker index.
+    """
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard {index} of {count}.")
+    if stable:
+        return [target for target in targets if _stable_hash(target) % count == index]
+    return list(targets[index::count])
+
+
+def get_shard_spec() -> Tuple[int, int]:
+    """Return the ``(index, count)`` shard of the current worker.
+
+    ``ANSYS_TOOLS_PATH_SHARD``, for example ``2/4`` for the second of four
+    workers, is used first. Otherwise, inside a pytest-xdist node, the node
+    index and the number of nodes are used. Otherwise the single shard
+    ``(0, 1)`` is returned.
+
+    With pytest-xdist, every node must collect the same tests. Use this shard
+    inside a test or a fixture, not to select the parametrized targets.
+
+    Raises
+    ------
+    ValueError
+        ``ANSYS_TOOLS_PATH_SHARD`` is invalid.
+    """
+    value = os.environ.get(SHARD_ENV)
+    if value:
+        match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", value)
+        if match is None or not 1 <= int(match.group(1)) <= int(match.group(2)):
+            raise ValueError(f"Invalid {SHARD_ENV}={value!r}. Use INDEX/COUNT, for example 1/4.")
+        return int(match.group(1)) - 1, int(match.group(2))
+
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    count = os.environ.get("PYTEST_XDIST_WORKER_COUNT")
+    if worker.startswith("gw") and worker[2:].isdigit() and count and count.isdigit():
+        return int(worker[2:]), int(count)
+    return 0, 1
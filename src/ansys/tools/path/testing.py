@@ -0,0 +1,338 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Synthetic Ansys installation trees for tests and benchmarks.
+
+The functions in this module create realistic Linux installation layouts of any
+size: many versions, student variants, partial installations, symlinked roots
+and broken executables. Only ``os`` calls are used, so the trees can be created
+in a real temporary directory or in a `pyfakefs <https://pytest-pyfakefs.readthedocs.io>`_
+fake filesystem alike.
+
+Examples
+--------
+>>> from ansys.tools.path.testing import create_installation_tree
+>>> tree = create_installation_tree("/ansys_inc", versions=20, student_versions=[251])
+>>> tree.expected_installations()[251]
+'/ansys_inc/v251'
+"""
+
+from dataclasses import dataclass, field
+import os
+from typing import Dict, Iterable, List, Literal, Mapping, Optional, Sequence, Tuple, Union
+
+PRODUCTS = ("mapdl", "dyna", "mechanical")
+
+BROKEN_KIND_TYPE = Literal["dangling", "not-executable", "empty"]
+BROKEN_KINDS = ("dangling", "not-executable", "empty")
+"""Ways an executable can be broken.
+
+* ``"dangling"``: symbolic link to a file that does not exist.
+* ``"not-executable"``: regular file without execute permission.
+* ``"empty"``: empty file with execute permission.
+
+Like ``ansys-tools-common``, the discovery only checks that the executables
+exist: the ``"not-executable"`` and ``"empty"`` kinds are still reported.
+"""
+
+STUDENT_DIRECTORY = "ANSYS Student"
+
+
+def executable_relative_path(product: str, version: int) -> Tuple[str, ...]:
+    """Return the location of the executable of a product, relative to the installation.
+
+    Parameters
+    ----------
+    product : str
+        ``"mapdl"``, ``"dyna"`` or ``"mechanical"``.
+    version : int
+        Version of the installation, for example ``251``.
+
+    Returns
+    -------
+    Tuple[str, ...]
+        Path components of the executable.
+    """
+    if product == "mapdl":
+        return ("ansys", "bin", f"ansys{version}")
+    if product == "dyna":
+        return ("ansys", "bin", f"lsdyna{version}")
+    if product == "mechanical":
+        return ("aisol", ".workbench")
+    raise ValueError(f"Unknown product {product!r}, expected one of {PRODUCTS}.")
+
+
+def synthetic_versions(count: int, latest: int = 252) -> List[int]:
+    """Return ``count`` distinct versions, newest first.
+
+    Real releases (``R1`` and ``R2`` of each year) are used first. Larger counts
+    also use the other release digits.
+
+    Parameters
+    ----------
+    count : int
+        Number of versions.
+    latest : int, optional
+        Newest version. Defaults to ``252``.
+
+    Returns
+    -------
+    List[int]
+        The versions, in decreasing order.
+    """
+    versions = [ver for ver in range(latest, 100, -1) if ver % 10 in (1, 2)]
+    if count > len(versions):
+        versions = [ver for ver in range(latest, 100, -1) if ver % 10]
+    if count > len(versions):
+        raise ValueError(f"Cannot generate more than {len(versions)} versions up to {latest}.")
+    return versions[:count]
+
+
+@dataclass
+class SyntheticInstallation:
+    """One installation created by :func:`create_installation`."""
+
+    version: int
+    """Version of the installation, negative for student versions."""
+
+    path: str
+    """Installation directory, for example ``/ansys_inc/v251``."""
+
+    executables: Dict[str, str] = field(default_factory=dict)
+    """Working executables, keyed by product."""
+
+    broken: Dict[str, str] = field(default_factory=dict)
+    """Broken executables, keyed by product."""
+
+    broken_kind: BROKEN_KIND_TYPE = "dangling"
+    """How the executables in ``broken`` are broken. One of :data:`BROKEN_KINDS`."""
+
+    @property
+    def reported_executables(self) -> Dict[str, str]:
+        """Executables reported by the discovery, keyed by product.
+
+        This includes the broken executables that are not dangling links.
+        """
+        if self.broken_kind == "dangling":
+            return dict(self.executables)
+        return {**self.broken, **self.executables}
+
+    @property
+    def student(self) -> bool:
+        """Whether this is a student installation."""
+        return self.version < 0
+
+
+@dataclass
+class SyntheticTree:
+    """Installation tree created by :func:`create_installation_tree`."""
+
+    root: str
+    """Directory holding the installations."""
+
+    installations: Dict[int, SyntheticInstallation] = field(default_factory=dict)
+    """Installations keyed by version. Student versions have negative keys."""
+
+    aliases: List[str] = field(default_factory=list)
+    """Symbolic links pointing to ``root``."""
+
+    def expected_installations(self) -> Dict[int, str]:
+        """Return the result expected from ``get_available_ansys_installations``.
+
+        This assumes that ``root`` is the first existing default root and that no
+        ``AWP_ROOTXXX`` variable is set.
+        """
+        regular = {ver: inst.path for ver, inst in self.installations.items() if ver > 0}
+        student = {ver: inst.path for ver, inst in self.installations.items() if ver < 0}
+        return {**regular, **student}
+
+    def expected_executable(self, product: str, version: Optional[int] = None) -> Optional[str]:
+        """Return the executable of a product reported by the discovery, or ``None``.
+
+        Without ``version``, the installation providing the product with the
+        highest version key is used, as in ``find_mapdl``. Regular installations
+        therefore win over student ones. See :data:`BROKEN_KINDS` for the broken
+        executables that are reported.
+        """
+        if version is None:
+            candidates = [
+                ver
+                for ver, inst in self.installations.items()
+                if product in inst.reported_executables
+            ]
+            if not candidates:
+                return None
+            version = max(candidates)
+        installation = self.installations.get(version)
+        if installation is None:
+            return None
+        return installation.reported_executables.get(product)
+
+
+def _write_file(path: str, content: str, mode: int) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+    os.chmod(path, mode)
+
+
+def _executable_script(product: str, version: int) -> str:
+    release = f"20{abs(version) // 10:02d} R{abs(version) % 10}"
+    return f"#!/bin/sh\n# Synthetic {product} executable, Ansys {release}\nexit 0\n"
+
+
+def _create_broken(path: str, kind: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if kind == "dangling":
+        os.symlink(path + ".missing", path)
+    elif kind == "not-executable":
+        _write_file(path, "#!/bin/sh\nexit 0\n", 0o644)
+    elif kind == "empty":
+        _write_file(path, "", 0o755)
+    else:
+        raise ValueError(
+            f"Unknown kind of broken executable {kind!r}, expected one of {BROKEN_KINDS}."
+        )
+
+
+def create_installation(
+    root: str,
+    version: int,
+    products: Iterable[str] = PRODUCTS,
+    student: bool = False,
+    broken: Iterable[str] = (),
+    broken_kind: BROKEN_KIND_TYPE = "dangling",
+    build_info: bool = True,
+) -> SyntheticInstallation:
+    """Create one installation.
+
+    Parameters
+    ----------
+    root : str
+        Directory holding the installations, for example ``/ansys_inc``.
+    version : int
+        Version of the installation, for example ``251``.
+    products : Iterable[str], optional
+        Products with a working executable. Defaults to all products.
+    student : bool, optional
+        Create the installation in the ``ANSYS Student`` directory.
+    broken : Iterable[str], optional
+        Products with a broken executable.
+    broken_kind : str, optional
+        How the executables in ``broken`` are broken. One of :data:`BROKEN_KINDS`.
+    build_info : bool, optional
+        Write a ``builddate.txt`` file in the installation.
+
+    Returns
+    -------
+    SyntheticInstallation
+        Description of the installation.
+    """
+    version = abs(version)
+    base = os.path.join(root, STUDENT_DIRECTORY) if student else root
+    path = os.path.join(base, f"v{version}")
+    os.makedirs(path, exist_ok=True)
+    installation = SyntheticInstallation(
+        -version if student else version, path, broken_kind=broken_kind
+    )
+
+    for product in products:
+        exe = os.path.join(path, *executable_relative_path(product, version))
+        _write_file(exe, _executable_script(product, version), 0o755)
+        installation.executables[product] = exe
+    for product in broken:
+        exe = os.path.join(path, *executable_relative_path(product, version))
+        _create_broken(exe, broken_kind)
+        installation.broken[product] = exe
+
+    if build_info:
+        release = f"20{version // 10:02d} R{version % 10}"
+        _write_file(
+            os.path.join(path, "builddate.txt"),
+            f"Ansys {release}\nBuild Date: 20{version // 10:02d}-01-01\n",
+            0o644,
+        )
+    return installation
+
+
+def create_installation_tree(
+    root: str = "/ansys_inc",
+    versions: Union[int, Sequence[int]] = 5,
+    student_versions: Iterable[int] = (),
+    partial: Optional[Mapping[int, Iterable[str]]] = None,
+    broken: Optional[Mapping[int, Iterable[str]]] = None,
+    broken_kind: BROKEN_KIND_TYPE = "dangling",
+    aliases: Iterable[str] = (),
+) -> SyntheticTree:
+    """Create a tree of installations.
+
+    Parameters
+    ----------
+    root : str, optional
+        Directory holding the installations. Defaults to ``/ansys_inc``.
+    versions : Union[int, Sequence[int]], optional
+        Number of regular installations, or their versions. Defaults to ``5``.
+    student_versions : Iterable[int], optional
+        Versions installed in the ``ANSYS Student`` directory.
+    partial : Mapping[int, Iterable[str]], optional
+        Products of the installations that do not provide all products. Student
+        installations use negative keys.
+    broken : Mapping[int, Iterable[str]], optional
+        Products with a broken executable, per installation.
+    broken_kind : str, optional
+        How the executables in ``broken`` are broken. One of :data:`BROKEN_KINDS`.
+    aliases : Iterable[str], optional
+        Symbolic links to create, pointing to ``root``. For example,
+        ``["/usr/ansys_inc"]``.
+
+    Returns
+    -------
+    SyntheticTree
+        Description of the created tree.
+    """
+    if isinstance(versions, int):
+        versions = synthetic_versions(versions)
+    partial = partial or {}
+    broken = broken or {}
+
+    tree = SyntheticTree(root)
+    layout = [(ver, False) for ver in versions] + [(-abs(ver), True) for ver in student_versions]
+    for key, student in layout:
+        broken_products = list(broken.get(key, ()))
+        products = [
+            product for product in partial.get(key, PRODUCTS) if product not in broken_products
+        ]
+        tree.installations[key] = create_installation(
+            root,
+            key,
+            products=products,
+            student=student,
+            broken=broken_products,
+            broken_kind=broken_kind,
+        )
+
+    for alias in aliases:
+        os.makedirs(os.path.dirname(alias) or os.sep, exist_ok=True)
+        os.symlink(root, alias, target_is_directory=True)
+        tree.aliases.append(alias)
+    return tree
@@ -0,0 +1,196 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Solver variants of LS-DYNA shipped with an Ansys installation.
+
+Besides the ``lsdynaXYZ`` launcher, an installation provides several LS-DYNA
+solvers: shared memory (SMP) and distributed memory (MPP) builds, in single
+and double precision, and MPP builds linked against different MPI libraries.
+Their names follow ``lsdyna_[mpp_]{sp,dp}[_mpi].e`` on Linux and ``.exe`` on
+Windows, for example ``lsdyna_mpp_dp_impi.exe``.
+
+The variants are indexed with the other executables of the installation by
+:mod:`ansys.tools.path.capabilities`, without additional directory listings
+on installations that do not ship them. :func:`select_dyna_variant` picks the
+fastest variant suitable for a job.
+"""
+
+from dataclasses import dataclass
+import os
+import re
+from typing import Iterable, Literal, Optional
+
+PRECISION_TYPE = Literal["single", "double"]
+
+MODE_TYPE = Literal["smp", "mpp"]
+
+SMP_MAX_CORES = 8
+"""Largest core count for which an SMP solver is preferred on a single node.
+
+SMP solvers stop scaling beyond a few cores, where MPP solvers are faster.
+"""
+
+MPI_PREFERENCE = ("intelmpi", "openmpi", "msmpi", "platformmpi", "mpich")
+"""MPI libraries in order of preference when the job does not request one."""
+
+_MPI_ALIASES = {
+    "impi": "intelmpi",
+    "intelmpi": "intelmpi",
+    "ompi": "openmpi",
+    "openmpi": "openmpi",
+    "msmpi": "msmpi",
+    "pmpi": "platformmpi",
+    "platmpi": "platformmpi",
+    "platformmpi": "platformmpi",
+    "mpich": "mpich",
+}
+
+_PRECISIONS = {"sp": "single", "s": "single", "single": "single"}
+_PRECISIONS.update({"dp": "double", "d": "double", "double": "double"})
+
+_EXECUTABLE_EXTENSIONS = ("", ".e", ".exe")
+
+_VARIANT_NAME = re.compile(r"^ls-?dyna[_-](?P<options>.+)$", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class DynaVariant:
+    """One LS-DYNA solver executable."""
+
+    path: str
+    """Full path of the executable."""
+    mode: MODE_TYPE
+    """``"smp"`` for shared memory or ``"mpp"`` for distributed memory solvers."""
+    precision: PRECISION_TYPE
+    """``"single"`` or ``"double"``."""
+    mpi: Optional[str] = None
+    """MPI library of MPP solvers, for example ``"intelmpi"``, if known."""
+
+    @property
+    def name(self) -> str:
+        """File name of the executable."""
+        return os.path.basename(self.path)
+
+
+def parse_dyna_variant(path: str) -> Optional[DynaVariant]:
+    """Describe the LS-DYNA solver at ``path`` from its file name.
+
+    Parameters
+    ----------
+    path : str
+        Path of a file in an installation directory.
+
+    Returns
+    -------
+    Optional[DynaVariant]
+        The variant, or ``None`` if the name is not the name of an LS-DYNA
+        solver. The ``lsdynaXYZ`` launcher is not a variant.
+    """
+    stem, extension = os.path.splitext(os.path.basename(path))
+    match = _VARIANT_NAME.match(stem)
+    if match is None or extension.lower() not in _EXECUTABLE_EXTENSIONS:
+        return None
+    mode: MODE_TYPE = "smp"
+    precision: Optional[PRECISION_TYPE] = None
+    mpi = None
+    for token in re.split(r"[_-]", match.group("options").lower()):
+        if token in ("smp", "mpp"):
+            mode = token
+        elif token in _PRECISIONS and precision is None:
+            precision = _PRECISIONS[token]
+        elif token in _MPI_ALIASES:
+            mpi = _MPI_ALIASES[token]
+    if precision is None:
+        return None
+    if mpi is not None:
+        mode = "mpp"
+    return DynaVariant(path, mode, precision, mpi)
+
+
+def select_dyna_variant(
+    variants: Iterable[DynaVariant],
+    cores: int = 1,
+    nodes: int = 1,
+    precision: Optional[PRECISION_TYPE] = None,
+    mpi: Optional[str] = None,
+) -> Optional[DynaVariant]:
+    """Pick the fastest variant suitable for a job.
+
+    Jobs spanning several nodes need an MPP solver. On a single node, SMP is
+    preferred up to :data:`SMP_MAX_CORES` cores and MPP above. Without a
+    requested precision, single precision is preferred because it is faster.
+    Without a requested MPI library, :data:`MPI_PREFERENCE` decides, and
+    solvers built for an unknown MPI library come last.
+
+    Parameters
+    ----------
+    variants : Iterable[DynaVariant]
+        Variants to choose from, usually those of one installation.
+    cores : int, optional
+        Total number of cores of the job. Defaults to ``1``.
+    nodes : int, optional
+        Number of nodes of the job. Defaults to ``1``.
+    precision : str, optional
+        ``"single"`` or ``"double"``. If ``None``, any precision is suitable.
+    mpi : str, optional
+        MPI library that the solver must use, for example ``"intelmpi"``. This
+        restricts the choice to MPP solvers.
+
+    Returns
+    -------
+    Optional[DynaVariant]
+        The selected variant, or ``None`` if no variant is suitable.
+
+    Raises
+    ------
+    ValueError
+        The core count, the node count or the precision is invalid.
+    """
+    if cores < 1 or nodes < 1:
+        raise ValueError(f"The job needs at least one core and one node, got {cores} and {nodes}.")
+    if precision not in (None, "single", "double"):
+        raise ValueError(f"Unknown precision {precision!r}. Use 'single' or 'double'.")
+    if mpi is not None:
+        mpi = _MPI_ALIASES.get(mpi.lower(), mpi.lower())
+
+    preferred_mode = "mpp" if nodes > 1 or cores > SMP_MAX_CORES else "smp"
+    candidates = [
+        variant
+        for variant in variants
+        if (precision is None or variant.precision == precision)
+        and (mpi is None or variant.mpi == mpi)
+        and (nodes == 1 or variant.mode == "mpp")
+    ]
+    if not candidates:
+        return None
+
+    def rank(variant: DynaVariant):
+        mpi_rank = MPI_PREFERENCE.index(variant.mpi) if variant.mpi in MPI_PREFERENCE else 99
+        return (
+            variant.mode != preferred_mode,
+            variant.precision != "single",
+            mpi_rank,
+            variant.path,
+        )
+
+    return min(candidates, key=rank)
@@ -0,0 +1,113 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Background warm-up of the discovery caches.
+
+:func:`warm_up` starts the discovery on a daemon thread: it imports the
+discovery modules, reads the configuration file and builds the capability
+matrix, which covers MAPDL, LS-DYNA and Mechanical in one scan. Setting
+:data:`WARM_UP_ENV` starts it as soon as ``ansys.tools.path`` is imported, so
+that the discovery overlaps with the startup of the application.
+
+Calls made while the warm-up is running join it rather than starting their own
+scan: they wait for the capability matrix being built and then use it.
+
+This module only imports the standard library, so it is cheap to import.
+"""
+
+import importlib
+import os
+import threading
+from typing import Optional
+
+WARM_UP_ENV = "ANSYS_TOOLS_PATH_WARM_UP"
+"""Environment variable enabling the warm-up at import. Any value but ``""``, ``"0"``
+and ``"false"`` enables it."""
+
+_LOCK = threading.Lock()
+_THREAD: Optional[threading.Thread] = None
+
+
+def warm_up_requested() -> bool:
+    """Whether :data:`WARM_UP_ENV` asks for the warm-up at import."""
+    return os.environ.get(WARM_UP_ENV, "").strip().lower() not in ("", "0", "false")
+
+
+def _warm_up() -> None:
+    # Imports happen here, in the background, and not in the thread that imported the package.
+    log = importlib.import_module("ansys.tools.common.path.path").LOG
+    try:
+        importlib.import_module("ansys.tools.path.config").read_config_file()
+        importlib.import_module("ansys.tools.path.capabilities").get_capability_matrix()
+        # Import the rest of the public API too.
+        importlib.import_module("ansys.tools.path.path")
+        log.debug("Discovery caches warmed up")
+    except Exception:
+        log.exception("Warm-up of the discovery caches failed")
+
+
+def warm_up() -> threading.Thread:
+    """Start the discovery in the background, unless it is already running.
+
+    Returns
+    -------
+    threading.Thread
+        Daemon thread doing the warm-up. Joining it is not required:
+        ``find_mapdl`` and the other functions wait for the scan themselves.
+
+    Examples
+    --------
+    >>> from ansys.tools.path import warm_up
+    >>> warm_up()
+    >>> # ... application startup ...
+    >>> find_mapdl()  # joins the scan started by warm_up
+    """
+    global _THREAD
+    with _LOCK:
+        if _THREAD is None or not _THREAD.is_alive():
+            _THREAD = threading.Thread(
+                target=_warm_up, name="ansys-tools-path-warm-up", daemon=True
+            )
+            _THREAD.start()
+        return _THREAD
+
+
+def wait_for_warm_up(timeout: Optional[float] = None) -> bool:
+    """Wait for the running warm-up, if any.
+
+    Parameters
+    ----------
+    timeout : float, optional
+        Maximum time to wait, in seconds.
+
+    Returns
+    -------
+    bool
+        ``True`` if no warm-up is running anymore.
+    """
+    with _LOCK:
+        thread = _THREAD
+    if thread is None:
+        return True
+    thread.join(timeout)
+    return not thread.is_alive()
@@ -20,10 +20,21 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import struct
 import sys
 
 import pytest
 
+from ansys.tools.path.capabilities import clear_capability_matrix
+from ansys.tools.path.config import clear_config_cache
+from ansys.tools.path.discovery import clear_root_statistics_cache
+from ansys.tools.path.elf import DT_NEEDED, DT_RUNPATH
+from ansys.tools.path.mpi import clear_mpi_runtime_cache
+from ansys.tools.path.revalidation import set_background_revalidation, wait_for_revalidation
+
+SHT_STRTAB = 3
+SHT_DYNAMIC = 6
+
 ALL = set("darwin linux win32".split())
 
 
@@ -32,3 +43,119 @@ def pytest_runtest_setup(item):
     plat = sys.platform
     if supported_platforms and plat not in supported_platforms:
         pytest.skip("cannot run on platform {}".format(plat))
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    """Do not let the in-process caches leak between tests."""
+    clear_config_cache()
+    clear_capability_matrix()
+    clear_root_statistics_cache()
+    clear_mpi_runtime_cache()
+    yield
+    wait_for_revalidation()
+    clear_config_cache()
+    clear_capability_matrix()
+    clear_root_statistics_cache()
+    clear_mpi_runtime_cache()
+
+
+@pytest.fixture(autouse=True)
+def _no_background_revalidation():
+    """Keep the configuration file stable while the tests inspect it."""
+    set_background_revalidation(False)
+    yield
+    set_background_revalidation(True)
+
+
+def _build_elf(path, sections):
+    """Write a minimal little-endian ELF64 file.
+
+    ``sections`` is a list of ``(name, type, data)`` or ``(name, type, data, link, entsize)``
+    tuples, where ``link`` is the name of the linked section.
+    """
+    sections = [(s + (None, 0))[:5] if len(s) == 3 else s for s in sections]
+    names = [section[0] for section in sections] + [".shstrtab"]
+    shstrtab = b"\0"
+    name_offsets = {}
+    for name in names:
+        name_offsets[name] = len(shstrtab)
+        shstrtab += name.encode() + b"\0"
+
+    body = b""
+    headers = [struct.pack("<IIQQQQIIQQ", 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)]
+    offset = 64
+    all_sections = sections + [(".shstrtab", 3, shstrtab, None, 0)]
+    for name, sh_type, data, link, entsize in all_sections:
+        link_index = names.index(link) + 1 if link else 0
+        headers.append(
+            struct.pack(
+                "<IIQQQQIIQQ",
+                name_offsets[name],
+                sh_type,
+                0,
+                offset,
+                offset,
+                len(data),
+                link_index,
+                0,
+                1,
+                entsize,
+            )
+        )
+        body += data
+        offset += len(data)
+
+    header = struct.pack(
+        "<16sHHIQQQIHHHHHH",
+        b"\x7fELF\x02\x01\x01" + b"\0" * 9,
+        2,
+        62,
+        1,
+        0,
+        0,
+        offset,
+        0,
+        64,
+        0,
+        0,
+        64,
+        len(headers),
+        len(headers) - 1,
+    )
+    with open(path, "wb") as f:
+        f.write(header + body + b"".join(headers))
+    return str(path)
+
+
+@pytest.fixture
+def make_elf():
+    """Return a function writing a minimal ELF file with the given sections."""
+    return _build_elf
+
+
+@pytest.fixture
+def make_dynamic_elf():
+    """Return a function writing an ELF file with the given ``DT_NEEDED`` and ``DT_RUNPATH``."""
+
+    def make(path, needed=(), runpath=None):
+        strings = b"\0"
+        entries = []
+        for library in needed:
+            entries.append((DT_NEEDED, len(strings)))
+            strings += library.encode() + b"\0"
+        if runpath:
+            entries.append((DT_RUNPATH, len(strings)))
+            strings += runpath.encode() + b"\0"
+        dynamic = b"".join(struct.pack("<qQ", tag, value) for tag, value in entries)
+        dynamic += struct.pack("<qQ", 0, 0)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return _build_elf(
+            path,
+            [
+                (".dynstr", SHT_STRTAB, strings),
+                (".dynamic", SHT_DYNAMIC, dynamic, ".dynstr", 16),
+            ],
+        )
+
+    return make
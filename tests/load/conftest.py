@@ -0,0 +1,267 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Harness of the concurrent load tests.
+
+The load tests are deselected by default and run with ``-m load``. The
+workloads run on tmpfs (``/dev/shm``) when available. The concurrency levels
+and the number of iterations per worker can be changed with environment
+variables, for example::
+
+    ANSYS_TOOLS_PATH_LOAD_LEVELS=1,8,32 ANSYS_TOOLS_PATH_LOAD_ITERATIONS=200 \
+        python -m pytest tests/load -m load -s
+
+A summary with the latency percentiles, the throughput, the time spent waiting
+for the configuration file lock and the correctness violations is printed at
+the end of the session. Set ``ANSYS_TOOLS_PATH_LOAD_REPORT`` to also write it
+as JSON.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+import traceback
+from typing import Callable, Dict, List
+
+import pytest
+
+from ansys.tools.path import config
+from ansys.tools.path.discovery import _common_path
+from ansys.tools.path.testing import create_installation_tree
+
+LOAD_LEVELS = [int(n) for n in os.environ.get("ANSYS_TOOLS_PATH_LOAD_LEVELS", "1,8").split(",")]
+LOAD_ITERATIONS = int(os.environ.get("ANSYS_TOOLS_PATH_LOAD_ITERATIONS", "20"))
+LOAD_REPORT = os.environ.get("ANSYS_TOOLS_PATH_LOAD_REPORT")
+
+_REPORTS: List["LoadReport"] = []
+
+
+def percentile(values: List[float], p: float) -> float:
+    """Nearest-rank percentile."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * p // 100))
+    return ordered[int(rank) - 1]
+
+
+@dataclass
+class WorkerResult:
+    latencies: Dict[str, List[float]] = field(default_factory=dict)
+    lock_wait: float = 0.0
+    violations: List[str] = field(default_factory=list)
+
+
+@dataclass
+class LoadReport:
+    name: str
+    mode: str
+    workers: int
+    wall: float
+    latencies: Dict[str, List[float]] = field(default_factory=dict)
+    lock_wait: float = 0.0
+    violations: List[str] = field(default_factory=list)
+
+    @property
+    def operations(self) -> int:
+        return sum(len(values) for values in self.latencies.values())
+
+    @property
+    def throughput(self) -> float:
+        return self.operations / self.wall if self.wall else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "mode": self.mode,
+            "workers": self.workers,
+            "wall": self.wall,
+            "operations": self.operations,
+            "throughput": self.throughput,
+            "lock_wait": self.lock_wait,
+            "violations": self.violations,
+            "latency": {
+                op: {f"p{p}": percentile(values, p) for p in (50, 95, 99)}
+                for op, values in sorted(self.latencies.items())
+            },
+        }
+
+
+_LOCK_WAIT = [0.0]
+_LOCK_WAIT_LOCK = threading.Lock()
+
+
+def _timed_config_file_lock(original):
+    @contextmanager
+    def lock():
+        start = time.perf_counter()
+        with original():
+            with _LOCK_WAIT_LOCK:
+                _LOCK_WAIT[0] += time.perf_counter() - start
+            yield
+
+    return lock
+
+
+def _run_worker(
+    index: int, operations: List[Callable[[int, int], None]], iterations: int
+) -> WorkerResult:
+    result = WorkerResult()
+    for iteration in range(iterations):
+        operation = operations[(index + iteration) % len(operations)]
+        start = time.perf_counter()
+        try:
+            operation(index, iteration)
+        except Exception:
+            result.violations.append(
+                f"worker {index}, {operation.__name__}: {traceback.format_exc(limit=3)}"
+            )
+        result.latencies.setdefault(operation.__name__, []).append(time.perf_counter() - start)
+    return result
+
+
+def _process_worker(index, operations, iterations, barrier, queue):
+    with _LOCK_WAIT_LOCK:
+        _LOCK_WAIT[0] = 0.0
+    barrier.wait()
+    result = _run_worker(index, operations, iterations)
+    result.lock_wait = _LOCK_WAIT[0]
+    queue.put(result)
+
+
+def run_load(
+    name: str,
+    operations: List[Callable[[int, int], None]],
+    workers: int,
+    mode: str = "threads",
+    iterations: int = LOAD_ITERATIONS,
+) -> LoadReport:
+    """Run ``operations`` round-robin from ``workers`` threads or processes at once.
+
+    Each operation receives the worker index and the iteration number. Any
+    exception is recorded as a correctness violation.
+    """
+    with _LOCK_WAIT_LOCK:
+        _LOCK_WAIT[0] = 0.0
+    results: List[WorkerResult] = []
+    start = time.perf_counter()
+    if mode == "threads":
+        barrier = threading.Barrier(workers)
+
+        def thread_worker(index):
+            barrier.wait()
+            results.append(_run_worker(index, operations, iterations))
+
+        threads = [threading.Thread(target=thread_worker, args=(i,)) for i in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        lock_wait = _LOCK_WAIT[0]
+    else:
+        context = multiprocessing.get_context("fork")
+        barrier = context.Barrier(workers)
+        queue = context.Queue()
+        processes = [
+            context.Process(
+                target=_process_worker, args=(i, operations, iterations, barrier, queue)
+            )
+            for i in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        results = [queue.get(timeout=300) for _ in processes]
+        for process in processes:
+            process.join(timeout=60)
+            if process.exitcode != 0:
+                results.append(WorkerResult(violations=[f"process exit code {process.exitcode}"]))
+        lock_wait = sum(result.lock_wait for result in results)
+    wall = time.perf_counter() - start
+
+    report = LoadReport(name, mode, workers, wall, lock_wait=lock_wait)
+    for result in results:
+        for op, values in result.latencies.items():
+            report.latencies.setdefault(op, []).extend(values)
+        report.violations.extend(result.violations)
+    _REPORTS.append(report)
+    return report
+
+
+@pytest.fixture
+def load_tree(tmp_path, monkeypatch):
+    """Installation tree and configuration directory on tmpfs when available."""
+    base = "/dev/shm" if os.access("/dev/shm", os.W_OK) else str(tmp_path)
+    directory = tempfile.mkdtemp(prefix="ansys-tools-path-load-", dir=base)
+    tree = create_installation_tree(os.path.join(directory, "ansys_inc"), versions=6)
+    settings = os.path.join(directory, "settings")
+    os.makedirs(settings)
+    monkeypatch.setattr(_common_path, "LINUX_DEFAULT_DIRS", [tree.root])
+    monkeypatch.setattr(_common_path, "SETTINGS_DIR", settings)
+    monkeypatch.setattr(_common_path, "CONFIG_FILE", os.path.join(settings, "config.txt"))
+    monkeypatch.setattr(
+        config, "_config_file_lock", _timed_config_file_lock(config._config_file_lock)
+    )
+    yield tree
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def pytest_generate_tests(metafunc):
+    if "workers" in metafunc.fixturenames:
+        metafunc.parametrize("workers", LOAD_LEVELS)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _REPORTS:
+        return
+    write = terminalreporter.write_line
+    terminalreporter.section("concurrent load")
+    write(
+        f"{'workload':<28}{'mode':<10}{'workers':>8}{'ops':>7}{'ops/s':>10}"
+        f"{'lock wait s':>12}{'violations':>11}"
+    )
+    for report in _REPORTS:
+        write(
+            f"{report.name:<28}{report.mode:<10}{report.workers:>8}{report.operations:>7}"
+            f"{report.throughput:>10.0f}{report.lock_wait:>12.4f}{len(report.violations):>11}"
+        )
+        for op, values in sorted(report.latencies.items()):
+            write(
+                f"    {op:<24} p50 {percentile(values, 50) * 1e3:8.3f} ms"
+                f"  p95 {percentile(values, 95) * 1e3:8.3f} ms"
+                f"  p99 {percentile(values, 99) * 1e3:8.3f} ms"
+            )
+    if LOAD_REPORT:
+        with open(LOAD_REPORT, "w") as f:
+            json.dump([report.as_dict() for report in _REPORTS], f, indent=2)
+
+
+@pytest.fixture
+def load_runner():
+    """Return :func:`run_load`."""
+    return run_load
@@ -0,0 +1,129 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Concurrent load tests of the lookup and configuration functions."""
+
+import json
+import os
+
+import pytest
+
+from ansys.tools.path import (
+    clear_configuration,
+    find_mapdl,
+    get_dyna_path,
+    get_mapdl_path,
+    get_mechanical_path,
+    save_dyna_path,
+    save_mapdl_path,
+    save_mechanical_path,
+)
+from ansys.tools.path.config import get_config_file
+
+pytestmark = [pytest.mark.linux, pytest.mark.load]
+
+SAVE_FUNCTIONS = {
+    "mapdl": save_mapdl_path,
+    "dyna": save_dyna_path,
+    "mechanical": save_mechanical_path,
+}
+
+
+def _check_config_file():
+    """Raise if the configuration file is not a valid JSON mapping."""
+    config_file = get_config_file()
+    if config_file.exists():
+        data = json.loads(config_file.read_text())
+        assert isinstance(data, dict), data
+
+
+def _mixed_operations(tree):
+    versions = sorted(version for version in tree.installations if version > 0)
+
+    def find(index, iteration):
+        assert find_mapdl()[0] == tree.expected_executable("mapdl")
+
+    def get_path(index, iteration):
+        assert get_mapdl_path(allow_input=False) is not None
+
+    def save(index, iteration):
+        version = versions[(index + iteration) % len(versions)]
+        save_dyna_path(tree.expected_executable("dyna", version), allow_prompt=False)
+        _check_config_file()
+
+    def clear(index, iteration):
+        clear_configuration("dyna")
+        _check_config_file()
+
+    return [find, get_path, save, clear]
+
+
+@pytest.mark.parametrize("mode", ["threads", "processes"])
+def test_mixed_workload(load_tree, load_runner, mode, workers):
+    report = load_runner("mixed", _mixed_operations(load_tree), workers, mode)
+
+    assert report.violations == []
+    assert report.operations > 0
+    _check_config_file()
+
+
+def _owner_operations(tree, last_saved, workers):
+    """Each product has one owner saving it. The other workers only read."""
+    versions = sorted(version for version in tree.installations if version > 0)
+    products = list(SAVE_FUNCTIONS)
+
+    def save_own(index, iteration):
+        if index >= len(products):
+            get_dyna_path(allow_input=False)
+            get_mechanical_path(allow_input=False)
+            return
+        product = products[index]
+        path = tree.expected_executable(product, versions[iteration % len(versions)])
+        SAVE_FUNCTIONS[product](path, allow_prompt=False)
+        if last_saved is not None:
+            last_saved[product] = path
+
+    return [save_own]
+
+
+@pytest.mark.parametrize("mode", ["threads", "processes"])
+def test_no_lost_updates(load_tree, load_runner, mode, workers):
+    # Three owners and ``workers`` readers.
+    workers += len(SAVE_FUNCTIONS)
+    last_saved = {} if mode == "threads" else None
+    report = load_runner(
+        "lost-updates", _owner_operations(load_tree, last_saved, workers), workers, mode
+    )
+
+    assert report.violations == []
+    config = json.loads(get_config_file().read_text())
+    versions = sorted(version for version in load_tree.installations if version > 0)
+    last_version = versions[(report.operations // workers - 1) % len(versions)]
+    for product in SAVE_FUNCTIONS:
+        expected = load_tree.expected_executable(product, last_version)
+        assert config[product] == expected
+        if last_saved is not None:
+            assert last_saved[product] == expected
+    assert not [
+        name for name in os.listdir(os.path.dirname(get_config_file())) if name.endswith(".tmp")
+    ]
@@ -0,0 +1,129 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ansys.tools.path import buildinfo
+from ansys.tools.path.buildinfo import (
+    clear_version_info_cache,
+    get_executable_version_info,
+    get_version_info,
+    parse_build_text,
+)
+from ansys.tools.path.capabilities import scan_installation
+from ansys.tools.path.elf import ElfFile, is_elf
+
+SHT_PROGBITS = 1
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_version_info_cache()
+    yield
+    clear_version_info_cache()
+
+
+@pytest.fixture
+def installation(tmp_path, make_elf):
+    root = tmp_path / "ansys_inc" / "v231"
+    (root / "ansys" / "bin").mkdir(parents=True)
+    make_elf(
+        root / "ansys" / "bin" / "ansys231",
+        [
+            (".comment", SHT_PROGBITS, b"GCC: (GNU) 8.2.0\0"),
+            (
+                ".rodata",
+                SHT_PROGBITS,
+                b"\0\0Ansys Mechanical APDL 2023 R1\0Build Date: 2022-11-28\0",
+            ),
+        ],
+    )
+    return root
+
+
+def test_parse_build_text():
+    assert parse_build_text("Ansys 2024 R2 Service Pack 3\nBuild Date: 2024-10-01\n") == {
+        "version": 242,
+        "release": "2024 R2",
+        "service_pack": 3,
+        "build_date": "2024-10-01",
+    }
+    assert parse_build_text("Version: 25.1\nBuild Number = 10024") == {
+        "version": 251,
+        "release": "2025 R1",
+        "build": "10024",
+    }
+    assert parse_build_text("nothing to see") == {}
+
+
+def test_elf_sections(installation):
+    exe = str(installation / "ansys" / "bin" / "ansys231")
+    assert is_elf(exe)
+    elf = ElfFile(exe)
+    assert [section.name for section in elf.sections] == ["", ".comment", ".rodata", ".shstrtab"]
+    assert elf.read_section(elf.section(".comment"), max_bytes=3) == b"GCC"
+
+
+def test_version_info_from_executable(installation):
+    exe = str(installation / "ansys" / "bin" / "ansys231")
+    info = get_executable_version_info(exe)
+    assert info.version == 231
+    assert info.version_float == 23.1
+    assert info.release == "2023 R1"
+    assert info.build_date == "2022-11-28"
+    assert info.source == exe
+
+
+def test_metadata_file_takes_precedence(installation):
+    (installation / "builddate.txt").write_text("Ansys 2023 R1 SP2\nBuild Date: 2023-05-01\n")
+    info = get_version_info(str(installation), str(installation / "ansys" / "bin" / "ansys231"))
+    assert (info.version, info.service_pack, info.build_date) == (231, 2, "2023-05-01")
+    assert info.source == str(installation / "builddate.txt")
+
+
+def test_wrapper_script(tmp_path):
+    script = tmp_path / "v241" / "ansys" / "bin" / "ansys241"
+    script.parent.mkdir(parents=True)
+    script.write_text('#!/bin/sh\n# Ansys 2024 R1\nexec mapdl "$@"\n')
+    assert get_executable_version_info(str(script)).version == 241
+
+
+def test_version_info_cached_per_fingerprint(installation):
+    builddate = installation / "builddate.txt"
+    builddate.write_text("Ansys 2023 R1 SP1\n")
+    with patch.object(buildinfo, "parse_build_text", wraps=buildinfo.parse_build_text) as parse:
+        get_version_info(str(installation))
+        get_version_info(str(installation))
+        assert parse.call_count == 1
+        builddate.write_text("Ansys 2023 R1 SP02\n")
+        os.utime(builddate, ns=(0, 0))
+        assert get_version_info(str(installation)).service_pack == 2
+        assert parse.call_count == 2
+
+
+def test_installation_capabilities_version_info(installation):
+    capabilities = scan_installation(231, str(installation))
+    assert capabilities.version_info.release == "2023 R1"
@@ -0,0 +1,124 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ansys.tools.path import capabilities, find_dyna, find_mapdl, find_mechanical
+from ansys.tools.path.capabilities import get_capability_matrix
+
+pytestmark = pytest.mark.linux
+
+
+@pytest.fixture
+def partial_installations(fs):
+    fs.create_file("/ansys_inc/v222/ansys/bin/ansys222")
+    fs.create_file("/ansys_inc/v222/ansys/bin/lsdyna222")
+    fs.create_file("/ansys_inc/v222/aisol/.workbench")
+    # MAPDL only
+    fs.create_file("/ansys_inc/v231/ansys/bin/ansys231")
+    fs.create_file("/ansys_inc/ANSYS Student/v231/aisol/.workbench")
+    return fs
+
+
+def test_matrix(partial_installations):
+    matrix = get_capability_matrix()
+    assert sorted(matrix.installations) == [-231, 222, 231]
+    assert matrix.installations[231].executables == {"mapdl": "/ansys_inc/v231/ansys/bin/ansys231"}
+    assert matrix.installations[-231].student
+    assert matrix.installations[-231].has("mechanical")
+    assert matrix.products() == ["mapdl", "dyna", "mechanical"]
+    assert sorted(matrix.installations_with("dyna")) == [222]
+
+
+def test_find_latest_providing_product(partial_installations):
+    assert find_mapdl() == ("/ansys_inc/v231/ansys/bin/ansys231", 23.1)
+    assert find_dyna() == ("/ansys_inc/v222/ansys/bin/lsdyna222", 22.2)
+    assert find_mechanical() == ("/ansys_inc/v222/aisol/.workbench", 22.2)
+    assert find_mechanical(-231) == ("/ansys_inc/ANSYS Student/v231/aisol/.workbench", 23.1)
+    assert find_dyna(23.1) == ("", "")
+    with pytest.raises(ValueError):
+        find_mapdl(24.1)
+
+
+def test_all_products_cost_one_scan(partial_installations):
+    with (
+        patch.object(
+            capabilities,
+            "get_available_ansys_installations",
+            wraps=capabilities.get_available_ansys_installations,
+        ) as scan,
+        patch.object(
+            capabilities, "_list_directory", wraps=capabilities._list_directory
+        ) as list_directory,
+    ):
+        find_mapdl()
+        find_dyna()
+        find_mechanical()
+    assert scan.call_count == 1
+    # one listing of ansys/bin and one of aisol per installation
+    assert list_directory.call_count == 2 * 3
+
+
+def test_matrix_revalidated_on_new_installation(partial_installations):
+    assert find_mapdl()[1] == 23.1
+    partial_installations.create_file("/ansys_inc/v241/ansys/bin/ansys241")
+    os.utime("/ansys_inc", ns=(0, 0))
+    assert find_mapdl() == ("/ansys_inc/v241/ansys/bin/ansys241", 24.1)
+
+
+def _touch(path):
+    """Set a new modification time, as adding or removing an entry does."""
+    mtime_ns = os.stat(path).st_mtime_ns + 1
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_matrix_revalidated_on_executable_change(partial_installations):
+    assert find_mapdl() == ("/ansys_inc/v231/ansys/bin/ansys231", 23.1)
+    assert find_dyna(23.1) == ("", "")
+
+    os.remove("/ansys_inc/v231/ansys/bin/ansys231")
+    partial_installations.create_file("/ansys_inc/v231/ansys/bin/lsdyna231")
+    _touch("/ansys_inc/v231/ansys/bin")
+    assert find_mapdl() == ("/ansys_inc/v222/ansys/bin/ansys222", 22.2)
+    assert find_dyna(23.1) == ("/ansys_inc/v231/ansys/bin/lsdyna231", 23.1)
+
+    os.remove("/ansys_inc/v222/aisol/.workbench")
+    _touch("/ansys_inc/v222/aisol")
+    assert find_mechanical(22.2) == ("", "")
+
+
+def test_matrix_revalidated_on_new_student_installation(partial_installations):
+    assert sorted(get_capability_matrix().installations) == [-231, 222, 231]
+    partial_installations.create_file("/ansys_inc/ANSYS Student/v241/aisol/.workbench")
+    _touch("/ansys_inc/ANSYS Student")
+    assert find_mechanical(-241) == ("/ansys_inc/ANSYS Student/v241/aisol/.workbench", 24.1)
+
+
+def test_matrix_revalidated_when_awp_root_appears(partial_installations, monkeypatch):
+    monkeypatch.setenv("AWP_ROOT242", "/opt/ansys/v242")
+    assert 242 not in get_capability_matrix().installations
+    partial_installations.create_file("/opt/ansys/v242/ansys/bin/ansys242")
+    assert find_mapdl(24.2) == ("/opt/ansys/v242/ansys/bin/ansys242", 24.2)
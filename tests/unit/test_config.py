@@ -0,0 +1,140 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ansys.tools.path import (
+    ConfigConflictError,
+    clear_configuration,
+    config,
+    config_transaction,
+    get_mapdl_path,
+    get_saved_application_path,
+    save_dyna_path,
+    save_mapdl_path,
+)
+from ansys.tools.path.config import get_config_file, read_config_file, write_config_file
+
+MAPDL_EXE = "/ansys_inc/v231/ansys/bin/ansys231"
+DYNA_EXE = "/ansys_inc/v231/ansys/bin/lsdyna231"
+
+
+@pytest.fixture
+def config_fs(fs):
+    fs.create_file(MAPDL_EXE)
+    fs.create_file(DYNA_EXE)
+    fs.create_file(get_config_file(), contents=json.dumps({"mapdl": MAPDL_EXE}))
+    return fs
+
+
+def _count_reads():
+    return patch.object(config, "_parse_config", wraps=config._parse_config)
+
+
+def test_repeated_lookups_read_config_once(config_fs):
+    with _count_reads() as read_text:
+        for _ in range(5):
+            assert get_mapdl_path() == MAPDL_EXE
+            assert get_saved_application_path("mapdl") == MAPDL_EXE
+    assert read_text.call_count == 1
+
+
+def test_external_change_is_detected(config_fs):
+    assert get_saved_application_path("mapdl") == MAPDL_EXE
+    config_file = get_config_file()
+    config_file.write_text(json.dumps({"mapdl": MAPDL_EXE, "dyna": DYNA_EXE}))
+    # make sure the fingerprint changes even on a coarse clock
+    os.utime(config_file, ns=(0, 0))
+    assert get_saved_application_path("dyna") == DYNA_EXE
+
+
+def test_save_updates_cache_in_place(config_fs):
+    read_config_file()
+    with _count_reads() as read_text:
+        save_dyna_path(DYNA_EXE)
+        save_mapdl_path(MAPDL_EXE)
+        assert get_saved_application_path("dyna") == DYNA_EXE
+        clear_configuration("mapdl")
+        assert get_saved_application_path("mapdl") is None
+    assert read_text.call_count == 0
+    assert json.loads(get_config_file().read_text()) == {"dyna": DYNA_EXE}
+
+
+def test_returned_config_is_a_copy(config_fs):
+    read_config_file()["mapdl"] = "modified"
+    assert read_config_file() == {"mapdl": MAPDL_EXE}
+
+
+def test_missing_config_file(fs):
+    fs.create_dir(get_config_file().parent)
+    assert read_config_file() == {}
+    write_config_file({"mapdl": MAPDL_EXE})
+    assert read_config_file() == {"mapdl": MAPDL_EXE}
+
+
+def test_transaction_writes_once(config_fs):
+    with patch.object(
+        config, "_write_config_file_atomic", wraps=config._write_config_file_atomic
+    ) as write:
+        with config_transaction():
+            save_dyna_path(DYNA_EXE)
+            clear_configuration("mapdl")
+            # reads inside the transaction see the pending changes
+            assert get_saved_application_path("dyna") == DYNA_EXE
+            assert get_saved_application_path("mapdl") is None
+            # nothing has been written yet
+            assert json.loads(get_config_file().read_text()) == {"mapdl": MAPDL_EXE}
+    assert write.call_count == 1
+    assert json.loads(get_config_file().read_text()) == {"dyna": DYNA_EXE}
+
+
+def test_transaction_discarded_on_error(config_fs):
+    with pytest.raises(KeyError):
+        with config_transaction():
+            save_dyna_path(DYNA_EXE)
+            raise KeyError("abort")
+    assert get_saved_application_path("dyna") is None
+
+
+def test_transaction_conflict(config_fs):
+    with pytest.raises(ConfigConflictError):
+        with config_transaction():
+            save_dyna_path(DYNA_EXE)
+            # another process replaces the file in the meantime
+            get_config_file().write_text(json.dumps({"mechanical": "other"}))
+            os.utime(get_config_file(), ns=(0, 0))
+    assert json.loads(get_config_file().read_text()) == {"mechanical": "other"}
+    assert get_saved_application_path("dyna") is None
+
+
+def test_nested_transaction_joins_outer(config_fs):
+    with config_transaction() as outer:
+        with config_transaction() as inner:
+            save_dyna_path(DYNA_EXE)
+        assert inner is outer
+        assert outer.pending
+    assert get_saved_application_path("dyna") == DYNA_EXE
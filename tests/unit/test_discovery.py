@@ -0,0 +1,194 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ansys.tools.path import discovery, get_available_ansys_installations
+from ansys.tools.path.capabilities import get_capability_matrix
+from ansys.tools.path.discovery import discover_installations, get_root_statistics
+from ansys.tools.path.testing import create_installation_tree
+
+pytestmark = pytest.mark.linux
+
+
+def _probed_roots(callable_):
+    """Call ``callable_`` and return its result and the probed default roots, in order."""
+    with patch.object(discovery, "_stat_dir", wraps=discovery._stat_dir) as is_dir:
+        result = callable_()
+    roots = discovery._common_path.LINUX_DEFAULT_DIRS
+    return result, [call.args[0] for call in is_dir.call_args_list if call.args[0] in roots]
+
+
+def test_statistics_are_persisted(fs):
+    fs.create_dir("/usr/ansys_inc/v231")
+    assert get_available_ansys_installations() == {231: "/usr/ansys_inc/v231"}
+
+    stats_file = get_root_statistics().path
+    assert os.path.dirname(stats_file) == str(discovery._common_path.SETTINGS_DIR)
+    with open(stats_file) as f:
+        stats = json.load(f)
+    assert stats["/usr/ansys_inc"]["hits"] == 1
+    assert stats["/usr/ansys_inc"]["misses"] == 0
+    assert stats["/usr/ansys_inc"]["latency"] >= 0
+
+    discovery.clear_root_statistics_cache()
+    assert get_root_statistics().get("/usr/ansys_inc")["hits"] == 1
+
+
+def test_productive_root_is_probed_first(fs):
+    roots = list(discovery._common_path.LINUX_DEFAULT_DIRS)
+    fs.create_dir(os.path.join(roots[-1], "v231"))
+
+    _, first = _probed_roots(get_available_ansys_installations)
+    assert first == roots
+
+    result, second = _probed_roots(get_available_ansys_installations)
+    assert result == {231: os.path.join(roots[-1], "v231")}
+    # The productive root comes first; the roots before it must still be checked.
+    assert second[0] == roots[-1]
+    assert sorted(second) == sorted(roots)
+
+
+def test_earlier_root_wins_over_learned_root(fs):
+    roots = list(discovery._common_path.LINUX_DEFAULT_DIRS)
+    fs.create_dir(os.path.join(roots[1], "v222"))
+    for _ in range(2):
+        assert get_available_ansys_installations() == {222: os.path.join(roots[1], "v222")}
+    assert get_root_statistics().order(roots)[0] == roots[1]
+
+    fs.create_dir(os.path.join(roots[0], "v251"))
+    result, probed = _probed_roots(get_available_ansys_installations)
+    # Same answer as with the fixed order, even though the learned root still exists.
+    assert result == {251: os.path.join(roots[0], "v251")}
+    assert probed[0] == roots[1]
+    # Roots after the learned root in the canonical order are not probed.
+    assert sorted(probed) == sorted(roots[:2])
+
+
+def test_same_answer_as_fixed_order(fs):
+    roots = list(discovery._common_path.LINUX_DEFAULT_DIRS)
+    fs.create_dir(os.path.join(roots[1], "v222"))
+    fs.create_dir(os.path.join(roots[-1], "v231"))
+    stats = get_root_statistics()
+    for _ in range(10):
+        stats.record(roots[-1], True, 0.0001)
+        stats.record(roots[1], True, 1.0)
+        stats.record(roots[1], False, 1.0)
+
+    result, probed = _probed_roots(get_available_ansys_installations)
+    assert result == {222: os.path.join(roots[1], "v222")}
+    assert probed[:2] == [roots[-1], roots[1]]
+    # Roots after the answer in the canonical order are not needed.
+    assert set(probed) == set(roots[:2] + roots[-1:])
+
+
+def test_statistics_not_rewritten_without_ranking_change(fs):
+    fs.create_dir("/usr/ansys_inc/v231")
+    get_available_ansys_installations()
+    path = get_root_statistics().path
+    saved = os.stat(path).st_ino
+
+    for _ in range(3):
+        get_available_ansys_installations()
+    assert os.stat(path).st_ino == saved
+
+
+def test_statistics_writes_are_throttled(fs, monkeypatch):
+    roots = list(discovery._common_path.LINUX_DEFAULT_DIRS)
+    stats = get_root_statistics()
+    stats.record(roots[0], True, 0.1)
+    stats.save()
+    saved = os.stat(stats.path).st_ino
+
+    # The ranking changes, but the previous write is too recent.
+    stats.record(roots[1], True, 0.01)
+    stats.save()
+    assert os.stat(stats.path).st_ino == saved
+
+    monkeypatch.setattr(discovery, "ROOT_STATS_SAVE_INTERVAL", 0.0)
+    stats.save()
+    assert os.stat(stats.path).st_ino != saved
+    discovery.clear_root_statistics_cache()
+    assert get_root_statistics().order(roots[:2]) == [roots[1], roots[0]]
+
+
+def test_awp_root_known_version_not_probed(fs, monkeypatch):
+    fs.create_dir("/ansys_inc/v231")
+    fs.create_dir("/other/v231")
+    fs.create_dir("/other/v222")
+    monkeypatch.setenv("AWP_ROOT231", "/other/v231")
+    monkeypatch.setenv("AWP_ROOT222", "/other/v222")
+    with patch.object(discovery, "_stat_dir", wraps=discovery._stat_dir) as is_dir:
+        result = get_available_ansys_installations()
+    assert result == {231: "/ansys_inc/v231", 222: "/other/v222"}
+    probed = [call.args[0] for call in is_dir.call_args_list]
+    assert "/other/v231" not in probed
+    assert "/other/v222" in probed
+
+
+def test_corrupt_statistics_are_ignored(fs):
+    fs.create_dir("/ansys_inc/v231")
+    fs.create_file(get_root_statistics().path, contents="not json")
+    assert get_available_ansys_installations() == {231: "/ansys_inc/v231"}
+
+
+@pytest.fixture
+def aliased_tree(fs, monkeypatch):
+    tree = create_installation_tree("/ansys_inc", versions=[231, 222])
+    fs.create_symlink("/usr/ansys_inc", "/ansys_inc")
+    fs.create_symlink("/apps", "/ansys_inc")
+    monkeypatch.setenv("AWP_ROOT231", "/apps/v231")
+    # Mislabeled variable pointing to an installation that is already listed.
+    monkeypatch.setenv("AWP_ROOT232", "/apps/v222")
+    return tree
+
+
+def test_duplicates_reported_once(aliased_tree):
+    assert get_available_ansys_installations() == {
+        231: "/usr/ansys_inc/v231",
+        222: "/usr/ansys_inc/v222",
+    }
+
+
+def test_aliases(aliased_tree):
+    installations = discover_installations()
+    assert sorted(installations) == [222, 231]
+    assert installations[231].realpath == "/ansys_inc/v231"
+    assert set(installations[231].aliases) == {"/apps/v231", "/ansys_inc/v231"}
+    assert set(installations[222].aliases) == {"/apps/v222", "/ansys_inc/v222"}
+    assert installations[231].identity == (
+        os.stat("/ansys_inc/v231").st_dev,
+        os.stat("/ansys_inc/v231").st_ino,
+    )
+
+
+def test_physical_installation_scanned_once(aliased_tree):
+    with patch.object(discovery, "_stat_dir", wraps=discovery._stat_dir) as stat_dir:
+        matrix = get_capability_matrix()
+    assert sorted(matrix.installations) == [222, 231]
+    probed = [call.args[0] for call in stat_dir.call_args_list]
+    assert len(probed) == len(set(probed))
@@ -0,0 +1,128 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import hashlib
+import json
+import os
+from unittest.mock import patch
+
+from ansys.tools.common.path import path as _common_path
+import pytest
+
+from ansys.tools.path import integrity
+from ansys.tools.path.integrity import (
+    Manifest,
+    create_manifest,
+    hash_file,
+    load_manifest,
+    verify_installation,
+)
+
+pytestmark = pytest.mark.linux
+
+
+@pytest.fixture
+def installation(tmp_path, monkeypatch):
+    monkeypatch.setattr(_common_path, "SETTINGS_DIR", str(tmp_path / "settings"))
+    root = tmp_path / "v251"
+    (root / "ansys" / "bin").mkdir(parents=True)
+    (root / "ansys" / "bin" / "ansys251").write_bytes(b"\x7fELF" + b"x" * 3000)
+    (root / "builddate.txt").write_text("2025 R1")
+    return root
+
+
+def test_hash_file(tmp_path):
+    path = tmp_path / "data"
+    content = os.urandom(2 * 1024 * 1024 + 17)
+    path.write_bytes(content)
+    assert hash_file(str(path), chunk_size=4096) == hashlib.sha256(content).hexdigest()
+    assert hash_file(str(path), "md5") == hashlib.md5(content).hexdigest()
+
+
+def test_manifest_round_trip(installation, tmp_path):
+    manifest = create_manifest(str(installation))
+    assert sorted(manifest.files) == ["ansys/bin/ansys251", "builddate.txt"]
+    manifest.save(str(tmp_path / "manifest.json"))
+    assert load_manifest(str(tmp_path / "manifest.json")) == manifest
+
+    (tmp_path / "invalid.json").write_text("[]")
+    with pytest.raises(ValueError):
+        load_manifest(str(tmp_path / "invalid.json"))
+
+
+def test_verify(installation, tmp_path):
+    manifest = create_manifest(str(installation))
+    assert verify_installation(str(installation), manifest).ok
+
+    (installation / "builddate.txt").write_text("2025 R2")
+    os.remove(installation / "ansys" / "bin" / "ansys251")
+    (installation / "extra.txt").write_text("")
+    report = verify_installation(str(installation), manifest, check_unexpected=True)
+    assert not report.ok
+    assert report.modified == ["builddate.txt"]
+    assert report.missing == ["ansys/bin/ansys251"]
+    assert report.unexpected == ["extra.txt"]
+    assert report.verified == []
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["../v242/builddate.txt", "ansys/../../secret", "/etc/passwd", "ansys//bin", "./builddate.txt"],
+)
+def test_names_outside_installation_are_rejected(installation, tmp_path, name):
+    digest = hashlib.sha256(b"").hexdigest()
+    with pytest.raises(ValueError, match="outside of the installation"):
+        verify_installation(str(installation), Manifest({name: digest}))
+
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps({"algorithm": "sha256", "files": {name: digest}}))
+    with pytest.raises(ValueError, match="outside of the installation"):
+        load_manifest(str(path))
+
+
+def test_only_changed_files_are_hashed(installation):
+    manifest = create_manifest(str(installation))
+    assert os.listdir(os.path.join(_common_path.SETTINGS_DIR, "integrity"))
+
+    with patch.object(integrity, "hash_file", wraps=integrity.hash_file) as hashed:
+        report = verify_installation(str(installation), manifest)
+        assert hashed.call_count == 0
+        assert (report.cached, report.hashed) == (2, 0)
+
+        (installation / "builddate.txt").write_text("2025 R1 SP01")
+        report = verify_installation(str(installation), manifest, workers=2)
+        assert hashed.call_count == 1
+        assert (report.cached, report.hashed) == (1, 1)
+        assert report.modified == ["builddate.txt"]
+
+        report = verify_installation(str(installation), manifest, use_cache=False)
+        assert hashed.call_count == 3
+
+
+def test_installation_by_version(installation, monkeypatch):
+    monkeypatch.setattr(
+        integrity, "get_available_ansys_installations", lambda: {251: str(installation)}
+    )
+    assert verify_installation(251, create_manifest(251)).ok
+    with pytest.raises(ValueError):
+        create_manifest(242)
@@ -0,0 +1,193 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import json
+import multiprocessing
+import os
+import socket
+import time
+
+import pytest
+
+from ansys.tools.path import lease, probes
+from ansys.tools.path.capabilities import (
+    _matrix_to_data,
+    clear_capability_matrix,
+    get_capability_matrix,
+)
+from ansys.tools.path.discovery import _common_path
+from ansys.tools.path.lease import SHARED_CACHE_ENV, Lease, run_once
+from ansys.tools.path.testing import create_installation_tree
+
+pytestmark = pytest.mark.linux
+
+
+class CountingBackend(probes.OSBackend):
+    def __init__(self):
+        self.count = 0
+
+    def stat(self, path):
+        self.count += 1
+        return super().stat(path)
+
+    def scandir(self, path):
+        self.count += 1
+        return super().scandir(path)
+
+
+@pytest.fixture
+def installations(tmp_path, monkeypatch):
+    root = tmp_path / "ansys_inc"
+    create_installation_tree(str(root), versions=10, student_versions=[251])
+    monkeypatch.setattr(_common_path, "LINUX_DEFAULT_DIRS", [str(root)])
+    monkeypatch.setattr(_common_path, "SETTINGS_DIR", str(tmp_path / "settings"))
+    monkeypatch.setenv(SHARED_CACHE_ENV, str(tmp_path / "shared"))
+    return tmp_path
+
+
+def _count_probes():
+    backend = CountingBackend()
+    with probes.use_backend(backend):
+        matrix = get_capability_matrix()
+    return backend.count, _matrix_to_data(matrix)
+
+
+def _task(barrier, results):
+    barrier.wait()
+    results.put(_count_probes())
+
+
+def test_job_array_scans_once(installations, monkeypatch):
+    monkeypatch.delenv(SHARED_CACHE_ENV)
+    single_scan, expected = _count_probes()
+    monkeypatch.setenv(SHARED_CACHE_ENV, str(installations / "shared"))
+    clear_capability_matrix()
+
+    tasks = 8
+    context = multiprocessing.get_context("fork")
+    barrier = context.Barrier(tasks)
+    results = context.Queue()
+    processes = [context.Process(target=_task, args=(barrier, results)) for _ in range(tasks)]
+    for process in processes:
+        process.start()
+    outcomes = [results.get(timeout=60) for _ in range(tasks)]
+    for process in processes:
+        process.join(timeout=60)
+
+    assert all(
+        json.loads(json.dumps(data)) == json.loads(json.dumps(expected)) for _, data in outcomes
+    )
+    counts = sorted(count for count, _ in outcomes)
+    # One task scanned, the others only computed the fingerprints of the roots and installations.
+    fingerprint_probes = counts[0]
+    assert fingerprint_probes < single_scan
+    assert counts[:-1] == [fingerprint_probes] * (tasks - 1)
+    assert sum(counts) == single_scan + (tasks - 1) * fingerprint_probes
+
+
+def test_expired_lease_is_broken(tmp_path):
+    lease_path = tmp_path / "key.lease"
+    lease_path.write_text(json.dumps({"host": "elsewhere", "pid": 1, "expires": time.time() - 1}))
+    start = time.monotonic()
+    assert run_once(str(tmp_path), "key", lambda: [1]) == [1]
+    assert time.monotonic() - start < 5
+    assert not lease_path.exists()
+    assert lease.read_result(str(tmp_path), "key") == [1]
+
+
+def test_lease_of_dead_process_is_broken(tmp_path):
+    process = multiprocessing.get_context("fork").Process(target=os._exit, args=(0,))
+    process.start()
+    process.join()
+    lease_path = tmp_path / "key.lease"
+    owner = {"host": socket.gethostname(), "pid": process.pid, "expires": time.time() + 60}
+    lease_path.write_text(json.dumps(owner))
+    assert Lease(str(lease_path)).is_stale()
+    assert run_once(str(tmp_path), "key", lambda: {"answer": 42}) == {"answer": 42}
+
+
+def test_live_lease_waits_then_gives_up(tmp_path):
+    held = Lease(str(tmp_path / "key.lease"))
+    assert held.acquire()
+    assert not Lease(str(tmp_path / "key.lease")).acquire()
+    assert run_once(str(tmp_path), "key", lambda: "local", wait_timeout=0.1) == "local"
+    held.release()
+    assert not (tmp_path / "key.lease").exists()
+
+
+def test_published_result_expires(tmp_path):
+    lease.publish_result(str(tmp_path), "key", [1])
+    assert lease.read_result(str(tmp_path), "key") == [1]
+    assert lease.read_result(str(tmp_path), "key", ttl=-1) is None
+
+
+def test_lease_taken_during_break_is_restored(tmp_path, monkeypatch):
+    lease_path = tmp_path / "key.lease"
+    lease_path.write_text(json.dumps({"host": "elsewhere", "pid": 1, "expires": time.time() - 1}))
+    fresh = json.dumps({"host": "elsewhere", "pid": 2, "expires": time.time() + 60})
+    stale_content = Lease._stale_content
+
+    def racing_stale_content(self):
+        content = stale_content(self)
+        # Another process breaks the stale lease and takes a new one meanwhile.
+        os.remove(self.path)
+        lease_path.write_text(fresh)
+        return content
+
+    monkeypatch.setattr(Lease, "_stale_content", racing_stale_content)
+    assert not Lease(str(lease_path)).break_stale()
+    assert lease_path.read_text() == fresh
+    assert [path.name for path in tmp_path.iterdir()] == ["key.lease"]
+
+
+def test_invalid_result_is_ignored(tmp_path):
+    lease.publish_result(str(tmp_path), "key", {"path": "/missing"})
+    assert lease.read_result(str(tmp_path), "key", validate=lambda data: False) is None
+    assert lease.read_result(str(tmp_path), "key", validate=lambda data: data["missing"]) is None
+    assert run_once(str(tmp_path), "key", lambda: "local", validate=lambda data: False) == "local"
+
+
+def test_published_matrix_with_missing_executable_is_ignored(installations):
+    expected = _matrix_to_data(get_capability_matrix())
+    (published,) = (installations / "shared").glob("*.json")
+    content = json.loads(published.read_text())
+    content["data"]["installations"][0][2]["mapdl"] = str(installations / "missing" / "ansys")
+    published.write_text(json.dumps(content))
+
+    clear_capability_matrix()
+    assert _matrix_to_data(get_capability_matrix()) == expected
+
+
+def test_cache_dir_is_private(tmp_path):
+    shared = tmp_path / "shared"
+    assert run_once(str(shared), "key", lambda: [1]) == [1]
+    assert shared.stat().st_mode & 0o777 == 0o700
+    assert (shared / "key.json").stat().st_mode & 0o777 == 0o600
+
+
+def test_writable_cache_dir_is_not_used(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    assert run_once(str(shared), "key", lambda: [1]) == [1]
+    assert list(shared.iterdir()) == []
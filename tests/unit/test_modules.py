@@ -0,0 +1,148 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ansys.tools.path import modules
+from ansys.tools.path.modules import (
+    clear_modulefile_cache,
+    get_modulefile_installations,
+    parse_modulefile,
+)
+
+pytestmark = pytest.mark.linux
+
+TCL_MODULEFILE = """#%Module1.0
+## Ansys 2023 R1
+set root /apps/ansys_inc/v231
+setenv AWP_ROOT231 $root
+prepend-path PATH ${root}/ansys/bin
+"""
+
+TCL_PATH_ONLY_MODULEFILE = """#%Module
+prepend-path PATH /apps/ansys_inc/v222/ansys/bin
+prepend-path LD_LIBRARY_PATH /apps/ansys_inc/v222/ansys/lib/linx64
+"""
+
+LUA_MODULEFILE = """-- Ansys 2024 R1
+local root = "/apps/ansys_inc"
+local version = "v241"
+local prefix = pathJoin(root, version)
+setenv("AWP_ROOT241", prefix)
+prepend_path("PATH", prefix .. "/ansys/bin")
+"""
+
+LUA_STUDENT_MODULEFILE = """setenv("AWP_ROOT241", "/apps/ANSYS Student/v241")
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_modulefile_cache()
+    yield
+    clear_modulefile_cache()
+
+
+@pytest.fixture
+def modulepath(tmp_path):
+    tree1 = tmp_path / "modules1"
+    tree2 = tmp_path / "modules2"
+    (tree1 / "ansys").mkdir(parents=True)
+    (tree2 / "ansys").mkdir(parents=True)
+    (tree1 / "ansys" / "23.1").write_text(TCL_MODULEFILE)
+    (tree1 / "ansys" / "24.1.lua").write_text(LUA_MODULEFILE)
+    (tree1 / "ansys" / ".version").write_text("#%Module\nset ModulesVersion 24.1\n")
+    (tree2 / "ansys" / "22.2").write_text(TCL_PATH_ONLY_MODULEFILE)
+    # shadowed by the first tree
+    (tree2 / "ansys" / "23.1").write_text(TCL_MODULEFILE.replace("/apps/", "/other/"))
+    return f"{tree1}{os.pathsep}{tree2}"
+
+
+def test_parse_tcl_modulefile(tmp_path):
+    modulefile = tmp_path / "23.1"
+    modulefile.write_text(TCL_MODULEFILE)
+    assert parse_modulefile(str(modulefile)) == {231: "/apps/ansys_inc/v231"}
+
+
+def test_parse_lua_modulefile(tmp_path):
+    modulefile = tmp_path / "24.1.lua"
+    modulefile.write_text(LUA_MODULEFILE)
+    assert parse_modulefile(str(modulefile)) == {241: "/apps/ansys_inc/v241"}
+    modulefile.write_text(LUA_STUDENT_MODULEFILE)
+    assert parse_modulefile(str(modulefile)) == {-241: "/apps/ANSYS Student/v241"}
+
+
+def test_get_modulefile_installations(modulepath):
+    assert get_modulefile_installations(modulepath, verify=False) == {
+        231: "/apps/ansys_inc/v231",
+        241: "/apps/ansys_inc/v241",
+        222: "/apps/ansys_inc/v222",
+    }
+
+
+def test_get_modulefile_installations_uses_env(modulepath, monkeypatch):
+    monkeypatch.setenv("MODULEPATH", modulepath)
+    with patch("os.path.isdir", side_effect=lambda path: path.endswith("v241")):
+        assert get_modulefile_installations() == {241: "/apps/ansys_inc/v241"}
+
+
+def test_modulefiles_are_cached_by_mtime(modulepath):
+    with patch.object(modules, "parse_modulefile", wraps=modules.parse_modulefile) as parse:
+        get_modulefile_installations(modulepath, verify=False)
+        assert parse.call_count == 4
+        get_modulefile_installations(modulepath, verify=False)
+        assert parse.call_count == 4
+
+        modulefile = os.path.join(modulepath.split(os.pathsep)[0], "ansys", "23.1")
+        with open(modulefile, "w") as f:
+            f.write(TCL_MODULEFILE.replace("v231", "v232").replace("231", "232"))
+        os.utime(modulefile, ns=(0, 0))
+        installations = get_modulefile_installations(modulepath, verify=False)
+        assert parse.call_count == 5
+    assert 232 in installations
+    # v231 is still published by the second tree
+    assert installations[231] == "/other/ansys_inc/v231"
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "prepend-path PATH /apps/tools/v231/bin",
+        "prepend-path LD_LIBRARY_PATH /apps/ansys_inc/v231/ansys/lib/linx64",
+        "setenv AWP_ROOT999 /apps/ansys_inc/v999",
+        "prepend-path PATH /apps/ansys_inc/v999/ansys/bin",
+    ],
+)
+def test_unrelated_settings_are_ignored(tmp_path, line):
+    modulefile = tmp_path / "tool"
+    modulefile.write_text(f"#%Module\n{line}\n")
+    assert parse_modulefile(str(modulefile)) == {}
+
+
+def test_aisol_path(tmp_path):
+    modulefile = tmp_path / "mechanical"
+    modulefile.write_text("#%Module\nprepend-path PATH /apps/ansys_inc/v241/aisol/.workbench\n")
+    assert parse_modulefile(str(modulefile)) == {241: "/apps/ansys_inc/v241"}
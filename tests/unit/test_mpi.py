@@ -0,0 +1,119 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ansys.tools.path import find_mpi_runtime, mpi
+from ansys.tools.path.mpi import get_mpi_runtimes, recommend_mpi_runtime, scan_mpi_runtimes
+
+pytestmark = pytest.mark.linux
+
+MPI_DIR = "/ansys_inc/v251/commonfiles/MPI"
+
+
+@pytest.fixture
+def mpi_runtimes(fs):
+    fs.create_file("/ansys_inc/v251/ansys/bin/ansys251")
+    fs.create_file(f"{MPI_DIR}/Intel/2021.10.0/linx64/bin/mpirun")
+    fs.create_file(f"{MPI_DIR}/Intel/2021.11.0/linx64/bin/mpiexec.hydra")
+    fs.create_file(f"{MPI_DIR}/OpenMPI/4.0.5/linx64/bin/mpirun")
+    # No launcher and unknown vendor.
+    fs.create_dir(f"{MPI_DIR}/OpenMPI/3.1.5/linx64/lib")
+    fs.create_file(f"{MPI_DIR}/Other/1.0/linx64/bin/mpirun")
+    # Installation without bundled MPI.
+    fs.create_file("/ansys_inc/v242/ansys/bin/ansys242")
+    return fs
+
+
+def test_scan(mpi_runtimes):
+    runtimes = scan_mpi_runtimes("/ansys_inc/v251")
+    assert [(runtime.vendor, runtime.version) for runtime in runtimes] == [
+        ("intelmpi", "2021.10.0"),
+        ("intelmpi", "2021.11.0"),
+        ("openmpi", "4.0.5"),
+    ]
+    assert runtimes[1].path == f"{MPI_DIR}/Intel/2021.11.0"
+    assert runtimes[1].launcher == f"{MPI_DIR}/Intel/2021.11.0/linx64/bin/mpiexec.hydra"
+    assert runtimes[1].version_tuple == (2021, 11, 0)
+    assert scan_mpi_runtimes("/ansys_inc/v242") == ()
+
+
+def test_recommend(mpi_runtimes):
+    runtimes = scan_mpi_runtimes("/ansys_inc/v251")
+    assert recommend_mpi_runtime(runtimes).version == "2021.11.0"
+    assert recommend_mpi_runtime(runtimes, "OpenMPI").version == "4.0.5"
+    assert recommend_mpi_runtime(runtimes, "intel").version == "2021.11.0"
+    assert recommend_mpi_runtime(runtimes, "Intel MPI").vendor == "intelmpi"
+    assert recommend_mpi_runtime(runtimes, "msmpi") is None
+    assert recommend_mpi_runtime(runtimes, "mpich") is None
+    assert recommend_mpi_runtime(()) is None
+
+
+def test_cached(tmp_path):
+    mpi_dir = tmp_path / "v251" / "commonfiles" / "MPI"
+    launcher = mpi_dir / "Intel" / "2021.11.0" / "linx64" / "bin" / "mpirun"
+    launcher.parent.mkdir(parents=True)
+    launcher.touch()
+    with patch.object(mpi, "scan_mpi_runtimes", wraps=mpi.scan_mpi_runtimes) as scan:
+        assert len(get_mpi_runtimes(str(tmp_path / "v251"))) == 1
+        assert len(get_mpi_runtimes(str(tmp_path / "v251"))) == 1
+        assert scan.call_count == 1
+
+        launcher = mpi_dir / "OpenMPI" / "4.0.5" / "linx64" / "bin" / "mpirun"
+        launcher.parent.mkdir(parents=True)
+        launcher.touch()
+        # Make sure the change is visible on filesystems with coarse timestamps.
+        mtime_ns = os.stat(mpi_dir).st_mtime_ns + 1
+        os.utime(mpi_dir, ns=(mtime_ns, mtime_ns))
+        assert len(get_mpi_runtimes(str(tmp_path / "v251"))) == 2
+        assert scan.call_count == 2
+
+
+def test_cache_sees_new_vendor_version(tmp_path):
+    vendor_dir = tmp_path / "v251" / "commonfiles" / "MPI" / "Intel"
+    launcher = vendor_dir / "2021.10.0" / "linx64" / "bin" / "mpirun"
+    launcher.parent.mkdir(parents=True)
+    launcher.touch()
+    assert len(get_mpi_runtimes(str(tmp_path / "v251"))) == 1
+
+    launcher = vendor_dir / "2021.11.0" / "linx64" / "bin" / "mpirun"
+    launcher.parent.mkdir(parents=True)
+    launcher.touch()
+    # Only the vendor directory changes, not commonfiles/MPI.
+    mtime_ns = os.stat(vendor_dir).st_mtime_ns + 1
+    os.utime(vendor_dir, ns=(mtime_ns, mtime_ns))
+    runtimes = get_mpi_runtimes(str(tmp_path / "v251"))
+    assert [runtime.version for runtime in runtimes] == ["2021.10.0", "2021.11.0"]
+
+
+def test_find_mpi_runtime(mpi_runtimes):
+    runtime = find_mpi_runtime()
+    assert runtime.launcher == f"{MPI_DIR}/Intel/2021.11.0/linx64/bin/mpiexec.hydra"
+    assert find_mpi_runtime(25.1, vendor="openmpi").launcher == (
+        f"{MPI_DIR}/OpenMPI/4.0.5/linx64/bin/mpirun"
+    )
+    assert find_mpi_runtime(25.1, vendor="intel") == runtime
+    assert find_mpi_runtime(242) is None
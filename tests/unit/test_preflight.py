@@ -0,0 +1,101 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from unittest.mock import patch
+
+import pytest
+
+from ansys.tools.path import preflight
+from ansys.tools.path.elf import ElfFile
+from ansys.tools.path.preflight import (
+    MissingLibraryError,
+    check_executable_dependencies,
+    clear_dependency_cache,
+)
+
+pytestmark = pytest.mark.linux
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache(monkeypatch):
+    monkeypatch.delenv("LD_LIBRARY_PATH", raising=False)
+    clear_dependency_cache()
+    yield
+    clear_dependency_cache()
+
+
+@pytest.fixture
+def installation(tmp_path, make_dynamic_elf):
+    root = tmp_path / "v231"
+    lib = root / "ansys" / "lib" / "linx64"
+    make_dynamic_elf(root / "ansys" / "bin" / "linx64" / "ansys.e", ["libansys.so", "libmkl.so"])
+    (root / "ansys" / "bin" / "ansys231").write_text("#!/bin/sh\nexec ./linx64/ansys.e\n")
+    make_dynamic_elf(lib / "libansys.so", ["libhelper.so"], runpath="$ORIGIN/../helpers")
+    make_dynamic_elf(root / "ansys" / "lib" / "helpers" / "libhelper.so")
+    return root
+
+
+def test_dynamic_info(installation):
+    info = ElfFile(str(installation / "ansys" / "lib" / "linx64" / "libansys.so")).dynamic_info()
+    assert info.needed == ["libhelper.so"]
+    assert info.runpath == ["$ORIGIN/../helpers"]
+
+
+def test_missing_library(installation):
+    report = check_executable_dependencies(str(installation / "ansys" / "bin" / "ansys231"))
+    assert report.checked
+    assert report.binary == str(installation / "ansys" / "bin" / "linx64" / "ansys.e")
+    assert set(report.resolved) == {"libansys.so", "libhelper.so"}
+    assert report.missing == {"libmkl.so": report.binary}
+    assert not report.ok
+    with pytest.raises(MissingLibraryError, match="libmkl.so"):
+        report.raise_for_missing()
+
+
+def test_library_found_through_ld_library_path(
+    installation, tmp_path, monkeypatch, make_dynamic_elf
+):
+    make_dynamic_elf(tmp_path / "mkl" / "libmkl.so")
+    monkeypatch.setenv("LD_LIBRARY_PATH", str(tmp_path / "mkl"))
+    report = check_executable_dependencies(str(installation / "ansys" / "bin" / "ansys231"))
+    assert report.ok
+    assert report.resolved["libmkl.so"] == str(tmp_path / "mkl" / "libmkl.so")
+    report.raise_for_missing()
+
+
+def test_verdict_cached(installation, make_dynamic_elf):
+    exe = str(installation / "ansys" / "bin" / "ansys231")
+    with patch.object(preflight, "ElfFile", wraps=preflight.ElfFile) as elf:
+        first = check_executable_dependencies(exe)
+        calls = elf.call_count
+        assert check_executable_dependencies(exe) is first
+        assert elf.call_count == calls
+    # a new binary invalidates the verdict
+    make_dynamic_elf(installation / "ansys" / "bin" / "linx64" / "ansys.e", ["libansys.so"])
+    assert check_executable_dependencies(exe).ok
+
+
+def test_not_an_executable(tmp_path):
+    script = tmp_path / "run.sh"
+    script.write_text("#!/bin/sh\n")
+    assert not check_executable_dependencies(str(script)).checked
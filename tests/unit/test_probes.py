@@ -0,0 +1,106 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import gzip
+import json
+import shutil
+import time
+
+import pytest
+
+from ansys.tools.path import find_dyna, find_mapdl, get_available_ansys_installations, probes
+from ansys.tools.path.discovery import _common_path, get_root_statistics
+from ansys.tools.path.probes import TraceMismatchError, load_trace, record_probes, replay_probes
+from ansys.tools.path.testing import create_installation_tree
+
+pytestmark = pytest.mark.linux
+
+
+@pytest.fixture
+def recorded(tmp_path, monkeypatch):
+    root = tmp_path / "ansys_inc"
+    create_installation_tree(str(root), versions=[231, 222], student_versions=[231])
+    monkeypatch.setattr(_common_path, "LINUX_DEFAULT_DIRS", [str(tmp_path / "missing"), str(root)])
+    monkeypatch.setattr(_common_path, "SETTINGS_DIR", str(tmp_path / "settings"))
+    trace = tmp_path / "find.trace.gz"
+    with record_probes(str(trace)) as recorder:
+        expected = (get_available_ansys_installations(), find_mapdl(), find_dyna(22.2))
+    shutil.rmtree(root)
+    return trace, recorder, expected
+
+
+def test_trace_file(recorded):
+    trace, recorder, _ = recorded
+    with gzip.open(trace, "rt") as f:
+        header = json.loads(f.readline())
+        lines = f.readlines()
+    assert header["format"] == probes.TRACE_FORMAT
+    assert len(lines) == len(recorder.events)
+    events = load_trace(str(trace))
+    assert {operation for operation, _, _, _ in events} == {"stat", "scandir"}
+    assert all(latency >= 0 for _, _, _, latency in events)
+
+
+def test_replay_is_deterministic(recorded):
+    trace, recorder, expected = recorded
+    # The installation is gone, but the replay answers from the trace.
+    assert get_available_ansys_installations() == {}
+    for _ in range(2):
+        with replay_probes(str(trace), latency=False) as replay:
+            assert (get_available_ansys_installations(), find_mapdl(), find_dyna(22.2)) == expected
+        assert replay.unknown == []
+        assert replay.replayed > 0
+    # Only the three real discoveries count in the statistics of the machine.
+    assert get_root_statistics().get(_common_path.LINUX_DEFAULT_DIRS[0])["misses"] == 3
+
+
+def test_replay_latency(tmp_path):
+    trace = tmp_path / "slow.trace"
+    trace.write_text(
+        json.dumps({"format": probes.TRACE_FORMAT, "version": probes.TRACE_VERSION})
+        + "\n"
+        + json.dumps(["stat", "/slow", None, 0.05])
+        + "\n"
+    )
+    start = time.perf_counter()
+    with replay_probes(str(trace)) as replay:
+        assert probes.stat("/slow") is None
+        assert probes.stat("/slow") is None
+    assert time.perf_counter() - start >= 0.1
+    assert replay.simulated_latency == pytest.approx(0.1)
+
+
+def test_strict_replay(recorded):
+    trace, _, _ = recorded
+    with replay_probes(str(trace), latency=False, strict=True):
+        with pytest.raises(TraceMismatchError):
+            probes.scandir("/not/recorded")
+    with replay_probes(str(trace), latency=False) as replay:
+        assert probes.scandir("/not/recorded") is None
+    assert replay.unknown == [("scandir", "/not/recorded")]
+
+
+def test_not_a_trace(tmp_path):
+    (tmp_path / "other.json").write_text("{}\n")
+    with pytest.raises(ValueError):
+        load_trace(str(tmp_path / "other.json"))
@@ -0,0 +1,130 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import subprocess
+import sys
+
+import pytest
+
+from ansys.tools.path.remote import (
+    CommandResult,
+    CommandTransport,
+    LocalTransport,
+    SSHTransport,
+    discover_hosts,
+)
+
+pytestmark = pytest.mark.linux
+
+
+@pytest.fixture
+def fake_hosts(tmp_path):
+    """Two simulated hosts, each with its own home directory used as installation root."""
+    host_env = {}
+    for host, versions in {"node1": [222, 231], "node2": [241]}.items():
+        home = tmp_path / host
+        for version in versions:
+            (home / "ansys_inc" / f"v{version}").mkdir(parents=True)
+        host_env[host] = {"HOME": str(home)}
+    host_env["empty"] = {"HOME": str(tmp_path / "empty")}
+    return tmp_path, host_env
+
+
+def test_discover_hosts_local_transport(fake_hosts):
+    tmp_path, host_env = fake_hosts
+    results = {
+        result.host: result
+        for result in discover_hosts(host_env, LocalTransport(host_env), max_workers=2)
+    }
+    assert set(results) == {"node1", "node2", "empty"}
+    assert all(result.ok for result in results.values())
+    assert results["node1"].installations == {
+        222: str(tmp_path / "node1" / "ansys_inc" / "v222"),
+        231: str(tmp_path / "node1" / "ansys_inc" / "v231"),
+    }
+    assert results["node2"].installations == {241: str(tmp_path / "node2" / "ansys_inc" / "v241")}
+    assert results["empty"].installations == {}
+
+
+class _SlowTransport(CommandTransport):
+    def run(self, host, command, timeout):
+        if host == "slow":
+            raise subprocess.TimeoutExpired(command, timeout)
+        if host == "broken":
+            return CommandResult(1, "", "ModuleNotFoundError: No module named 'ansys'")
+        return CommandResult(0, '{"251": "/ansys_inc/v251"}')
+
+
+def test_discover_hosts_failures():
+    results = {
+        result.host: result
+        for result in discover_hosts(["slow", "broken", "ok"], _SlowTransport(), timeout=0.1)
+    }
+    assert "timed out" in results["slow"].error
+    assert "ModuleNotFoundError" in results["broken"].error
+    assert results["broken"].installations == {}
+    assert results["ok"].installations == {251: "/ansys_inc/v251"}
+
+
+class _FaultyTransport(CommandTransport):
+    def run(self, host, command, timeout):
+        if host == "crash":
+            raise RuntimeError("connection pool closed")
+        if host == "list":
+            return CommandResult(0, '["/ansys_inc/v251"]')
+        if host == "nested":
+            return CommandResult(0, '{"251": {"path": "/ansys_inc/v251"}}')
+        return CommandResult(0, '{"251": "/ansys_inc/v251"}')
+
+
+def test_discover_hosts_isolates_host_errors():
+    hosts = ["crash", "list", "nested", "ok"]
+    results = {result.host: result for result in discover_hosts(hosts, _FaultyTransport())}
+    assert set(results) == set(hosts)
+    assert "RuntimeError: connection pool closed" in results["crash"].error
+    assert "expected a JSON object" in results["list"].error
+    assert "expected a path" in results["nested"].error
+    assert results["ok"].installations == {251: "/ansys_inc/v251"}
+
+
+def test_discover_hosts_streams_results():
+    results = discover_hosts(["a", "b", "c"], _SlowTransport(), max_workers=1)
+    first = next(results)
+    assert first.ok
+    results.close()
+
+
+def test_ssh_transport_command(monkeypatch):
+    captured = {}
+
+    def fake_run(command, **kwargs):
+        captured["command"] = command
+        return subprocess.CompletedProcess(command, 0, "{}", "")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    result = SSHTransport(user="ops", ssh_options=["-p", "2222"]).run(
+        "node7", [sys.executable, "-c", "print(1)"], 5
+    )
+    assert result.returncode == 0
+    assert captured["command"][:6] == ["ssh", "-o", "BatchMode=yes", "-p", "2222", "ops@node7"]
+    assert "print(1)" in captured["command"][-1]
@@ -0,0 +1,128 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import json
+import os
+import subprocess
+import sys
+
+import platformdirs
+import pytest
+
+from ansys.tools.path import SETTINGS_DIR
+from ansys.tools.path.resolve import STARTUP_BUDGET, _settings_dir, main, resolve
+
+pytestmark = pytest.mark.linux
+
+MAPDL_EXE = "/ansys_inc/v231/ansys/bin/ansys231"
+
+
+@pytest.fixture
+def saved_config(fs):
+    fs.create_file(MAPDL_EXE)
+    fs.create_file("/ansys_inc/v241/ansys/bin/ansys241")
+    fs.create_file(
+        os.path.join(SETTINGS_DIR, "config.txt"), contents=json.dumps({"mapdl": MAPDL_EXE})
+    )
+    return fs
+
+
+def test_settings_dir_matches():
+    assert _settings_dir() == str(SETTINGS_DIR)
+
+
+@pytest.mark.parametrize("data_home", [None, "", "  ", "/custom/data"])
+def test_settings_dir_matches_platformdirs(monkeypatch, data_home):
+    if data_home is None:
+        monkeypatch.delenv("XDG_DATA_HOME", raising=False)
+    else:
+        monkeypatch.setenv("XDG_DATA_HOME", data_home)
+    expected = platformdirs.user_data_dir(appname="ansys_tools_path", appauthor="Ansys")
+    assert _settings_dir() == expected
+
+
+def test_resolve_from_config(saved_config):
+    assert resolve("mapdl") == (MAPDL_EXE, "config")
+    assert resolve("mapdl", 24.1) == ("/ansys_inc/v241/ansys/bin/ansys241", "find")
+    assert resolve("dyna", find=False) == (None, "")
+
+
+def test_main_prints_path(saved_config, capsys):
+    assert main([]) == 0
+    assert capsys.readouterr().out == MAPDL_EXE + "\n"
+    assert main(["--product", "dyna"]) == 1
+    assert "No dyna executable found" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("version", ["24.1", "241", "241.0"])
+def test_main_version_formats(saved_config, capsys, version):
+    assert main(["--version", version]) == 0
+    assert capsys.readouterr().out == "/ansys_inc/v241/ansys/bin/ansys241\n"
+
+
+@pytest.mark.parametrize("version", ["241.5", "latest"])
+def test_main_invalid_version(saved_config, capsys, version):
+    with pytest.raises(SystemExit):
+        main(["--version", version])
+    assert "invalid version" in capsys.readouterr().err
+
+
+def test_main_export(saved_config, capsys):
+    assert main(["--export"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "export AWP_ROOT231=/ansys_inc/v231",
+        'export PATH=/ansys_inc/v231/ansys/bin:"$PATH"',
+    ]
+
+
+def test_startup_budget(tmp_path):
+    """Resolving a saved path must only import the resolver and a few standard modules."""
+    exe = tmp_path / "v231" / "ansys" / "bin" / "ansys231"
+    exe.parent.mkdir(parents=True)
+    exe.touch()
+    (tmp_path / "ansys_tools_path").mkdir()
+    (tmp_path / "ansys_tools_path" / "config.txt").write_text(json.dumps({"mapdl": str(exe)}))
+    env = {**os.environ, "XDG_DATA_HOME": str(tmp_path)}
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "ansys.tools.path", "--no-find"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    assert result.stdout.strip() == str(exe)
+
+    imports = {}
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2][1:]  # drop the separator space, keep the nesting indentation
+        if not name.startswith(" "):  # top-level imports only
+            imports[name] = int(fields[1])
+    assert "ansys.tools.path.resolve" in imports
+    for heavy in ("ansys.tools.common", "platformdirs", "importlib.metadata"):
+        assert not any(name.startswith(heavy) for name in imports), heavy
+    own_import_time = sum(us for name, us in imports.items() if name.startswith("ansys"))
+    assert own_import_time < STARTUP_BUDGET * 1e6
@@ -0,0 +1,207 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import errno
+import os
+import threading
+
+import pytest
+
+from ansys.tools.path import (
+    config_transaction,
+    get_mapdl_path,
+    revalidation,
+    save_dyna_path,
+    save_mapdl_path,
+)
+from ansys.tools.path.config import get_config_file, read_config_file
+from ansys.tools.path.revalidation import (
+    ConfigChange,
+    add_revalidation_hook,
+    remove_revalidation_hook,
+    revalidate_saved_paths,
+    schedule_revalidation,
+    set_background_revalidation,
+    set_revalidation_repair,
+    wait_for_revalidation,
+)
+from ansys.tools.path.testing import create_installation_tree
+
+pytestmark = pytest.mark.linux
+
+
+@pytest.fixture
+def stale_config(fs):
+    fs.create_dir(get_config_file().parent)
+    create_installation_tree("/ansys_inc", versions=[231, 222], partial={231: ["mapdl"]})
+    fs.create_file("/ansys_inc/v212/ansys/bin/ansys212")
+    fs.create_file("/ansys_inc/v212/ansys/bin/lsdyna212")
+    save_mapdl_path("/ansys_inc/v212/ansys/bin/ansys212", allow_prompt=False)
+    save_dyna_path("/ansys_inc/v212/ansys/bin/lsdyna212", allow_prompt=False)
+    fs.remove_object("/ansys_inc/v212")
+    return fs
+
+
+@pytest.fixture
+def changes():
+    received = []
+    add_revalidation_hook(received.extend)
+    yield received
+    remove_revalidation_hook(received.extend)
+
+
+@pytest.fixture
+def repair():
+    set_revalidation_repair(True)
+    yield
+    set_revalidation_repair(False)
+
+
+def test_report_only_by_default(stale_config, changes):
+    result = revalidate_saved_paths()
+    assert result == changes
+    assert {change.applied for change in result} == {False}
+    assert {change.new_path for change in result} == {
+        "/ansys_inc/v222/ansys/bin/lsdyna222",
+        "/ansys_inc/v231/ansys/bin/ansys231",
+    }
+    assert read_config_file()["mapdl"] == "/ansys_inc/v212/ansys/bin/ansys212"
+
+
+def test_repair_with_latest_installation(stale_config, changes, repair):
+    result = revalidate_saved_paths()
+    assert result == changes
+    assert sorted(result, key=lambda change: change.product) == [
+        ConfigChange(
+            "dyna", "/ansys_inc/v212/ansys/bin/lsdyna212", "/ansys_inc/v222/ansys/bin/lsdyna222"
+        ),
+        ConfigChange(
+            "mapdl", "/ansys_inc/v212/ansys/bin/ansys212", "/ansys_inc/v231/ansys/bin/ansys231"
+        ),
+    ]
+    assert {change.action for change in result} == {"repaired"}
+    assert read_config_file()["mapdl"] == "/ansys_inc/v231/ansys/bin/ansys231"
+
+    assert revalidate_saved_paths() == []
+
+
+def test_prune_without_replacement(fs, changes, repair):
+    fs.create_dir(get_config_file().parent)
+    fs.create_file("/ansys_inc/v231/ansys/bin/ansys231")
+    fs.create_file("/ansys_inc/v212/ansys/bin/lsdyna212")
+    save_dyna_path("/ansys_inc/v212/ansys/bin/lsdyna212", allow_prompt=False)
+    save_mapdl_path("/ansys_inc/v231/ansys/bin/ansys231", allow_prompt=False)
+    fs.remove_object("/ansys_inc/v212")
+    (change,) = revalidate_saved_paths()
+    assert change.action == "pruned"
+    assert read_config_file() == {"mapdl": "/ansys_inc/v231/ansys/bin/ansys231"}
+    assert changes == [change]
+
+
+def test_stale_path_returned_then_repaired_in_background(stale_config, changes, repair):
+    set_background_revalidation(True)
+    # The saved path is returned immediately, even though it is stale.
+    assert get_mapdl_path(allow_input=False) == "/ansys_inc/v212/ansys/bin/ansys212"
+    assert wait_for_revalidation(timeout=10)
+    assert len(changes) == 2
+    assert get_mapdl_path(allow_input=False) == "/ansys_inc/v231/ansys/bin/ansys231"
+    assert wait_for_revalidation(timeout=10)
+
+
+def test_schedule_is_throttled(stale_config, monkeypatch):
+    calls = []
+    monkeypatch.setattr(revalidation, "revalidate_saved_paths", lambda: calls.append(1))
+    assert schedule_revalidation() is None  # disabled in the tests
+
+    set_background_revalidation(True)
+    assert schedule_revalidation() is not None
+    wait_for_revalidation()
+    assert schedule_revalidation() is None
+    assert schedule_revalidation(force=True) is not None
+    wait_for_revalidation()
+    assert calls == [1, 1]
+
+
+def test_matrix_refreshed_once(stale_config, monkeypatch, repair):
+    refreshes = []
+    get_matrix = revalidation.get_capability_matrix
+
+    def counting_get_matrix(*args, **kwargs):
+        refreshes.append(kwargs.get("refresh"))
+        return get_matrix(*args, **kwargs)
+
+    monkeypatch.setattr(revalidation, "get_capability_matrix", counting_get_matrix)
+    assert len(revalidate_saved_paths()) == 2
+    assert refreshes == [True]
+
+
+def test_unreachable_parent_is_unknown(stale_config, monkeypatch, repair):
+    real_stat = os.stat
+
+    def stat(path, *args, **kwargs):
+        if str(path) == "/ansys_inc/v212/ansys/bin":
+            raise OSError(errno.EIO, "Input/output error", path)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(revalidation.os, "stat", stat)
+    assert revalidate_saved_paths() == []
+    assert read_config_file()["mapdl"] == "/ansys_inc/v212/ansys/bin/ansys212"
+
+
+def test_repair_in_own_transaction(stale_config, repair):
+    with config_transaction():
+        changes = revalidate_saved_paths()
+        assert {change.applied for change in changes} == {True}
+    assert read_config_file()["mapdl"] == "/ansys_inc/v231/ansys/bin/ansys231"
+
+
+def test_open_transaction_is_not_broken(stale_config, repair):
+    set_background_revalidation(True)
+    with config_transaction():
+        # The saved path is returned and the revalidation runs in the background.
+        assert get_mapdl_path(allow_input=False) == "/ansys_inc/v212/ansys/bin/ansys212"
+        assert wait_for_revalidation(timeout=10)
+        save_dyna_path("/ansys_inc/v222/ansys/bin/lsdyna222", allow_prompt=False)
+    # The commit did not fail and the repair was skipped.
+    assert read_config_file()["mapdl"] == "/ansys_inc/v212/ansys/bin/ansys212"
+    assert read_config_file()["dyna"] == "/ansys_inc/v222/ansys/bin/lsdyna222"
+
+
+def test_repair_skipped_while_other_thread_has_transaction(stale_config, repair):
+    opened = threading.Event()
+    done = threading.Event()
+
+    def hold_transaction():
+        with config_transaction():
+            opened.set()
+            done.wait(10)
+
+    thread = threading.Thread(target=hold_transaction)
+    thread.start()
+    try:
+        assert opened.wait(10)
+        assert {change.applied for change in revalidate_saved_paths()} == {False}
+    finally:
+        done.set()
+        thread.join()
+    assert read_config_file()["mapdl"] == "/ansys_inc/v212/ansys/bin/ansys212"
@@ -0,0 +1,90 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ansys.tools.path import searchpath
+from ansys.tools.path.searchpath import find_on_path, get_path_executables
+from ansys.tools.path.testing import create_installation
+
+pytestmark = pytest.mark.linux
+
+
+@pytest.fixture
+def wrappers(tmp_path, monkeypatch):
+    searchpath.clear_path_listing_cache()
+    first = tmp_path / "wrappers"
+    second = tmp_path / "bin"
+    for directory, names in (
+        (first, ["ansys251", "lsdyna242"]),
+        (second, ["ansys251", "ansys232"]),
+    ):
+        directory.mkdir()
+        for name in names:
+            (directory / name).write_text("#!/bin/sh\n")
+            (directory / name).chmod(0o755)
+    (second / "ansys222").write_text("not executable")
+    (second / "unrelated").write_text("")
+    installation = create_installation(str(tmp_path / "ansys_inc"), 241)
+    os.symlink(installation.executables["mechanical"], second / "mechanical")
+    monkeypatch.setenv("PATH", os.pathsep.join([str(first), str(second), str(first)]))
+    return first, second
+
+
+def test_executables_in_path_order(wrappers):
+    first, second = wrappers
+    assert get_path_executables("mapdl") == {
+        251: str(first / "ansys251"),
+        232: str(second / "ansys232"),
+    }
+    assert get_path_executables("dyna") == {242: str(first / "lsdyna242")}
+
+
+def test_mechanical_version_from_real_path(wrappers):
+    _, second = wrappers
+    assert find_on_path("mechanical") == (str(second / "mechanical"), 24.1)
+
+
+def test_find_on_path(wrappers):
+    first, second = wrappers
+    assert find_on_path("mapdl") == (str(first / "ansys251"), 25.1)
+    assert find_on_path("mapdl", 23.2) == (str(second / "ansys232"), 23.2)
+    assert find_on_path("mapdl", 222) == ("", "")
+    assert find_on_path("dyna", search_path="") == ("", "")
+
+
+def test_listing_cached_by_mtime(wrappers):
+    first, _ = wrappers
+    with patch.object(searchpath.os, "scandir", wraps=os.scandir) as scandir:
+        get_path_executables("mapdl")
+        get_path_executables("dyna")
+        assert scandir.call_count == 2
+
+        (first / "ansys261").write_text("#!/bin/sh\n")
+        (first / "ansys261").chmod(0o755)
+        os.utime(first, ns=(0, 1))
+        assert 261 in get_path_executables("mapdl")
+        assert scandir.call_count == 3
@@ -0,0 +1,172 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import os
+import threading
+from unittest.mock import patch
+
+from ansys.tools.common.path import path as _common_path
+import pytest
+
+from ansys.tools.path import find_dyna, find_mapdl, staging
+from ansys.tools.path.preflight import clear_dependency_cache
+from ansys.tools.path.staging import STAGING_DIR_ENV, evict, required_files, stage_executable
+
+pytestmark = pytest.mark.linux
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache(monkeypatch):
+    monkeypatch.delenv("LD_LIBRARY_PATH", raising=False)
+    clear_dependency_cache()
+    yield
+    clear_dependency_cache()
+
+
+@pytest.fixture
+def installation(tmp_path, make_dynamic_elf):
+    root = tmp_path / "ansys_inc" / "v251"
+    bin_dir = root / "ansys" / "bin"
+    make_dynamic_elf(bin_dir / "linx64" / "ansys.e", ["libansys.so", "libc.so.6"])
+    make_dynamic_elf(root / "ansys" / "lib" / "linx64" / "libansys.so")
+    (bin_dir / "ansys251").write_text("#!/bin/sh\nexec $(dirname $0)/linx64/ansys.e\n")
+    (bin_dir / "ansys251").chmod(0o755)
+    (bin_dir / "lsdyna251").write_text("#!/bin/sh\n")
+    (bin_dir / "lsdyna251").chmod(0o755)
+    return root
+
+
+def test_required_files(installation):
+    root, files = required_files(str(installation / "ansys" / "bin" / "ansys251"))
+    assert root == str(installation)
+    assert [os.path.relpath(path, root) for path in files] == [
+        "ansys/bin/ansys251",
+        "ansys/bin/linx64/ansys.e",
+        "ansys/lib/linx64/libansys.so",
+    ]
+
+
+def test_stage(installation, tmp_path):
+    executable = str(installation / "ansys" / "bin" / "ansys251")
+    staging_dir = str(tmp_path / "staging")
+    with patch.object(staging.shutil, "copy2", wraps=staging.shutil.copy2) as copy:
+        staged = stage_executable(executable, staging_dir=staging_dir)
+        assert copy.call_count == 3
+        assert stage_executable(executable, staging_dir=staging_dir) == staged
+        assert copy.call_count == 3
+
+    assert staged.source == executable
+    assert staged.source_root == str(installation)
+    assert staged.path.startswith(staging_dir)
+    assert staged.path == os.path.join(staged.root, "ansys", "bin", "ansys251")
+    assert os.path.basename(staged.root) == "v251"
+    assert os.access(staged.path, os.X_OK)
+    assert staged.files == (
+        os.path.join("ansys", "bin", "ansys251"),
+        os.path.join("ansys", "bin", "linx64", "ansys.e"),
+        os.path.join("ansys", "lib", "linx64", "libansys.so"),
+    )
+    for name in staged.files:
+        assert os.path.isfile(os.path.join(staged.root, name))
+
+    # A changed source gives a new entry.
+    with open(installation / "ansys" / "lib" / "linx64" / "libansys.so", "ab") as f:
+        f.write(b"\0")
+    assert stage_executable(executable, staging_dir=staging_dir).root != staged.root
+
+
+def test_extra_files(installation, tmp_path):
+    (installation / "ansys" / "apdl" / "start").mkdir(parents=True)
+    (installation / "ansys" / "apdl" / "start" / "start.ans").write_text("")
+    (installation / "ansys" / "data.db").write_text("")
+    staged = stage_executable(
+        str(installation / "ansys" / "bin" / "lsdyna251"),
+        extra_files=["ansys/apdl", "ansys/*.db", "../outside"],
+        staging_dir=str(tmp_path / "staging"),
+    )
+    assert staged.files == (
+        os.path.join("ansys", "bin", "lsdyna251"),
+        os.path.join("ansys", "apdl", "start", "start.ans"),
+        os.path.join("ansys", "data.db"),
+    )
+
+
+def test_disabled_or_over_budget(installation, tmp_path, monkeypatch):
+    executable = str(installation / "ansys" / "bin" / "ansys251")
+    monkeypatch.delenv(STAGING_DIR_ENV, raising=False)
+    assert stage_executable(executable) is None
+    assert stage_executable(executable, staging_dir=str(tmp_path / "staging"), budget=10) is None
+    assert stage_executable("", staging_dir=str(tmp_path / "staging")) is None
+
+
+def test_lru_eviction(installation, tmp_path):
+    staging_dir = str(tmp_path / "staging")
+    mapdl = stage_executable(
+        str(installation / "ansys" / "bin" / "ansys251"), staging_dir=staging_dir
+    ).path
+    dyna = stage_executable(
+        str(installation / "ansys" / "bin" / "lsdyna251"), staging_dir=staging_dir
+    ).path
+    entries = sorted(os.listdir(staging_dir))
+    assert len(entries) == 2
+
+    # Using the MAPDL entry again makes the LS-DYNA one the least recently used.
+    mapdl_entry = os.path.relpath(mapdl, staging_dir).split(os.sep)[0]
+    dyna_entry = os.path.relpath(dyna, staging_dir).split(os.sep)[0]
+    os.utime(os.path.join(staging_dir, dyna_entry, staging.ENTRY_FILE_NAME), (1, 1))
+    assert evict(staging_dir, budget=os.path.getsize(mapdl) * 100) == []
+    mapdl_size = sum(
+        os.path.getsize(os.path.join(directory, name))
+        for directory, _, names in os.walk(os.path.join(staging_dir, mapdl_entry))
+        for name in names
+        if name != staging.ENTRY_FILE_NAME
+    )
+    assert evict(staging_dir, budget=mapdl_size) == [dyna_entry]
+    assert os.listdir(staging_dir) == [mapdl_entry]
+
+
+def test_populated_once_under_concurrency(installation, tmp_path):
+    executable = str(installation / "ansys" / "bin" / "ansys251")
+    staging_dir = str(tmp_path / "staging")
+    results = []
+    with patch.object(staging.shutil, "copy2", wraps=staging.shutil.copy2) as copy:
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(stage_executable(executable, staging_dir=staging_dir))
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert copy.call_count == 3
+    assert len(set(results)) == 1 and results[0] is not None
+
+
+def test_find_is_not_staged(installation, tmp_path, monkeypatch):
+    monkeypatch.setattr(_common_path, "LINUX_DEFAULT_DIRS", [str(installation.parent)])
+    monkeypatch.setenv(STAGING_DIR_ENV, str(tmp_path / "staging"))
+    assert find_mapdl() == (str(installation / "ansys" / "bin" / "ansys251"), 25.1)
+    assert find_dyna() == (str(installation / "ansys" / "bin" / "lsdyna251"), 25.1)
+    assert not os.path.exists(tmp_path / "staging")
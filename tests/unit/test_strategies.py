@@ -0,0 +1,102 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import pytest
+
+from ansys.tools.path import get_dyna_path, get_mapdl_path, save_mapdl_path
+from ansys.tools.path.config import get_config_file
+from ansys.tools.path.strategies import (
+    CallableStrategy,
+    StrategyChain,
+    get_default_strategies,
+    resolve_executable,
+    set_default_strategies,
+)
+from ansys.tools.path.testing import create_installation, create_installation_tree
+
+pytestmark = pytest.mark.linux
+
+
+@pytest.fixture(autouse=True)
+def default_strategies():
+    previous = get_default_strategies()
+    yield
+    set_default_strategies(previous)
+
+
+@pytest.fixture
+def installations(fs, monkeypatch):
+    fs.create_dir(get_config_file().parent)
+    create_installation_tree("/ansys_inc", versions=[231, 222])
+    create_installation("/apps", 241)
+    monkeypatch.setenv("AWP_ROOT241", "/apps/v241")
+    return fs
+
+
+def test_cost_order_and_early_exit(installations):
+    calls = []
+
+    def custom(product, version):
+        calls.append((product, version))
+        return None
+
+    chain = StrategyChain(["filesystem", CallableStrategy("custom", custom, cost=0.5), "config"])
+    assert chain.names == ["custom", "config", "filesystem"]
+
+    resolution = chain.resolve("mapdl", 22.2)
+    assert resolution.path == "/ansys_inc/v222/ansys/bin/ansys222"
+    assert resolution.strategy == "filesystem"
+    assert list(resolution.timings) == ["custom", "config", "filesystem"]
+    assert all(timing >= 0 for timing in resolution.timings.values())
+    assert calls == [("mapdl", 222)]
+
+    save_mapdl_path("/ansys_inc/v231/ansys/bin/ansys231", allow_prompt=False)
+    resolution = chain.resolve("mapdl")
+    assert (resolution.strategy, list(resolution.timings)) == ("config", ["custom", "config"])
+
+
+def test_env_strategy(installations):
+    resolution = resolve_executable("dyna", strategies=["env", "filesystem"])
+    assert (resolution.path, resolution.strategy) == ("/apps/v241/ansys/bin/lsdyna241", "env")
+    assert resolve_executable("dyna", 231, strategies=["env"]).path is None
+
+
+def test_max_cost_skips_expensive_strategies(installations):
+    resolution = resolve_executable("mapdl", strategies=["config", "filesystem"], max_cost=5)
+    assert resolution.path is None
+    assert list(resolution.timings) == ["config"]
+
+
+def test_global_default_used_by_get_path(installations):
+    assert get_mapdl_path(allow_input=False) == "/apps/v241/ansys/bin/ansys241"
+
+    set_default_strategies([CallableStrategy("site", lambda product, version: f"/site/{product}")])
+    assert get_default_strategies() == ["site"]
+    assert get_dyna_path(allow_input=False) == "/site/dyna"
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError, match="Unknown resolution strategy"):
+        resolve_executable("mapdl", strategies=["manifest"])
+    with pytest.raises(ValueError):
+        set_default_strategies(["config", "nothing"])
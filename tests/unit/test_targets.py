@@ -0,0 +1,120 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from unittest.mock import patch
+
+import pytest
+
+from ansys.tools.path import capabilities
+from ansys.tools.path.targets import (
+    SHARD_ENV,
+    get_executable_targets,
+    get_shard_spec,
+    shard,
+)
+from ansys.tools.path.testing import create_installation_tree
+
+pytestmark = pytest.mark.linux
+
+
+@pytest.fixture
+def tree(fs):
+    return create_installation_tree(
+        versions=[242, 251, 252], student_versions=[251], partial={242: ["mapdl"]}
+    )
+
+
+def test_targets(tree):
+    targets = get_executable_targets()
+    assert [target.id for target in targets] == [
+        "mapdl-252",
+        "mapdl-251",
+        "mapdl-242",
+        "mapdl-251-student",
+        "dyna-252",
+        "dyna-251",
+        "dyna-251-student",
+        "mechanical-252",
+        "mechanical-251",
+        "mechanical-251-student",
+    ]
+    assert targets[0].path == tree.expected_executable("mapdl", 252)
+    assert targets[0].installation == tree.installations[252].path
+    assert targets[0].version_float == 25.2
+    assert targets[3].student
+
+    assert [t.id for t in get_executable_targets(["dyna"], include_student=False)] == [
+        "dyna-252",
+        "dyna-251",
+    ]
+    with pytest.raises(ValueError):
+        get_executable_targets(["fluent"])
+
+
+def test_targets_computed_once(tree):
+    with patch.object(
+        capabilities, "build_capability_matrix", wraps=capabilities.build_capability_matrix
+    ) as build:
+        assert get_executable_targets() == get_executable_targets()
+    assert build.call_count == 1
+
+
+@pytest.mark.parametrize("stable", [False, True])
+@pytest.mark.parametrize("count", [1, 3, 4, 20])
+def test_shard_partitions_targets(tree, count, stable):
+    targets = get_executable_targets()
+    shards = [shard(targets, index, count, stable) for index in range(count)]
+    assigned = [target for part in shards for target in part]
+    assert sorted(assigned, key=targets.index) == list(targets)
+    assert shards == [shard(targets, index, count, stable) for index in range(count)]
+    if not stable:
+        assert max(map(len, shards)) - min(map(len, shards)) <= 1
+
+
+def test_stable_shard_keeps_assignment(tree):
+    targets = get_executable_targets()
+    before = {t.id: i for i in range(4) for t in shard(targets, i, 4, stable=True)}
+    after = {t.id: i for i in range(4) for t in shard(targets[1:], i, 4, stable=True)}
+    assert all(before[target_id] == index for target_id, index in after.items())
+
+
+def test_invalid_shard():
+    with pytest.raises(ValueError):
+        shard([], 4, 4)
+    with pytest.raises(ValueError):
+        shard([], 0, 0)
+
+
+def test_shard_spec(monkeypatch):
+    monkeypatch.delenv(SHARD_ENV, raising=False)
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    monkeypatch.delenv("PYTEST_XDIST_WORKER_COUNT", raising=False)
+    assert get_shard_spec() == (0, 1)
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw2")
+    monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "4")
+    assert get_shard_spec() == (2, 4)
+    monkeypatch.setenv(SHARD_ENV, "3/8")
+    assert get_shard_spec() == (2, 8)
+    monkeypatch.setenv(SHARD_ENV, "9/8")
+    with pytest.raises(ValueError):
+        get_shard_spec()
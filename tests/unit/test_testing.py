@@ -0,0 +1,112 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import os
+
+import pytest
+
+from ansys.tools.path import (
+    find_dyna,
+    find_mapdl,
+    find_mechanical,
+    get_available_ansys_installations,
+)
+from ansys.tools.path.discovery import _common_path
+from ansys.tools.path.testing import (
+    BROKEN_KINDS,
+    create_installation,
+    create_installation_tree,
+    synthetic_versions,
+)
+
+pytestmark = pytest.mark.linux
+
+
+def test_synthetic_versions():
+    assert synthetic_versions(4) == [252, 251, 242, 241]
+    many = synthetic_versions(100)
+    assert len(set(many)) == 100
+    assert all(ver % 10 for ver in many)
+    with pytest.raises(ValueError):
+        synthetic_versions(10000)
+
+
+def test_tree_on_fake_filesystem(fs):
+    tree = create_installation_tree(
+        "/ansys_inc",
+        versions=30,
+        student_versions=[252, 241],
+        partial={252: ["mapdl"]},
+        broken={251: ["dyna"]},
+    )
+    assert len(tree.installations) == 32
+    assert get_available_ansys_installations() == tree.expected_installations()
+    assert find_mapdl() == (tree.expected_executable("mapdl"), 25.2)
+    # The dangling LS-DYNA 25.1 executable is not reported.
+    assert find_dyna() == ("/ansys_inc/v242/ansys/bin/lsdyna242", 24.2)
+    assert find_dyna()[0] == tree.expected_executable("dyna")
+    assert tree.expected_executable("dyna", 242) == "/ansys_inc/v242/ansys/bin/lsdyna242"
+    assert tree.installations[-241].path == "/ansys_inc/ANSYS Student/v241"
+    assert os.path.islink(tree.installations[251].broken["dyna"])
+
+
+def test_tree_on_real_directory(tmp_path):
+    root = str(tmp_path / "ansys_inc")
+    alias = str(tmp_path / "opt" / "ansys_inc")
+    tree = create_installation_tree(
+        root,
+        versions=[231, 222],
+        broken={222: ["mapdl"]},
+        broken_kind="not-executable",
+        aliases=[alias],
+    )
+    mapdl = tree.installations[231].executables["mapdl"]
+    assert os.access(mapdl, os.X_OK)
+    assert not os.access(tree.installations[222].broken["mapdl"], os.X_OK)
+    assert os.path.realpath(alias) == os.path.realpath(root)
+    assert os.path.isfile(os.path.join(alias, "v231", "ansys", "bin", "ansys231"))
+
+
+def test_installation_build_info(fs):
+    installation = create_installation("/ansys_inc", 241, products=["dyna"])
+    assert installation.executables == {"dyna": "/ansys_inc/v241/ansys/bin/lsdyna241"}
+    with open(os.path.join(installation.path, "builddate.txt")) as f:
+        assert "2024 R1" in f.read()
+    assert find_dyna() == ("/ansys_inc/v241/ansys/bin/lsdyna241", 24.1)
+
+
+@pytest.mark.parametrize("broken_kind", BROKEN_KINDS)
+def test_broken_executables_match_expectation(tmp_path, monkeypatch, broken_kind):
+    root = str(tmp_path / "ansys_inc")
+    monkeypatch.setattr(_common_path, "LINUX_DEFAULT_DIRS", [root])
+    tree = create_installation_tree(
+        root,
+        versions=[241, 232],
+        broken={241: ["mapdl", "dyna", "mechanical"], 232: ["dyna"]},
+        broken_kind=broken_kind,
+    )
+    finders = {"mapdl": find_mapdl, "dyna": find_dyna, "mechanical": find_mechanical}
+    for product, find in finders.items():
+        assert (find()[0] or None) == tree.expected_executable(product)
+        for version in tree.installations:
+            assert (find(version / 10)[0] or None) == tree.expected_executable(product, version)
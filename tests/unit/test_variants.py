@@ -0,0 +1,120 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import pytest
+
+from ansys.tools.path import find_dyna, find_dyna_variant
+from ansys.tools.path.capabilities import _matrix_from_data, _matrix_to_data, get_capability_matrix
+from ansys.tools.path.variants import DynaVariant, parse_dyna_variant, select_dyna_variant
+
+pytestmark = pytest.mark.linux
+
+LINX64 = "/ansys_inc/v251/ansys/bin/linx64"
+
+
+@pytest.fixture
+def dyna_variants(fs):
+    fs.create_file("/ansys_inc/v251/ansys/bin/lsdyna251")
+    for name in (
+        "lsdyna_sp.e",
+        "lsdyna_dp.e",
+        "lsdyna_sp_mpp.e",
+        "lsdyna_dp_mpp.e",
+        "lsdyna_dp_mpp_openmpi.e",
+        "lsdyna_sp.so",
+    ):
+        fs.create_file(f"{LINX64}/{name}")
+    # Older installation without variants.
+    fs.create_file("/ansys_inc/v242/ansys/bin/lsdyna242")
+    return fs
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("lsdyna_sp.e", ("smp", "single", None)),
+        ("lsdyna_dp_mpp.e", ("mpp", "double", None)),
+        ("lsdyna_mpp_sp_impi.exe", ("mpp", "single", "intelmpi")),
+        ("LSDYNA_MPP_DP_MSMPI.EXE", ("mpp", "double", "msmpi")),
+        ("ls-dyna_smp_d_R13_1_0_x64_centos79_ifort190", ("smp", "double", None)),
+        ("ls-dyna_mpp_s_R13_1_0_x64_centos79_ifort190_openmpi-4", ("mpp", "single", "openmpi")),
+    ],
+)
+def test_parse(name, expected):
+    variant = parse_dyna_variant(f"/bin/{name}")
+    assert (variant.mode, variant.precision, variant.mpi) == expected
+    assert variant.name == name
+
+
+@pytest.mark.parametrize("name", ["lsdyna251", "lsdyna_sp.so", "lsdyna_mpp.e", "ansys251"])
+def test_parse_not_a_variant(name):
+    assert parse_dyna_variant(f"/bin/{name}") is None
+
+
+def test_select():
+    variants = [
+        DynaVariant("/sp", "smp", "single"),
+        DynaVariant("/dp", "smp", "double"),
+        DynaVariant("/dp_mpp_ompi", "mpp", "double", "openmpi"),
+        DynaVariant("/dp_mpp_impi", "mpp", "double", "intelmpi"),
+    ]
+    assert select_dyna_variant(variants).path == "/sp"
+    assert select_dyna_variant(variants, precision="double").path == "/dp"
+    assert select_dyna_variant(variants, cores=4).path == "/sp"
+    # Many cores or several nodes prefer MPP, whatever the precision.
+    assert select_dyna_variant(variants, cores=64).path == "/dp_mpp_impi"
+    assert select_dyna_variant(variants, cores=2, nodes=2).path == "/dp_mpp_impi"
+    assert select_dyna_variant(variants, mpi="ompi").path == "/dp_mpp_ompi"
+    assert select_dyna_variant(variants, nodes=2, precision="single") is None
+    with pytest.raises(ValueError):
+        select_dyna_variant(variants, cores=0)
+    with pytest.raises(ValueError):
+        select_dyna_variant(variants, precision="half")
+
+
+def test_variants_indexed(dyna_variants):
+    matrix = get_capability_matrix()
+    names = [variant.name for variant in matrix.installations[251].dyna_variants]
+    assert names == [
+        "lsdyna_dp.e",
+        "lsdyna_dp_mpp.e",
+        "lsdyna_dp_mpp_openmpi.e",
+        "lsdyna_sp.e",
+        "lsdyna_sp_mpp.e",
+    ]
+    assert matrix.installations[242].dyna_variants == ()
+    assert _matrix_from_data(_matrix_to_data(matrix)) == matrix
+    # The launcher is still what find_dyna returns.
+    assert find_dyna() == ("/ansys_inc/v251/ansys/bin/lsdyna251", 25.1)
+
+
+def test_find_dyna_variant(dyna_variants):
+    assert find_dyna_variant().path == f"{LINX64}/lsdyna_sp.e"
+    assert find_dyna_variant(cores=16, precision="single").path == f"{LINX64}/lsdyna_sp_mpp.e"
+    # Builds for a known MPI library come before those for an unknown one.
+    assert (
+        find_dyna_variant(nodes=4, precision="double").path == f"{LINX64}/lsdyna_dp_mpp_openmpi.e"
+    )
+    assert find_dyna_variant(24.2) is None
+    with pytest.raises(ValueError):
+        find_dyna_variant(23.1)
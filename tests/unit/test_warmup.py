@@ -0,0 +1,94 @@
+# Copyright (C) 2023 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from ansys.tools.path import capabilities, find_mapdl, warm_up
+from ansys.tools.path.discovery import _common_path
+from ansys.tools.path.testing import create_installation_tree
+from ansys.tools.path.warmup import WARM_UP_ENV, wait_for_warm_up, warm_up_requested
+
+pytestmark = pytest.mark.linux
+
+
+@pytest.fixture
+def installations(tmp_path, monkeypatch):
+    root = tmp_path / "ansys_inc"
+    create_installation_tree(str(root), versions=[231, 222])
+    monkeypatch.setattr(_common_path, "LINUX_DEFAULT_DIRS", [str(root)])
+    monkeypatch.setattr(_common_path, "SETTINGS_DIR", str(tmp_path / "settings"))
+    monkeypatch.setattr(_common_path, "CONFIG_FILE", str(tmp_path / "settings" / "config.txt"))
+    return root
+
+
+def test_later_calls_join_the_warm_up(installations):
+    started = threading.Event()
+    build = capabilities.build_capability_matrix
+
+    def slow_build(*args, **kwargs):
+        started.set()
+        time.sleep(0.2)
+        return build(*args, **kwargs)
+
+    with patch.object(capabilities, "build_capability_matrix", side_effect=slow_build) as mock:
+        thread = warm_up()
+        assert thread.daemon
+        assert warm_up() is thread
+        assert started.wait(10)
+        assert find_mapdl() == (str(installations / "v231" / "ansys" / "bin" / "ansys231"), 23.1)
+        assert wait_for_warm_up(10)
+        assert mock.call_count == 1
+
+
+def test_warm_up_requested(monkeypatch):
+    for value, requested in (("", False), ("0", False), ("false", False), ("1", True)):
+        monkeypatch.setenv(WARM_UP_ENV, value)
+        assert warm_up_requested() is requested
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_warm_up_at_import(enabled):
+    env = dict(os.environ)
+    env.pop(WARM_UP_ENV, None)
+    if enabled:
+        env[WARM_UP_ENV] = "1"
+    code = (
+        "import threading, ansys.tools.path; "
+        "print([t.name for t in threading.enumerate()]); "
+        "ansys.tools.path.warmup.wait_for_warm_up(30)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert ("ansys-tools-path-warm-up" in output) is enabled